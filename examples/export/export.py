@@ -0,0 +1,171 @@
+"""
+Read a project export from Sentinel for offline analysis.
+
+The server streams the runs, chats, tool calls and supervisions of a project as
+newline delimited JSON from GET /project/{project_id}/export. The helpers below
+read that stream lazily, so an export of any size can be processed record by
+record or collected into one pyarrow table per record type.
+
+Example:
+    python export.py --project-id <uuid> --out ./export
+"""
+
+import argparse
+import json
+import os
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional
+
+import requests
+
+
+def iter_records(
+    project_id: str,
+    base_url: str = "http://localhost:8080/api/v1",
+    task_id: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    chunk_size: int = 1024 * 1024,
+) -> Iterator[Dict]:
+    """
+    Stream the export records of a project.
+
+    Args:
+        project_id (str): Project to export
+        base_url (str): Sentinel API URL
+        task_id (str): Only export runs of this task
+        start (str): Only export runs created at or after this RFC 3339 time
+        end (str): Only export runs created before this RFC 3339 time
+        chunk_size (int): Number of bytes read from the response at a time
+
+    Yields:
+        Dict: One export record, see the ExportRecord schema in openapi.yaml
+
+    Raises:
+        requests.exceptions.ChunkedEncodingError: The server failed part way through
+            the export and aborted the response, so the records read so far are incomplete
+    """
+    params = {"task_id": task_id, "from": start, "to": end}
+    params = {k: v for k, v in params.items() if v is not None}
+
+    with requests.get(
+        f"{base_url}/project/{project_id}/export",
+        params=params,
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines(chunk_size=chunk_size):
+            if line:
+                yield json.loads(line)
+
+
+# The fields of each record type, see the ExportRecord schema in openapi.yaml.
+# Optional fields are left out of a record when they are not set, e.g. the
+# decision and reasoning of a pending supervision.
+RECORD_FIELDS = {
+    "run": [("status", "string"), ("result", "string")],
+    "chat": [("request_data", "string"), ("response_data", "string")],
+    "tool_call": [("tool_name", "string"), ("call_id", "string"), ("arguments", "string")],
+    "supervision": [
+        ("tool_call_id", "string"),
+        ("supervisor_id", "string"),
+        ("supervisor_name", "string"),
+        ("supervisor_type", "string"),
+        ("position_in_chain", "int64"),
+        ("decision", "string"),
+        ("reasoning", "string"),
+    ],
+}
+
+
+def record_schema(record_type: str) -> "pyarrow.Schema":
+    """
+    Return the pyarrow schema of a record type.
+
+    Args:
+        record_type (str): One of the keys of RECORD_FIELDS
+
+    Returns:
+        pyarrow.Schema: The common fields followed by those of the record type
+    """
+    import pyarrow as pa
+
+    fields = [
+        ("type", "string"),
+        ("id", "string"),
+        ("run_id", "string"),
+        ("task_id", "string"),
+        ("created_at", "string"),
+    ] + RECORD_FIELDS[record_type]
+    return pa.schema([(name, pa.type_for_alias(alias)) for name, alias in fields])
+
+
+def to_tables(records: Iterator[Dict], batch_size: int = 10_000) -> Dict[str, "pyarrow.Table"]:
+    """
+    Collect export records into one pyarrow table per record type.
+
+    Records are converted to record batches every batch_size rows, so the Python
+    objects of at most one batch per type are held in memory at a time. Every
+    batch of a type has the schema of that type, so a field that is missing from
+    some records is null there rather than dropped from the batch.
+
+    Args:
+        records (Iterator[Dict]): Records as returned by iter_records
+        batch_size (int): Number of rows per record batch
+
+    Returns:
+        Dict[str, pyarrow.Table]: Tables keyed by record type
+    """
+    import pyarrow as pa
+
+    pending: Dict[str, List[Dict]] = defaultdict(list)
+    batches: Dict[str, List["pa.RecordBatch"]] = defaultdict(list)
+
+    for record in records:
+        rows = pending[record["type"]]
+        rows.append(record)
+        if len(rows) >= batch_size:
+            schema = record_schema(record["type"])
+            batches[record["type"]].append(pa.RecordBatch.from_pylist(rows, schema=schema))
+            rows.clear()
+
+    for record_type, rows in pending.items():
+        if rows:
+            schema = record_schema(record_type)
+            batches[record_type].append(pa.RecordBatch.from_pylist(rows, schema=schema))
+
+    return {
+        record_type: pa.Table.from_batches(type_batches)
+        for record_type, type_batches in batches.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a Sentinel project to Parquet")
+    parser.add_argument("--project-id", required=True)
+    parser.add_argument("--base-url", default="http://localhost:8080/api/v1")
+    parser.add_argument("--task-id")
+    parser.add_argument("--from", dest="start")
+    parser.add_argument("--to", dest="end")
+    parser.add_argument("--out", default="export")
+    args = parser.parse_args()
+
+    import pyarrow.parquet as pq
+
+    records = iter_records(
+        args.project_id,
+        base_url=args.base_url,
+        task_id=args.task_id,
+        start=args.start,
+        end=args.end,
+    )
+
+    os.makedirs(args.out, exist_ok=True)
+    for record_type, table in to_tables(records).items():
+        path = os.path.join(args.out, f"{record_type}.parquet")
+        pq.write_table(table, path)
+        print(f"Wrote {table.num_rows} {record_type} records to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -86,6 +86,14 @@ func (s Server) GetProject(w http.ResponseWriter, r *http.Request, id uuid.UUID)
 	apiGetProjectHandler(w, r, id, s.Store)
 }
 
+func (s Server) ExportProject(w http.ResponseWriter, r *http.Request, id uuid.UUID, params ExportProjectParams) {
+	apiExportProjectHandler(w, r, id, params, s.Store)
+}
+
+func (s Server) SearchProject(w http.ResponseWriter, r *http.Request, id uuid.UUID, params SearchProjectParams) {
+	apiSearchProjectHandler(w, r, id, params, s.Store)
+}
+
 func (s Server) CreateTask(w http.ResponseWriter, r *http.Request, projectId uuid.UUID) {
 	apiCreateTaskHandler(w, r, projectId, s.Store)
 }
@@ -94,6 +102,10 @@ func (s Server) CreateRun(w http.ResponseWriter, r *http.Request, taskId uuid.UU
 	apiCreateRunHandler(w, r, taskId, s.Store)
 }
 
+func (s Server) RegisterRuns(w http.ResponseWriter, r *http.Request) {
+	apiRegisterRunsHandler(w, r, s.Store)
+}
+
 func (s Server) GetProjectTasks(w http.ResponseWriter, r *http.Request, id uuid.UUID) {
 	apiGetProjectTasksHandler(w, r, id, s.Store)
 }
@@ -1,18 +1,82 @@
 package main
 
 import (
+	"context"
+	"flag"
 	"log"
+	"os"
+	"strconv"
+	"time"
 
 	asteroid "github.com/asteroidai/asteroid/server"
 	database "github.com/asteroidai/asteroid/server/db"
 )
 
 func main() {
+	storeType := flag.String("store", "postgres", "storage backend, postgres or sqlite")
+	sqlitePath := flag.String("sqlite-path", "sentinel.db", "database file used by the sqlite store")
+	flag.Parse()
+
+	switch *storeType {
+	case "postgres":
+		db := openPostgresqlStore()
+		defer db.Close()
+		asteroid.InitAPI(db)
+	case "sqlite":
+		// Embedded single node store for local use, needs no external services
+		db, err := database.NewSqliteStore(*sqlitePath)
+		if err != nil {
+			log.Fatalf("Failed to open the database: %v", err)
+		}
+		defer db.Close()
+		asteroid.InitAPI(db)
+	default:
+		log.Fatalf("Unknown store %q, expected postgres or sqlite", *storeType)
+	}
+}
+
+// openPostgresqlStore connects to Postgres and starts the partition and archive
+// maintenance of its tables
+func openPostgresqlStore() *database.PostgresqlStore {
 	db, err := database.NewPostgresqlStore()
 	if err != nil {
 		log.Fatalf("Failed to connect to the database: %v", err)
 	}
-	defer db.Close()
 
-	asteroid.InitAPI(db)
+	// Partitions for the current month must exist before the first write, otherwise
+	// rows land in the default partition and block creating the monthly one.
+	if err := db.EnsurePartitions(context.Background(), time.Now(), 2); err != nil {
+		log.Fatalf("Failed to create table partitions: %v", err)
+	}
+
+	archiver := database.NewArchiver(db, archiveDir(), archiveRetention())
+	go archiver.Start(context.Background())
+
+	return db
+}
+
+// archiveDir returns the directory archived runs are written to
+func archiveDir() string {
+	dir := os.Getenv("ARCHIVE_DIR")
+	if dir == "" {
+		return "archive"
+	}
+	return dir
+}
+
+// archiveRetention returns how long closed runs, and pending runs without new
+// chats, are kept in the database before being archived. Archival is disabled
+// when ARCHIVE_AFTER_DAYS is unset.
+func archiveRetention() time.Duration {
+	days := os.Getenv("ARCHIVE_AFTER_DAYS")
+	if days == "" {
+		return 0
+	}
+
+	n, err := strconv.Atoi(days)
+	if err != nil || n < 0 {
+		log.Fatalf("Invalid ARCHIVE_AFTER_DAYS %q, expected a number of days", days)
+	}
+
+	return time.Duration(n) * 24 * time.Hour
 }
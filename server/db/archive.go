@@ -0,0 +1,565 @@
+package database
+
+import (
+	"bufio"
+	"compress/gzip"
+	"context"
+	"database/sql"
+	"encoding/json"
+	"errors"
+	"fmt"
+	"io"
+	"log"
+	"os"
+	"path/filepath"
+	"time"
+
+	asteroid "github.com/asteroidai/asteroid/server"
+	"github.com/google/uuid"
+	"github.com/lib/pq"
+)
+
+// ArchivedChat is a single line of an archive segment. Segments are gzipped
+// JSONL files holding the chats of one run, newest first. run_archive records
+// the ID and byte offset of every line.
+type ArchivedChat struct {
+	Id           uuid.UUID        `json:"id"`
+	CreatedAt    time.Time        `json:"created_at"`
+	Format       string           `json:"format"`
+	RequestData  json.RawMessage  `json:"request_data"`
+	ResponseData json.RawMessage  `json:"response_data"`
+	Choices      []ArchivedChoice `json:"choices"`
+}
+
+type ArchivedChoice struct {
+	Id         uuid.UUID         `json:"id"`
+	ChoiceData json.RawMessage   `json:"choice_data"`
+	Messages   []ArchivedMessage `json:"messages"`
+}
+
+type ArchivedMessage struct {
+	Id        uuid.UUID          `json:"id"`
+	MsgData   json.RawMessage    `json:"msg_data"`
+	ToolCalls []ArchivedToolCall `json:"tool_calls"`
+}
+
+type ArchivedToolCall struct {
+	Id           uuid.UUID       `json:"id"`
+	CallId       string          `json:"call_id"`
+	ToolId       *uuid.UUID      `json:"tool_id"`
+	ToolCallData json.RawMessage `json:"tool_call_data"`
+}
+
+// Archiver keeps the partitioned tables maintained: it creates upcoming monthly
+// partitions, exports closed or abandoned runs older than the retention period
+// to segments in dir and detaches partitions once all of their runs have been
+// archived.
+type Archiver struct {
+	store       *PostgresqlStore
+	dir         string
+	retention   time.Duration
+	monthsAhead int
+	interval    time.Duration
+}
+
+// NewArchiver creates an archiver. A zero retention disables archival, the
+// archiver then only creates partitions.
+func NewArchiver(store *PostgresqlStore, dir string, retention time.Duration) *Archiver {
+	return &Archiver{
+		store:       store,
+		dir:         dir,
+		retention:   retention,
+		monthsAhead: 2,
+		interval:    time.Hour,
+	}
+}
+
+func (a *Archiver) Start(ctx context.Context) {
+	ticker := time.NewTicker(a.interval)
+	defer ticker.Stop()
+
+	for {
+		if err := a.runOnce(ctx, time.Now()); err != nil {
+			log.Printf("Error running archiver: %v", err)
+		}
+
+		select {
+		case <-ctx.Done():
+			return
+		case <-ticker.C:
+		}
+	}
+}
+
+func (a *Archiver) runOnce(ctx context.Context, now time.Time) error {
+	if err := a.store.EnsurePartitions(ctx, now, a.monthsAhead); err != nil {
+		return fmt.Errorf("error ensuring partitions: %w", err)
+	}
+
+	if a.retention <= 0 {
+		return nil
+	}
+
+	cutoff := now.Add(-a.retention)
+
+	archived, err := a.store.ArchiveRuns(ctx, a.dir, cutoff)
+	if err != nil {
+		return fmt.Errorf("error archiving runs: %w", err)
+	}
+	if archived > 0 {
+		log.Printf("Archived %d runs to %s", archived, a.dir)
+	}
+
+	if _, err := a.store.DetachArchivedPartitions(ctx, cutoff); err != nil {
+		return fmt.Errorf("error detaching partitions: %w", err)
+	}
+
+	return nil
+}
+
+// ArchiveRuns exports every run created before cutoff that has not been archived
+// yet, or whose archive is stale, to a segment in dir, and records it in
+// run_archive. Completed and failed runs are archived as is. Runs that are
+// still pending are archived once they have had no chat since cutoff, as a run
+// whose client crashed before updating its status would otherwise keep its
+// month from ever being detached. It returns the number of runs archived.
+func (s *PostgresqlStore) ArchiveRuns(ctx context.Context, dir string, cutoff time.Time) (int, error) {
+	query := `
+		SELECT r.id
+		FROM run r
+		LEFT JOIN run_archive ra ON ra.run_id = r.id
+		WHERE (ra.run_id IS NULL OR ra.stale)
+		AND r.created_at < $3
+		AND (
+			r.status IN ($1, $2)
+			OR NOT EXISTS (
+				SELECT 1
+				FROM chat c
+				WHERE c.run_id = r.id AND c.created_at >= $3
+			)
+		)`
+
+	rows, err := s.db.QueryContext(ctx, query, asteroid.Completed, asteroid.Failed, cutoff)
+	if err != nil {
+		return 0, fmt.Errorf("error getting runs to archive: %w", err)
+	}
+
+	runIds := make([]uuid.UUID, 0)
+	for rows.Next() {
+		var id uuid.UUID
+		if err := rows.Scan(&id); err != nil {
+			rows.Close()
+			return 0, fmt.Errorf("error scanning run ID: %w", err)
+		}
+		runIds = append(runIds, id)
+	}
+	rows.Close()
+
+	for i, runId := range runIds {
+		if err := s.archiveRun(ctx, dir, runId); err != nil {
+			return i, fmt.Errorf("error archiving run %s: %w", runId, err)
+		}
+	}
+
+	return len(runIds), nil
+}
+
+// archiveRun writes the chats of a run to a new segment and records it in
+// run_archive. If the run was archived before and has had chats since, the new
+// segment holds those chats followed by the previous segment, which is then
+// removed.
+//
+// The run row is locked for update while the segment is written. That lock
+// conflicts with the one the chat foreign key takes, so CreateChatRequest
+// either commits its chat before the chats are read here, or waits for this
+// transaction and then marks the new archive stale.
+func (s *PostgresqlStore) archiveRun(ctx context.Context, dir string, runId uuid.UUID) error {
+	tx, err := s.db.BeginTx(ctx, nil)
+	if err != nil {
+		return fmt.Errorf("error starting transaction: %w", err)
+	}
+	defer func() { _ = tx.Rollback() }()
+
+	if _, err := tx.ExecContext(ctx, `SELECT 1 FROM run WHERE id = $1 FOR UPDATE`, runId); err != nil {
+		return fmt.Errorf("error locking run: %w", err)
+	}
+
+	var previous string
+	previousIds := make([]string, 0)
+	previousOffsets := make([]int64, 0)
+	query := `
+		SELECT segment, chat_ids, chat_offsets
+		FROM run_archive
+		WHERE run_id = $1`
+
+	err = tx.QueryRowContext(ctx, query, runId).Scan(&previous, pq.Array(&previousIds), pq.Array(&previousOffsets))
+	if err != nil && !errors.Is(err, sql.ErrNoRows) {
+		return fmt.Errorf("error getting run archive: %w", err)
+	}
+
+	name := fmt.Sprintf("%s-%d.jsonl.gz", runId, time.Now().UnixNano())
+	segment := filepath.Join(dir, runId.String()[:2], name)
+	w, err := createSegment(segment)
+	if err != nil {
+		return err
+	}
+	defer w.abort()
+
+	if err := writeRunChats(ctx, tx, w, runId, previousIds); err != nil {
+		return err
+	}
+
+	if previous != "" {
+		if err := w.copySegment(previous, previousIds, previousOffsets); err != nil {
+			return fmt.Errorf("error copying segment %s: %w", previous, err)
+		}
+	}
+
+	if err := w.commit(); err != nil {
+		return fmt.Errorf("error writing segment: %w", err)
+	}
+
+	// archived_at is read from the clock rather than the transaction start, so
+	// that it is not older than any chat that committed while the lock was awaited
+	query = `
+		INSERT INTO run_archive (run_id, segment, chat_count, chat_ids, chat_offsets, stale, archived_at)
+		VALUES ($1, $2, $3, $4, $5, false, clock_timestamp())
+		ON CONFLICT (run_id) DO UPDATE SET
+			segment = EXCLUDED.segment,
+			chat_count = EXCLUDED.chat_count,
+			chat_ids = EXCLUDED.chat_ids,
+			chat_offsets = EXCLUDED.chat_offsets,
+			stale = false,
+			archived_at = EXCLUDED.archived_at`
+
+	_, err = tx.ExecContext(ctx, query, runId, segment, len(w.ids), pq.Array(w.ids), pq.Array(w.offsets))
+	if err != nil {
+		return fmt.Errorf("error recording run archive: %w", err)
+	}
+
+	if err := tx.Commit(); err != nil {
+		return fmt.Errorf("error committing transaction: %w", err)
+	}
+
+	if previous != "" {
+		if err := os.Remove(previous); err != nil {
+			log.Printf("Error removing replaced segment %s: %v", previous, err)
+		}
+	}
+
+	return nil
+}
+
+// writeRunChats streams the chats of a run that are not in archivedIds, newest
+// first, to w. Each row holds one whole chat with its choices, messages and
+// tool calls aggregated in the query, so a run is archived in a single round
+// trip and only one chat is held in memory at a time.
+func writeRunChats(ctx context.Context, tx *sql.Tx, w *segmentWriter, runId uuid.UUID, archivedIds []string) error {
+	query := `
+		SELECT c.id, c.created_at, c.format, c.request_data, c.response_data,
+			COALESCE((
+				SELECT json_agg(json_build_object(
+					'id', ch.id,
+					'choice_data', ch.choice_data,
+					'messages', COALESCE((
+						SELECT json_agg(json_build_object(
+							'id', m.id,
+							'msg_data', m.msg_data,
+							'tool_calls', COALESCE((
+								SELECT json_agg(json_build_object(
+									'id', tc.id,
+									'call_id', tc.call_id,
+									'tool_id', tc.tool_id,
+									'tool_call_data', tc.tool_call_data
+								))
+								FROM toolcall tc
+								WHERE tc.msg_id = m.id
+							), '[]')
+						) ORDER BY m.created_at ASC)
+						FROM msg m
+						WHERE m.choice_id = ch.id
+					), '[]')
+				) ORDER BY ch.id)
+				FROM choice ch
+				WHERE ch.chat_id = c.id
+			), '[]')
+		FROM chat c
+		WHERE c.run_id = $1 AND NOT (c.id = ANY($2::uuid[]))
+		ORDER BY c.created_at DESC`
+
+	rows, err := tx.QueryContext(ctx, query, runId, pq.Array(archivedIds))
+	if err != nil {
+		return fmt.Errorf("error getting chats: %w", err)
+	}
+	defer rows.Close()
+
+	for rows.Next() {
+		var chat ArchivedChat
+		var requestData, responseData, choices []byte
+		if err := rows.Scan(&chat.Id, &chat.CreatedAt, &chat.Format, &requestData, &responseData, &choices); err != nil {
+			return fmt.Errorf("error scanning chat: %w", err)
+		}
+		chat.RequestData = requestData
+		chat.ResponseData = responseData
+		if err := json.Unmarshal(choices, &chat.Choices); err != nil {
+			return fmt.Errorf("error decoding choices of chat %s: %w", chat.Id, err)
+		}
+
+		if err := w.write(chat); err != nil {
+			return fmt.Errorf("error writing chat %s: %w", chat.Id, err)
+		}
+	}
+	if err := rows.Err(); err != nil {
+		return fmt.Errorf("error getting chats: %w", err)
+	}
+
+	return nil
+}
+
+// segmentWriter writes a segment. Every chat is compressed as a gzip member of
+// its own and its byte offset is recorded, so that readSegmentChat can seek
+// straight to it. The members concatenate to a regular gzipped JSONL file.
+// The segment is written to a temporary file first so that a crash never
+// leaves a truncated segment behind.
+type segmentWriter struct {
+	path    string
+	f       *os.File
+	buf     *bufio.Writer
+	written int64
+	ids     []string
+	offsets []int64
+}
+
+func createSegment(path string) (*segmentWriter, error) {
+	if err := os.MkdirAll(filepath.Dir(path), 0o755); err != nil {
+		return nil, fmt.Errorf("error creating segment directory: %w", err)
+	}
+
+	f, err := os.Create(path + ".tmp")
+	if err != nil {
+		return nil, fmt.Errorf("error creating segment: %w", err)
+	}
+
+	return &segmentWriter{
+		path:    path,
+		f:       f,
+		buf:     bufio.NewWriter(f),
+		ids:     make([]string, 0),
+		offsets: make([]int64, 0),
+	}, nil
+}
+
+func (w *segmentWriter) Write(p []byte) (int, error) {
+	n, err := w.buf.Write(p)
+	w.written += int64(n)
+	return n, err
+}
+
+func (w *segmentWriter) write(chat ArchivedChat) error {
+	w.ids = append(w.ids, chat.Id.String())
+	w.offsets = append(w.offsets, w.written)
+
+	gz := gzip.NewWriter(w)
+	if err := json.NewEncoder(gz).Encode(chat); err != nil {
+		return fmt.Errorf("error encoding chat: %w", err)
+	}
+	if err := gz.Close(); err != nil {
+		return fmt.Errorf("error compressing chat: %w", err)
+	}
+
+	return nil
+}
+
+// copySegment appends the segment at path, whose chats have ids and offsets
+func (w *segmentWriter) copySegment(path string, ids []string, offsets []int64) error {
+	f, err := os.Open(path)
+	if err != nil {
+		return fmt.Errorf("error opening segment: %w", err)
+	}
+	defer f.Close()
+
+	start := w.written
+	if _, err := io.Copy(w, f); err != nil {
+		return fmt.Errorf("error reading segment: %w", err)
+	}
+
+	w.ids = append(w.ids, ids...)
+	for _, offset := range offsets {
+		w.offsets = append(w.offsets, start+offset)
+	}
+
+	return nil
+}
+
+// commit flushes the segment to disk and moves it into place
+func (w *segmentWriter) commit() error {
+	if err := w.buf.Flush(); err != nil {
+		return fmt.Errorf("error flushing segment: %w", err)
+	}
+	if err := w.f.Sync(); err != nil {
+		return fmt.Errorf("error syncing segment: %w", err)
+	}
+	if err := w.f.Close(); err != nil {
+		return fmt.Errorf("error closing segment: %w", err)
+	}
+
+	return os.Rename(w.f.Name(), w.path)
+}
+
+// abort removes the temporary file of a segment that was not committed
+func (w *segmentWriter) abort() {
+	_ = w.f.Close()
+	_ = os.Remove(w.f.Name())
+}
+
+// readSegmentChat returns the chat stored at offset in the segment at path
+func readSegmentChat(path string, offset int64) (*ArchivedChat, error) {
+	var chat *ArchivedChat
+	err := forEachSegmentChat(path, []int64{offset}, func(c *ArchivedChat) error {
+		chat = c
+		return nil
+	})
+	return chat, err
+}
+
+// forEachSegmentChat calls fn with the chat stored at each of offsets in the
+// segment at path, in the order of offsets
+func forEachSegmentChat(path string, offsets []int64, fn func(*ArchivedChat) error) error {
+	f, err := os.Open(path)
+	if err != nil {
+		return fmt.Errorf("error opening segment: %w", err)
+	}
+	defer f.Close()
+
+	for _, offset := range offsets {
+		if _, err := f.Seek(offset, io.SeekStart); err != nil {
+			return fmt.Errorf("error seeking segment: %w", err)
+		}
+
+		gz, err := gzip.NewReader(bufio.NewReader(f))
+		if err != nil {
+			return fmt.Errorf("error reading segment: %w", err)
+		}
+		// Only read the member holding this chat
+		gz.Multistream(false)
+
+		var chat ArchivedChat
+		if err := json.NewDecoder(gz).Decode(&chat); err != nil {
+			return fmt.Errorf("error decoding archived chat: %w", err)
+		}
+		if err := fn(&chat); err != nil {
+			return err
+		}
+	}
+
+	return nil
+}
+
+// runArchive is the run_archive row of a run. An archive is stale when chats
+// have been written to the run since it was archived, those chats are only in
+// the chat table until the run is archived again.
+type runArchive struct {
+	segment   string
+	chatCount int
+	stale     bool
+}
+
+// getRunArchive returns the archive of a run, or nil if it has not been archived
+func (s *PostgresqlStore) getRunArchive(ctx context.Context, runId uuid.UUID) (*runArchive, error) {
+	query := `
+		SELECT segment, chat_count, stale
+		FROM run_archive
+		WHERE run_id = $1`
+
+	var archive runArchive
+	err := s.db.QueryRowContext(ctx, query, runId).Scan(&archive.segment, &archive.chatCount, &archive.stale)
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("error getting run archive: %w", err)
+	}
+
+	return &archive, nil
+}
+
+// getArchivedChat returns the request and response of the chat at index of an
+// archived run. Chats written since the run was archived are newer than the
+// ones in its segment, so they come first.
+func (s *PostgresqlStore) getArchivedChat(ctx context.Context, runId uuid.UUID, archive *runArchive, index int) ([]byte, []byte, error) {
+	if archive.stale {
+		query := `
+			SELECT c.request_data, c.response_data
+			FROM chat c
+			JOIN run_archive ra ON ra.run_id = c.run_id
+			WHERE c.run_id = $1 AND NOT (c.id = ANY(ra.chat_ids))
+			ORDER BY c.created_at DESC
+			LIMIT 1 OFFSET $2`
+
+		var requestData, responseData []byte
+		err := s.db.QueryRowContext(ctx, query, runId, index).Scan(&requestData, &responseData)
+		if err == nil {
+			return requestData, responseData, nil
+		}
+		if !errors.Is(err, sql.ErrNoRows) {
+			return nil, nil, fmt.Errorf("error getting message: %w", err)
+		}
+
+		unarchived, err := s.countUnarchivedChats(ctx, runId)
+		if err != nil {
+			return nil, nil, err
+		}
+		index -= unarchived
+	}
+
+	offset, ok, err := s.getSegmentOffset(ctx, runId, index)
+	if err != nil {
+		return nil, nil, err
+	}
+	if !ok {
+		return nil, nil, fmt.Errorf("error getting message: %w", sql.ErrNoRows)
+	}
+
+	chat, err := readSegmentChat(archive.segment, offset)
+	if err != nil {
+		return nil, nil, fmt.Errorf("error getting archived message: %w", err)
+	}
+
+	return chat.RequestData, chat.ResponseData, nil
+}
+
+// countUnarchivedChats counts the chats of an archived run that are not in its segment
+func (s *PostgresqlStore) countUnarchivedChats(ctx context.Context, runId uuid.UUID) (int, error) {
+	query := `
+		SELECT COUNT(*)
+		FROM chat c
+		JOIN run_archive ra ON ra.run_id = c.run_id
+		WHERE c.run_id = $1 AND NOT (c.id = ANY(ra.chat_ids))`
+
+	var count int
+	if err := s.db.QueryRowContext(ctx, query, runId).Scan(&count); err != nil {
+		return 0, fmt.Errorf("error counting unarchived chats: %w", err)
+	}
+
+	return count, nil
+}
+
+// getSegmentOffset returns the offset of the chat at index in the segment of an
+// archived run, or false if the segment has fewer chats.
+func (s *PostgresqlStore) getSegmentOffset(ctx context.Context, runId uuid.UUID, index int) (int64, bool, error) {
+	query := `
+		SELECT chat_offsets[$2::int + 1]
+		FROM run_archive
+		WHERE run_id = $1`
+
+	var offset sql.NullInt64
+	err := s.db.QueryRowContext(ctx, query, runId, index).Scan(&offset)
+	if errors.Is(err, sql.ErrNoRows) {
+		return 0, false, nil
+	}
+	if err != nil {
+		return 0, false, fmt.Errorf("error getting segment offset: %w", err)
+	}
+
+	return offset.Int64, offset.Valid, nil
+}
@@ -0,0 +1,220 @@
+package database
+
+import (
+	"bufio"
+	"compress/gzip"
+	"context"
+	"encoding/json"
+	"fmt"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	asteroid "github.com/asteroidai/asteroid/server"
+	"github.com/google/uuid"
+)
+
+func TestSegment(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "ab", "segment.jsonl.gz")
+
+	w, err := createSegment(path)
+	if err != nil {
+		t.Fatalf("error creating segment: %v", err)
+	}
+	defer w.abort()
+
+	chats := make([]ArchivedChat, 0)
+	for i := 0; i < 3; i++ {
+		chat := ArchivedChat{
+			Id:           uuid.New(),
+			CreatedAt:    time.Now().Add(-time.Duration(i) * time.Minute).UTC(),
+			Format:       "openai",
+			RequestData:  json.RawMessage(`{"messages": []}`),
+			ResponseData: json.RawMessage(`{"choices": []}`),
+			Choices:      []ArchivedChoice{},
+		}
+		if err := w.write(chat); err != nil {
+			t.Fatalf("error writing chat: %v", err)
+		}
+		chats = append(chats, chat)
+	}
+
+	if err := w.commit(); err != nil {
+		t.Fatalf("error committing segment: %v", err)
+	}
+	if len(w.offsets) != len(chats) {
+		t.Fatalf("expected %d offsets, got %d", len(chats), len(w.offsets))
+	}
+
+	// Every chat can be read on its own from its offset, in any order
+	for _, i := range []int{2, 0, 1} {
+		chat, err := readSegmentChat(path, w.offsets[i])
+		if err != nil {
+			t.Fatalf("error reading chat %d: %v", i, err)
+		}
+		if chat.Id != chats[i].Id || !chat.CreatedAt.Equal(chats[i].CreatedAt) {
+			t.Errorf("expected chat %s at index %d, got %s", chats[i].Id, i, chat.Id)
+		}
+	}
+
+	// The segment as a whole is still one gzipped JSONL file
+	f, err := os.Open(path)
+	if err != nil {
+		t.Fatalf("error opening segment: %v", err)
+	}
+	defer f.Close()
+
+	gz, err := gzip.NewReader(f)
+	if err != nil {
+		t.Fatalf("error reading segment: %v", err)
+	}
+
+	lines := 0
+	scanner := bufio.NewScanner(gz)
+	for scanner.Scan() {
+		var chat ArchivedChat
+		if err := json.Unmarshal(scanner.Bytes(), &chat); err != nil {
+			t.Fatalf("error decoding line %d: %v", lines, err)
+		}
+		if chat.Id != chats[lines].Id {
+			t.Errorf("expected chat %s on line %d, got %s", chats[lines].Id, lines, chat.Id)
+		}
+		lines++
+	}
+	if err := scanner.Err(); err != nil {
+		t.Fatalf("error scanning segment: %v", err)
+	}
+	if lines != len(chats) {
+		t.Errorf("expected %d lines, got %d", len(chats), lines)
+	}
+
+	if _, err := os.Stat(path + ".tmp"); !os.IsNotExist(err) {
+		t.Errorf("expected the temporary segment to be gone, got %v", err)
+	}
+}
+
+// postgresStore returns the Postgres store, the test is skipped when
+// DATABASE_URL is not set
+func postgresStore(t *testing.T) *PostgresqlStore {
+	t.Helper()
+
+	for _, s := range testStores(t) {
+		if postgres, ok := s.store.(*PostgresqlStore); ok {
+			return postgres
+		}
+	}
+
+	t.Skip("DATABASE_URL is not set")
+	return nil
+}
+
+// checkChats checks that GetChat returns the chats with requests {"n": N} for
+// each of want in turn, and nothing after them
+func checkChats(t *testing.T, store *PostgresqlStore, runId uuid.UUID, want ...int) {
+	t.Helper()
+	ctx := context.Background()
+
+	count, err := store.GetRunChatCount(ctx, runId)
+	if err != nil {
+		t.Fatalf("error counting chats: %v", err)
+	}
+	if count != len(want) {
+		t.Errorf("expected %d chats, got %d", len(want), count)
+	}
+
+	for index, n := range want {
+		request, _, err := store.GetChat(ctx, runId, index)
+		if err != nil {
+			t.Fatalf("error getting chat %d: %v", index, err)
+		}
+
+		var got struct{ N int }
+		if err := json.Unmarshal(request, &got); err != nil {
+			t.Fatalf("error decoding chat %d: %v", index, err)
+		}
+		if got.N != n {
+			t.Errorf("expected chat %d at index %d, got chat %d", n, index, got.N)
+		}
+	}
+
+	if _, _, err := store.GetChat(ctx, runId, len(want)); err == nil {
+		t.Errorf("expected no chat at index %d", len(want))
+	}
+}
+
+// checkExportedChats checks that the export of a project has one chat record
+// per chat of the run, whether it is archived or not
+func checkExportedChats(t *testing.T, store *PostgresqlStore, f fixture, want int) {
+	t.Helper()
+
+	ids := make(map[uuid.UUID]bool)
+	err := store.ExportProject(context.Background(), f.projectId, asteroid.ExportProjectParams{}, func(record asteroid.ExportRecord) error {
+		if record.Type != asteroid.ExportRecordTypeChat {
+			return nil
+		}
+		if ids[record.Id] {
+			t.Errorf("chat %s exported twice", record.Id)
+		}
+		if record.RunId != f.runId || record.RequestData == nil {
+			t.Errorf("unexpected chat record %+v", record)
+		}
+		ids[record.Id] = true
+		return nil
+	})
+	if err != nil {
+		t.Fatalf("error exporting project: %v", err)
+	}
+
+	if len(ids) != want {
+		t.Errorf("expected %d exported chats, got %d", want, len(ids))
+	}
+}
+
+func TestArchiveRun(t *testing.T) {
+	store := postgresStore(t)
+	ctx := context.Background()
+	dir := t.TempDir()
+
+	f := newFixture(t, store)
+	for n := 1; n <= 2; n++ {
+		createChat(t, store, f.runId, fmt.Sprintf(`{"n": %d}`, n), "", nil)
+	}
+
+	if err := store.archiveRun(ctx, dir, f.runId); err != nil {
+		t.Fatalf("error archiving run: %v", err)
+	}
+	checkChats(t, store, f.runId, 2, 1)
+	checkExportedChats(t, store, f, 2)
+
+	// A chat written after archival is read from the chat table, ahead of the segment
+	createChat(t, store, f.runId, `{"n": 3}`, "", nil)
+
+	archive, err := store.getRunArchive(ctx, f.runId)
+	if err != nil {
+		t.Fatalf("error getting run archive: %v", err)
+	}
+	if archive == nil || !archive.stale {
+		t.Fatalf("expected a stale archive, got %+v", archive)
+	}
+	checkChats(t, store, f.runId, 3, 2, 1)
+	checkExportedChats(t, store, f, 3)
+
+	// Archiving the run again folds the new chat into a new segment
+	if err := store.archiveRun(ctx, dir, f.runId); err != nil {
+		t.Fatalf("error archiving run again: %v", err)
+	}
+
+	refreshed, err := store.getRunArchive(ctx, f.runId)
+	if err != nil {
+		t.Fatalf("error getting run archive: %v", err)
+	}
+	if refreshed.stale || refreshed.chatCount != 3 {
+		t.Errorf("expected a fresh archive of 3 chats, got %+v", refreshed)
+	}
+	if _, err := os.Stat(archive.segment); !os.IsNotExist(err) {
+		t.Errorf("expected the replaced segment to be removed, got %v", err)
+	}
+	checkChats(t, store, f.runId, 3, 2, 1)
+	checkExportedChats(t, store, f, 3)
+}
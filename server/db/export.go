@@ -0,0 +1,333 @@
+package database
+
+import (
+	"context"
+	"database/sql"
+	"fmt"
+	"slices"
+	"time"
+
+	asteroid "github.com/asteroidai/asteroid/server"
+	"github.com/google/uuid"
+	"github.com/lib/pq"
+)
+
+// exportBatchSize is the number of rows fetched from an export cursor at a time
+const exportBatchSize = 1000
+
+// exportRunFilter restricts an export query to the runs of project $1, optionally
+// to those of task $2 and created in [$3, $4). The query must join run r and task t.
+const exportRunFilter = `
+	t.project_id = $1
+	AND ($2::uuid IS NULL OR r.task_id = $2)
+	AND ($3::timestamptz IS NULL OR r.created_at >= $3)
+	AND ($4::timestamptz IS NULL OR r.created_at < $4)`
+
+// sqliteExportRunFilter is exportRunFilter for the SQLite store
+const sqliteExportRunFilter = `
+	t.project_id = ?1
+	AND (?2 IS NULL OR r.task_id = ?2)
+	AND (?3 IS NULL OR r.created_at >= ?3)
+	AND (?4 IS NULL OR r.created_at < ?4)`
+
+type exportQuery struct {
+	cursor string
+	query  string
+	scan   func(rows *sql.Rows) (asteroid.ExportRecord, error)
+}
+
+// exportedChatFilter leaves out the chats held in the segment of an archived
+// run, they are exported from the segment by exportArchivedChats.
+const exportedChatFilter = `
+	AND NOT EXISTS (
+		SELECT 1
+		FROM run_archive ra
+		WHERE ra.run_id = c.run_id AND c.id = ANY(ra.chat_ids)
+	)`
+
+var exportQueries = newExportQueries(exportRunFilter, `tc.tool_call_data->>'arguments'`, exportedChatFilter)
+
+// newExportQueries returns the export queries restricted by runFilter. arguments
+// extracts the arguments string from the tool_call_data of toolcall tc, and
+// chatFilter further restricts the chats c that are exported.
+func newExportQueries(runFilter string, arguments string, chatFilter string) []exportQuery {
+	return []exportQuery{
+		{
+			cursor: "export_runs",
+			query: `
+				SELECT r.id, r.task_id, r.created_at, r.status, r.result
+				FROM run r
+				JOIN task t ON t.id = r.task_id
+				WHERE ` + runFilter + `
+				ORDER BY r.created_at ASC`,
+			scan: func(rows *sql.Rows) (asteroid.ExportRecord, error) {
+				record := asteroid.ExportRecord{Type: asteroid.ExportRecordTypeRun}
+				err := rows.Scan(&record.Id, &record.TaskId, &record.CreatedAt, &record.Status, &record.Result)
+				record.RunId = record.Id
+				return record, err
+			},
+		},
+		{
+			cursor: "export_chats",
+			query: `
+				SELECT c.id, r.id, r.task_id, c.created_at, c.request_data, c.response_data
+				FROM chat c
+				JOIN run r ON r.id = c.run_id
+				JOIN task t ON t.id = r.task_id
+				WHERE ` + runFilter + chatFilter + `
+				ORDER BY c.created_at ASC`,
+			scan: func(rows *sql.Rows) (asteroid.ExportRecord, error) {
+				record := asteroid.ExportRecord{Type: asteroid.ExportRecordTypeChat}
+				err := rows.Scan(&record.Id, &record.RunId, &record.TaskId, &record.CreatedAt, &record.RequestData, &record.ResponseData)
+				return record, err
+			},
+		},
+		{
+			cursor: "export_tool_calls",
+			query: `
+				SELECT tc.id, r.id, r.task_id, tc.created_at, tl.name, tc.call_id, ` + arguments + `
+				FROM toolcall tc
+				JOIN tool tl ON tl.id = tc.tool_id
+				JOIN run r ON r.id = tl.run_id
+				JOIN task t ON t.id = r.task_id
+				WHERE ` + runFilter + `
+				ORDER BY tc.created_at ASC`,
+			scan: func(rows *sql.Rows) (asteroid.ExportRecord, error) {
+				record := asteroid.ExportRecord{Type: asteroid.ExportRecordTypeToolCall}
+				err := rows.Scan(&record.Id, &record.RunId, &record.TaskId, &record.CreatedAt, &record.ToolName, &record.CallId, &record.Arguments)
+				return record, err
+			},
+		},
+		{
+			cursor: "export_supervisions",
+			query: `
+				SELECT sreq.id, r.id, r.task_id, res.created_at, ce.created_at, r.created_at,
+					ce.toolcall_id, s.id, s.name, s.type, sreq.position_in_chain, res.decision, res.reasoning
+				FROM supervisionrequest sreq
+				JOIN chainexecution ce ON ce.id = sreq.chainexecution_id
+				JOIN toolcall tc ON tc.id = ce.toolcall_id
+				JOIN tool tl ON tl.id = tc.tool_id
+				JOIN run r ON r.id = tl.run_id
+				JOIN task t ON t.id = r.task_id
+				JOIN supervisor s ON s.id = sreq.supervisor_id
+				LEFT JOIN supervisionresult res ON res.supervisionrequest_id = sreq.id
+				WHERE ` + runFilter + `
+				ORDER BY ce.created_at ASC, sreq.position_in_chain ASC`,
+			scan: func(rows *sql.Rows) (asteroid.ExportRecord, error) {
+				record := asteroid.ExportRecord{Type: asteroid.ExportRecordTypeSupervision}
+				// The supervision is dated by its result, or by its execution while pending
+				var resultAt, executionAt sql.NullTime
+				err := rows.Scan(
+					&record.Id,
+					&record.RunId,
+					&record.TaskId,
+					&resultAt,
+					&executionAt,
+					&record.CreatedAt,
+					&record.ToolCallId,
+					&record.SupervisorId,
+					&record.SupervisorName,
+					&record.SupervisorType,
+					&record.PositionInChain,
+					&record.Decision,
+					&record.Reasoning,
+				)
+				if resultAt.Valid {
+					record.CreatedAt = resultAt.Time
+				} else if executionAt.Valid {
+					record.CreatedAt = executionAt.Time
+				}
+				return record, err
+			},
+		},
+	}
+}
+
+// ExportProject streams the records of a project through server side cursors, so
+// memory use is bounded by exportBatchSize regardless of the size of the export.
+// All cursors read from the same snapshot. The chats of archived runs are read
+// from their segments ahead of the chats still in the chat table.
+func (s *PostgresqlStore) ExportProject(
+	ctx context.Context,
+	projectId uuid.UUID,
+	params asteroid.ExportProjectParams,
+	emit func(asteroid.ExportRecord) error,
+) error {
+	tx, err := s.db.BeginTx(ctx, &sql.TxOptions{Isolation: sql.LevelRepeatableRead, ReadOnly: true})
+	if err != nil {
+		return fmt.Errorf("error starting transaction: %w", err)
+	}
+	defer func() { _ = tx.Rollback() }()
+
+	args := []interface{}{projectId, params.TaskId, params.From, params.To}
+	for _, q := range exportQueries {
+		if q.cursor == "export_chats" {
+			if err := exportArchivedChats(ctx, tx, args, emit); err != nil {
+				return fmt.Errorf("error exporting archived chats: %w", err)
+			}
+		}
+
+		if err := exportCursor(ctx, tx, q, args, emit); err != nil {
+			return fmt.Errorf("error exporting %s: %w", q.cursor, err)
+		}
+	}
+
+	if err := tx.Commit(); err != nil {
+		return fmt.Errorf("error committing transaction: %w", err)
+	}
+
+	return nil
+}
+
+func exportCursor(ctx context.Context, tx *sql.Tx, q exportQuery, args []interface{}, emit func(asteroid.ExportRecord) error) error {
+	_, err := tx.ExecContext(ctx, fmt.Sprintf("DECLARE %s NO SCROLL CURSOR FOR %s", q.cursor, q.query), args...)
+	if err != nil {
+		return fmt.Errorf("error declaring cursor: %w", err)
+	}
+
+	fetch := fmt.Sprintf("FETCH FORWARD %d FROM %s", exportBatchSize, q.cursor)
+	for {
+		rows, err := tx.QueryContext(ctx, fetch)
+		if err != nil {
+			return fmt.Errorf("error fetching from cursor: %w", err)
+		}
+
+		n := 0
+		for rows.Next() {
+			record, err := q.scan(rows)
+			if err != nil {
+				rows.Close()
+				return fmt.Errorf("error scanning export record: %w", err)
+			}
+
+			if err := emit(record); err != nil {
+				rows.Close()
+				return err
+			}
+			n++
+		}
+		rows.Close()
+
+		if err := rows.Err(); err != nil {
+			return fmt.Errorf("error reading from cursor: %w", err)
+		}
+
+		if n < exportBatchSize {
+			break
+		}
+	}
+
+	if _, err := tx.ExecContext(ctx, "CLOSE "+q.cursor); err != nil {
+		return fmt.Errorf("error closing cursor: %w", err)
+	}
+
+	return nil
+}
+
+// exportArchivedChats emits the chats held in the segments of the archived runs
+// that match args, oldest first within each run. A segment that can not be read
+// fails the export rather than leaving the run's chats out of it.
+func exportArchivedChats(ctx context.Context, tx *sql.Tx, args []interface{}, emit func(asteroid.ExportRecord) error) error {
+	query := `
+		SELECT r.id, r.task_id, ra.segment, ra.chat_offsets
+		FROM run_archive ra
+		JOIN run r ON r.id = ra.run_id
+		JOIN task t ON t.id = r.task_id
+		WHERE ` + exportRunFilter + `
+		ORDER BY r.created_at ASC`
+
+	rows, err := tx.QueryContext(ctx, query, args...)
+	if err != nil {
+		return fmt.Errorf("error getting archived runs: %w", err)
+	}
+	defer rows.Close()
+
+	for rows.Next() {
+		var runId, taskId uuid.UUID
+		var segment string
+		var offsets []int64
+		if err := rows.Scan(&runId, &taskId, &segment, pq.Array(&offsets)); err != nil {
+			return fmt.Errorf("error scanning archived run: %w", err)
+		}
+
+		// Segments hold the newest chat first
+		slices.Reverse(offsets)
+
+		err := forEachSegmentChat(segment, offsets, func(chat *ArchivedChat) error {
+			requestData := string(chat.RequestData)
+			responseData := string(chat.ResponseData)
+			return emit(asteroid.ExportRecord{
+				Type:         asteroid.ExportRecordTypeChat,
+				Id:           chat.Id,
+				RunId:        runId,
+				TaskId:       taskId,
+				CreatedAt:    chat.CreatedAt,
+				RequestData:  &requestData,
+				ResponseData: &responseData,
+			})
+		})
+		if err != nil {
+			return fmt.Errorf("error exporting run %s: %w", runId, err)
+		}
+	}
+
+	return rows.Err()
+}
+
+var sqliteExportQueries = newExportQueries(sqliteExportRunFilter, `json_extract(tc.tool_call_data, '$.arguments')`, "")
+
+// ExportProject streams the records of a project. SQLite steps through a result
+// set one row at a time, so no cursor is needed to keep memory use constant. The
+// read transaction keeps all queries on the same WAL snapshot.
+func (s *SqliteStore) ExportProject(
+	ctx context.Context,
+	projectId uuid.UUID,
+	params asteroid.ExportProjectParams,
+	emit func(asteroid.ExportRecord) error,
+) error {
+	tx, err := s.db.BeginTx(ctx, &sql.TxOptions{ReadOnly: true})
+	if err != nil {
+		return fmt.Errorf("error starting transaction: %w", err)
+	}
+	defer func() { _ = tx.Rollback() }()
+
+	var from, to *time.Time
+	if params.From != nil {
+		t := sqliteTime(*params.From)
+		from = &t
+	}
+	if params.To != nil {
+		t := sqliteTime(*params.To)
+		to = &t
+	}
+
+	args := []interface{}{projectId, params.TaskId, from, to}
+	for _, q := range sqliteExportQueries {
+		if err := exportRows(ctx, tx, q, args, emit); err != nil {
+			return fmt.Errorf("error exporting %s: %w", q.cursor, err)
+		}
+	}
+
+	return nil
+}
+
+func exportRows(ctx context.Context, tx *sql.Tx, q exportQuery, args []interface{}, emit func(asteroid.ExportRecord) error) error {
+	rows, err := tx.QueryContext(ctx, q.query, args...)
+	if err != nil {
+		return fmt.Errorf("error querying export records: %w", err)
+	}
+	defer rows.Close()
+
+	for rows.Next() {
+		record, err := q.scan(rows)
+		if err != nil {
+			return fmt.Errorf("error scanning export record: %w", err)
+		}
+
+		if err := emit(record); err != nil {
+			return err
+		}
+	}
+
+	return rows.Err()
+}
@@ -1,4 +1,5 @@
 -- First drop tables in reverse dependency order
+DROP TABLE IF EXISTS run_archive CASCADE;
 DROP TABLE IF EXISTS msg CASCADE;
 DROP TABLE IF EXISTS choice CASCADE;
 DROP TABLE IF EXISTS chat CASCADE;
@@ -18,6 +19,11 @@ DROP TABLE IF EXISTS project CASCADE;
 DROP TABLE IF EXISTS asteroid_user CASCADE;
 DROP TABLE IF EXISTS task CASCADE;
 
+-- pg_trgm provides the trigram indexes that back project search, btree_gin
+-- lets those indexes lead with the project_id of the searched rows
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE EXTENSION IF NOT EXISTS btree_gin;
+
 -- Create tables in dependency order (tables with no foreign keys first)
 CREATE TABLE asteroid_user (
     id UUID PRIMARY KEY,
@@ -43,6 +49,9 @@ CREATE TABLE supervisor (
     attributes JSONB DEFAULT '{}' NOT NULL
 );
 
+-- Supervisors are deduplicated by value on creation
+CREATE INDEX supervisor_name_type_idx ON supervisor (name, type);
+
 CREATE TABLE chain (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
@@ -56,6 +65,8 @@ CREATE TABLE task (
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX task_project_id_name_idx ON task (project_id, name);
+
 CREATE TABLE run (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     task_id UUID REFERENCES task(id),
@@ -64,6 +75,8 @@ CREATE TABLE run (
     result TEXT DEFAULT ''
 );
 
+CREATE INDEX run_task_id_idx ON run (task_id);
+
 CREATE TABLE tool (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     run_id UUID REFERENCES run(id),
@@ -74,6 +87,9 @@ CREATE TABLE tool (
     code TEXT DEFAULT ''
 );
 
+-- Tool calls are resolved to their tool by (run_id, name)
+CREATE INDEX tool_run_id_name_idx ON tool (run_id, name);
+
 CREATE TABLE user_project (
     user_id UUID REFERENCES asteroid_user(id),
     project_id UUID REFERENCES project(id),
@@ -87,52 +103,97 @@ CREATE TABLE chain_supervisor (
     PRIMARY KEY (supervisor_id, chain_id)
 );
 
+CREATE INDEX chain_supervisor_chain_id_idx ON chain_supervisor (chain_id, position_in_chain);
+
 CREATE TABLE chain_tool (
     tool_id UUID REFERENCES tool(id),
     chain_id UUID REFERENCES chain(id),
     PRIMARY KEY (tool_id, chain_id)
 );
 
+-- The append-only transcript tables (chat, choice and msg) are range
+-- partitioned by created_at. Monthly partitions are created ahead of time by
+-- the server (see db/partitions.go), the DEFAULT partitions only catch rows
+-- that fall outside of those ranges. Postgres requires the partition key to be
+-- part of every unique constraint, so these tables use (id, created_at) as
+-- their primary key and are not the target of foreign keys. The primary key
+-- index also serves lookups by id, but without a created_at predicate they are
+-- not pruned and probe the index of every monthly partition, e.g. GetMessage.
+-- toolcall and supervisionrequest_status are not partitioned: they are looked
+-- up by id on every supervision and stay attached after archival, so
+-- partitioning them would only add a probe per month to those lookups.
+--
+-- msg, toolcall and supervisionresult are searched by project (see
+-- db/search.go). They carry the run_id and project_id of their run, copied
+-- when they are written, so a search filters on its own table: the
+-- (project_id, created_at DESC, id DESC) index walks a project newest first
+-- and stops at the page limit when a term is common, and the GIN index on
+-- (project_id, text) finds the few matches of a rare term in the project only.
 CREATE TABLE chat (
-    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
     request_data JSONB DEFAULT '{}' NOT NULL,
     response_data JSONB DEFAULT '{}' NOT NULL,
     run_id UUID REFERENCES run(id) NOT NULL,
-    format TEXT DEFAULT 'openai' CHECK (format IN ('openai', 'anthropic')) NOT NULL
-);
+    format TEXT DEFAULT 'openai' CHECK (format IN ('openai', 'anthropic')) NOT NULL,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE chat_default PARTITION OF chat DEFAULT;
+CREATE INDEX chat_run_id_created_at_idx ON chat (run_id, created_at DESC);
 
 CREATE TABLE choice (
-    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-    chat_id UUID REFERENCES chat(id),
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    choice_data JSONB DEFAULT '{}' NOT NULL
-);
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+    chat_id UUID NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    choice_data JSONB DEFAULT '{}' NOT NULL,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
 
+CREATE TABLE choice_default PARTITION OF choice DEFAULT;
+CREATE INDEX choice_chat_id_idx ON choice (chat_id);
 
 CREATE TABLE msg (
-    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-    choice_id UUID REFERENCES choice(id),
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    msg_data JSONB DEFAULT '{}' NOT NULL
-);
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+    choice_id UUID NOT NULL,
+    run_id UUID NOT NULL,
+    project_id UUID NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    msg_data JSONB DEFAULT '{}' NOT NULL,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE msg_default PARTITION OF msg DEFAULT;
+CREATE INDEX msg_choice_id_idx ON msg (choice_id);
+CREATE INDEX msg_project_id_created_at_idx ON msg (project_id, created_at DESC, id DESC);
+CREATE INDEX msg_content_trgm_idx ON msg USING GIN (project_id, (msg_data->>'content') gin_trgm_ops);
 
 CREATE TABLE toolcall (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     call_id TEXT DEFAULT '' NOT NULL,
     tool_id UUID REFERENCES tool(id),
-    msg_id UUID REFERENCES msg(id),
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    msg_id UUID NOT NULL,
+    run_id UUID REFERENCES run(id) NOT NULL,
+    project_id UUID REFERENCES project(id) NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
     tool_call_data JSONB DEFAULT '{}' NOT NULL
 );
 
+CREATE INDEX toolcall_call_id_idx ON toolcall (call_id);
+CREATE INDEX toolcall_msg_id_idx ON toolcall (msg_id);
+CREATE INDEX toolcall_tool_id_created_at_idx ON toolcall (tool_id, created_at DESC);
+CREATE INDEX toolcall_project_id_created_at_idx ON toolcall (project_id, created_at DESC, id DESC);
+CREATE INDEX toolcall_arguments_trgm_idx ON toolcall USING GIN (project_id, (tool_call_data->>'arguments') gin_trgm_ops);
+
 CREATE TABLE chainexecution (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-    toolcall_id UUID REFERENCES toolcall(id),
+    toolcall_id UUID REFERENCES toolcall(id) NOT NULL,
     chain_id UUID REFERENCES chain(id),
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX chainexecution_toolcall_id_idx ON chainexecution (toolcall_id, chain_id);
+
 CREATE TABLE supervisionrequest (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     chainexecution_id UUID REFERENCES chainexecution(id),
@@ -140,19 +201,46 @@ CREATE TABLE supervisionrequest (
     position_in_chain INTEGER
 );
 
+CREATE INDEX supervisionrequest_chainexecution_id_idx ON supervisionrequest (chainexecution_id);
+
 CREATE TABLE supervisionrequest_status (
     id SERIAL PRIMARY KEY,
     supervisionrequest_id UUID REFERENCES supervisionrequest(id),
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
     status TEXT DEFAULT 'pending' CHECK (status IN ('timeout', 'pending', 'completed', 'failed', 'assigned'))
 );
 
+CREATE INDEX supervisionrequest_status_request_id_idx ON supervisionrequest_status (supervisionrequest_id, created_at DESC);
+
 CREATE TABLE supervisionresult (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     supervisionrequest_id UUID REFERENCES supervisionrequest(id),
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     decision TEXT DEFAULT 'reject' CHECK (decision IN ('approve', 'reject', 'terminate', 'modify', 'escalate')),
     reasoning TEXT DEFAULT '',
-    toolcall_id UUID REFERENCES toolcall(id) NULL
+    toolcall_id UUID REFERENCES toolcall(id) NULL,
+    run_id UUID REFERENCES run(id) NOT NULL,
+    project_id UUID REFERENCES project(id) NOT NULL
+);
+
+CREATE INDEX supervisionresult_request_id_idx ON supervisionresult (supervisionrequest_id);
+CREATE INDEX supervisionresult_decision_created_at_idx ON supervisionresult (decision, created_at DESC);
+CREATE INDEX supervisionresult_project_id_created_at_idx ON supervisionresult (project_id, created_at DESC, id DESC);
+CREATE INDEX supervisionresult_reasoning_trgm_idx ON supervisionresult USING GIN (project_id, reasoning gin_trgm_ops);
+
+-- Runs whose transcripts have been exported to an archive segment on disk.
+-- Chat reads for these runs are served from the segment (see db/archive.go),
+-- their tool calls and supervision statuses stay in their tables.
+-- chat_ids and chat_offsets hold the ID and byte offset of each chat in the
+-- segment, newest first. A run that gets chats after it was archived is marked
+-- stale: its new chats are read from the chat table until it is archived again.
+CREATE TABLE run_archive (
+    run_id UUID PRIMARY KEY REFERENCES run(id),
+    segment TEXT NOT NULL,
+    chat_count INTEGER NOT NULL DEFAULT 0,
+    chat_ids UUID[] DEFAULT '{}' NOT NULL,
+    chat_offsets BIGINT[] DEFAULT '{}' NOT NULL,
+    stale BOOLEAN DEFAULT false NOT NULL,
+    archived_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
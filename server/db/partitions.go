@@ -0,0 +1,187 @@
+package database
+
+import (
+	"context"
+	"database/sql"
+	"fmt"
+	"log"
+	"time"
+
+	"github.com/lib/pq"
+)
+
+// partitionedTables are the append-only transcript tables that are range
+// partitioned by created_at in schema.sql. Rows for choice and msg are written
+// in the same transaction as their chat row, so they always land in the same
+// monthly partition as it, and the partitions of a month are detached together
+// once all of its runs have been archived.
+var partitionedTables = []string{
+	"chat",
+	"choice",
+	"msg",
+}
+
+// partitionName returns the name of the monthly partition of table that holds month
+func partitionName(table string, month time.Time) string {
+	return fmt.Sprintf("%s_y%04dm%02d", table, month.Year(), int(month.Month()))
+}
+
+// monthStart truncates t to the first instant of its month in UTC
+func monthStart(t time.Time) time.Time {
+	t = t.UTC()
+	return time.Date(t.Year(), t.Month(), 1, 0, 0, 0, 0, time.UTC)
+}
+
+// EnsurePartitions creates the monthly partitions for the current month and the
+// following monthsAhead months if they do not exist yet.
+func (s *PostgresqlStore) EnsurePartitions(ctx context.Context, now time.Time, monthsAhead int) error {
+	start := monthStart(now)
+	for i := 0; i <= monthsAhead; i++ {
+		from := start.AddDate(0, i, 0)
+		to := from.AddDate(0, 1, 0)
+
+		for _, table := range partitionedTables {
+			query := fmt.Sprintf(
+				`CREATE TABLE IF NOT EXISTS %s PARTITION OF %s FOR VALUES FROM (%s) TO (%s)`,
+				pq.QuoteIdentifier(partitionName(table, from)),
+				pq.QuoteIdentifier(table),
+				pq.QuoteLiteral(from.Format(time.RFC3339)),
+				pq.QuoteLiteral(to.Format(time.RFC3339)),
+			)
+
+			if _, err := s.db.ExecContext(ctx, query); err != nil {
+				return fmt.Errorf("error creating partition %s: %w", partitionName(table, from), err)
+			}
+		}
+	}
+
+	return nil
+}
+
+// DetachArchivedPartitions detaches every monthly partition of partitionedTables
+// that ends before cutoff and only holds rows belonging to archived runs. The
+// partitions of a month are detached together so that a run is never half
+// detached. Detached partitions are left in place as standalone tables to be
+// dropped or dumped by the operator. It returns the names of the detached
+// partitions.
+func (s *PostgresqlStore) DetachArchivedPartitions(ctx context.Context, cutoff time.Time) ([]string, error) {
+	months, err := s.getAttachedPartitionMonths(ctx, "chat")
+	if err != nil {
+		return nil, fmt.Errorf("error listing chat partitions: %w", err)
+	}
+
+	detached := make([]string, 0)
+	for _, month := range months {
+		if !month.AddDate(0, 1, 0).Before(cutoff) {
+			continue
+		}
+
+		names, err := s.detachMonth(ctx, month)
+		if err != nil {
+			return detached, fmt.Errorf("error detaching partitions for %s: %w", month.Format("2006-01"), err)
+		}
+		detached = append(detached, names...)
+	}
+
+	return detached, nil
+}
+
+// getAttachedPartitionMonths lists the months for which table has a monthly partition attached
+func (s *PostgresqlStore) getAttachedPartitionMonths(ctx context.Context, table string) ([]time.Time, error) {
+	query := `
+		SELECT c.relname
+		FROM pg_inherits i
+		JOIN pg_class c ON c.oid = i.inhrelid
+		JOIN pg_class p ON p.oid = i.inhparent
+		WHERE p.relname = $1
+		ORDER BY c.relname ASC`
+
+	rows, err := s.db.QueryContext(ctx, query, table)
+	if err != nil {
+		return nil, fmt.Errorf("error getting partitions: %w", err)
+	}
+	defer rows.Close()
+
+	months := make([]time.Time, 0)
+	for rows.Next() {
+		var name string
+		if err := rows.Scan(&name); err != nil {
+			return nil, fmt.Errorf("error scanning partition name: %w", err)
+		}
+
+		var year, month int
+		if _, err := fmt.Sscanf(name, table+"_y%04dm%02d", &year, &month); err != nil {
+			// Not a monthly partition, e.g. the default partition
+			continue
+		}
+		months = append(months, time.Date(year, time.Month(month), 1, 0, 0, 0, 0, time.UTC))
+	}
+
+	return months, nil
+}
+
+func (s *PostgresqlStore) detachMonth(ctx context.Context, month time.Time) ([]string, error) {
+	tx, err := s.db.BeginTx(ctx, nil)
+	if err != nil {
+		return nil, fmt.Errorf("error starting transaction: %w", err)
+	}
+	defer func() { _ = tx.Rollback() }()
+
+	ready, err := s.monthFullyArchived(ctx, tx, month)
+	if err != nil {
+		return nil, err
+	}
+	if !ready {
+		return nil, nil
+	}
+
+	names := make([]string, 0, len(partitionedTables))
+	for _, table := range partitionedTables {
+		name := partitionName(table, month)
+		query := fmt.Sprintf(
+			`ALTER TABLE %s DETACH PARTITION %s`,
+			pq.QuoteIdentifier(table),
+			pq.QuoteIdentifier(name),
+		)
+		if _, err := tx.ExecContext(ctx, query); err != nil {
+			return nil, fmt.Errorf("error detaching partition %s: %w", name, err)
+		}
+		names = append(names, name)
+	}
+
+	if err := tx.Commit(); err != nil {
+		return nil, fmt.Errorf("error committing transaction: %w", err)
+	}
+
+	for _, name := range names {
+		log.Printf("Detached partition %s", name)
+	}
+
+	return names, nil
+}
+
+// monthFullyArchived reports whether every chat in the partition for month is
+// held in the segment of its run. A chat is not when its run has not been
+// archived, when it was written after the archive, or when the archive is stale
+// because chats reached the run while it was being archived. Choices and
+// messages are written with their chat, so they are covered by the same check.
+func (s *PostgresqlStore) monthFullyArchived(ctx context.Context, tx *sql.Tx, month time.Time) (bool, error) {
+	query := fmt.Sprintf(`
+		SELECT NOT EXISTS (
+			SELECT 1
+			FROM %s c
+			LEFT JOIN run_archive ra ON ra.run_id = c.run_id
+			WHERE ra.run_id IS NULL
+			OR ra.stale
+			OR c.created_at > ra.archived_at
+		)`,
+		pq.QuoteIdentifier(partitionName("chat", month)),
+	)
+
+	var archived bool
+	if err := tx.QueryRowContext(ctx, query).Scan(&archived); err != nil {
+		return false, fmt.Errorf("error checking partitions are archived: %w", err)
+	}
+
+	return archived, nil
+}
@@ -885,12 +885,17 @@ func (s *PostgresqlStore) CreateSupervisionResult(ctx context.Context, result as
 	}
 	defer func() { _ = tx.Rollback() }()
 
+	// The result carries the run and project of the supervised tool call for search
 	query := `
-		INSERT INTO supervisionresult (id, supervisionrequest_id, created_at, decision, reasoning, toolcall_id)
-		VALUES ($1, $2, $3, $4, $5, $6)`
+		INSERT INTO supervisionresult (id, supervisionrequest_id, created_at, decision, reasoning, toolcall_id, run_id, project_id)
+		SELECT $1::uuid, sr.id, $3::timestamptz, $4::text, $5::text, $6::uuid, tc.run_id, tc.project_id
+		FROM supervisionrequest sr
+		JOIN chainexecution ce ON ce.id = sr.chainexecution_id
+		JOIN toolcall tc ON tc.id = ce.toolcall_id
+		WHERE sr.id = $2`
 
 	id := uuid.New()
-	_, err = tx.ExecContext(
+	inserted, err := tx.ExecContext(
 		ctx,
 		query,
 		id,
@@ -903,6 +908,9 @@ func (s *PostgresqlStore) CreateSupervisionResult(ctx context.Context, result as
 	if err != nil {
 		return nil, fmt.Errorf("error creating supervision result: %w", err)
 	}
+	if n, err := inserted.RowsAffected(); err != nil || n == 0 {
+		return nil, fmt.Errorf("error creating supervision result: supervision request %s has no tool call", requestId)
+	}
 
 	// Create a supervisionrequest_status
 	err = s.createSupervisionStatus(ctx, requestId, asteroid.SupervisionStatus{
@@ -1131,6 +1139,157 @@ func (s *PostgresqlStore) CreateRun(ctx context.Context, run asteroid.Run) (uuid
 	return id, nil
 }
 
+// CreateRuns inserts every row with one statement per tool, chain and chain position,
+// using arrays of IDs, so the number of round trips does not grow with count.
+func (s *PostgresqlStore) CreateRuns(
+	ctx context.Context,
+	taskId uuid.UUID,
+	count int,
+	tools []asteroid.Tool,
+	chains [][]asteroid.ChainRequest,
+) ([]uuid.UUID, [][]uuid.UUID, error) {
+	if len(chains) != len(tools) {
+		return nil, nil, fmt.Errorf("expected chains for %d tools, got %d", len(tools), len(chains))
+	}
+
+	task, err := s.GetTask(ctx, taskId)
+	if err != nil {
+		return nil, nil, fmt.Errorf("error getting task: %w", err)
+	}
+	if task == nil {
+		return nil, nil, fmt.Errorf("task not found: %s", taskId)
+	}
+
+	tx, err := s.db.BeginTx(ctx, nil)
+	if err != nil {
+		return nil, nil, fmt.Errorf("error starting transaction: %w", err)
+	}
+	defer func() { _ = tx.Rollback() }()
+
+	runIds := newUUIDs(count)
+	query := `
+		INSERT INTO run (id, task_id, created_at, status)
+		SELECT unnest($1::uuid[]), $2::uuid, $3::timestamptz, $4::text`
+
+	_, err = tx.ExecContext(ctx, query, pq.Array(uuidStrings(runIds)), taskId, time.Now(), asteroid.Pending)
+	if err != nil {
+		return nil, nil, fmt.Errorf("error creating runs: %w", err)
+	}
+
+	toolIds := make([][]uuid.UUID, count)
+	for i := range toolIds {
+		toolIds[i] = make([]uuid.UUID, len(tools))
+	}
+
+	for i, tool := range tools {
+		ids := newUUIDs(count)
+		for run, id := range ids {
+			toolIds[run][i] = id
+		}
+
+		if err := createRunsTool(ctx, tx, ids, runIds, tool); err != nil {
+			return nil, nil, err
+		}
+
+		for _, chain := range chains[i] {
+			if err := createRunsChain(ctx, tx, ids, chain); err != nil {
+				return nil, nil, err
+			}
+		}
+	}
+
+	if err := tx.Commit(); err != nil {
+		return nil, nil, fmt.Errorf("error committing transaction: %w", err)
+	}
+
+	return runIds, toolIds, nil
+}
+
+// createRunsTool inserts a copy of tool with ID ids[i] for every run runIds[i]
+func createRunsTool(ctx context.Context, tx *sql.Tx, ids []uuid.UUID, runIds []uuid.UUID, tool asteroid.Tool) error {
+	attributesJSON, err := json.Marshal(tool.Attributes)
+	if err != nil {
+		return fmt.Errorf("error marshaling tool attributes: %w", err)
+	}
+
+	ignoredAttributes := []string{}
+	if tool.IgnoredAttributes != nil {
+		ignoredAttributes = *tool.IgnoredAttributes
+	}
+
+	query := `
+		INSERT INTO tool (id, run_id, name, description, attributes, ignored_attributes, code)
+		SELECT t.id, t.run_id, $3::text, $4::text, $5::jsonb, $6::text[], $7::text
+		FROM unnest($1::uuid[], $2::uuid[]) AS t(id, run_id)`
+
+	_, err = tx.ExecContext(ctx, query,
+		pq.Array(uuidStrings(ids)),
+		pq.Array(uuidStrings(runIds)),
+		tool.Name,
+		tool.Description,
+		attributesJSON,
+		pq.Array(ignoredAttributes),
+		tool.Code,
+	)
+	if err != nil {
+		return fmt.Errorf("error creating tools: %w", err)
+	}
+
+	return nil
+}
+
+// createRunsChain creates a copy of chain for every tool in toolIds
+func createRunsChain(ctx context.Context, tx *sql.Tx, toolIds []uuid.UUID, chain asteroid.ChainRequest) error {
+	if chain.SupervisorIds == nil {
+		return fmt.Errorf("supervisor IDs are required to make a chain of supervisors")
+	}
+
+	chainIds := pq.Array(uuidStrings(newUUIDs(len(toolIds))))
+
+	_, err := tx.ExecContext(ctx, `INSERT INTO chain (id) SELECT unnest($1::uuid[])`, chainIds)
+	if err != nil {
+		return fmt.Errorf("error creating chains: %w", err)
+	}
+
+	query := `
+		INSERT INTO chain_tool (tool_id, chain_id)
+		SELECT * FROM unnest($1::uuid[], $2::uuid[])`
+
+	_, err = tx.ExecContext(ctx, query, pq.Array(uuidStrings(toolIds)), chainIds)
+	if err != nil {
+		return fmt.Errorf("error linking tools to chains: %w", err)
+	}
+
+	query = `
+		INSERT INTO chain_supervisor (chain_id, supervisor_id, position_in_chain)
+		SELECT unnest($1::uuid[]), $2::uuid, $3::int`
+
+	for i, supervisorId := range *chain.SupervisorIds {
+		_, err = tx.ExecContext(ctx, query, chainIds, supervisorId, i)
+		if err != nil {
+			return fmt.Errorf("error adding supervisor to chains: %w", err)
+		}
+	}
+
+	return nil
+}
+
+func newUUIDs(n int) []uuid.UUID {
+	ids := make([]uuid.UUID, n)
+	for i := range ids {
+		ids[i] = uuid.New()
+	}
+	return ids
+}
+
+func uuidStrings(ids []uuid.UUID) []string {
+	strs := make([]string, len(ids))
+	for i, id := range ids {
+		strs[i] = id.String()
+	}
+	return strs
+}
+
 func (s *PostgresqlStore) CreateTool(
 	ctx context.Context,
 	runId uuid.UUID,
@@ -1664,12 +1823,34 @@ func (s *PostgresqlStore) CreateChatRequest(
 		return nil, fmt.Errorf("error creating chat entry: %w", err)
 	}
 
+	// Messages and tool calls carry the project of their run for search
+	query = `
+		SELECT t.project_id
+		FROM run r
+		JOIN task t ON t.id = r.task_id
+		WHERE r.id = $1
+	`
+	var projectId uuid.UUID
+	err = tx.QueryRowContext(ctx, query, runId).Scan(&projectId)
+	if err != nil {
+		return nil, fmt.Errorf("error getting project of run: %w", err)
+	}
+
 	// Store the choices
-	err = s.createChatChoices(ctx, tx, id, choices, requestMessages)
+	err = s.createChatChoices(ctx, tx, id, runId, projectId, choices, requestMessages)
 	if err != nil {
 		return nil, fmt.Errorf("error creating chat choices: %w", err)
 	}
 
+	// If the run has been archived, this chat is not in its segment. Marking the
+	// archive stale makes reads include the chat and keeps its month attached
+	// until the run is archived again. This runs after the chat insert so that
+	// it sees an archive that committed while the insert waited on the run lock.
+	query = `UPDATE run_archive SET stale = true WHERE run_id = $1 AND NOT stale`
+	if _, err := tx.ExecContext(ctx, query, runId); err != nil {
+		return nil, fmt.Errorf("error marking run archive stale: %w", err)
+	}
+
 	if err := tx.Commit(); err != nil {
 		return nil, fmt.Errorf("error committing transaction: %w", err)
 	}
@@ -1681,19 +1862,21 @@ func (s *PostgresqlStore) createChatRequestMessages(
 	ctx context.Context,
 	tx *sql.Tx,
 	choiceId uuid.UUID,
+	runId uuid.UUID,
+	projectId uuid.UUID,
 	requestMessages []asteroid.AsteroidMessage,
 ) error {
 	// For each message, store it in the DB
 	for _, message := range requestMessages {
 		query := `
-			INSERT INTO msg (id, choice_id, msg_data)
-			VALUES ($1, $2, $3)
+			INSERT INTO msg (id, choice_id, run_id, project_id, msg_data)
+			VALUES ($1, $2, $3, $4, $5)
 		`
 		msgData, err := json.Marshal(message)
 		if err != nil {
 			return fmt.Errorf("error marshalling message data: %w", err)
 		}
-		_, err = tx.ExecContext(ctx, query, message.Id, choiceId, msgData)
+		_, err = tx.ExecContext(ctx, query, message.Id, choiceId, runId, projectId, msgData)
 		if err != nil {
 			return fmt.Errorf("error creating chat message: %w", err)
 		}
@@ -1741,6 +1924,15 @@ func (s *PostgresqlStore) GetChat(
 	runId uuid.UUID,
 	index int,
 ) ([]byte, []byte, error) {
+	// Archived runs are served from their segment, their partitions may have been detached
+	archive, err := s.getRunArchive(ctx, runId)
+	if err != nil {
+		return nil, nil, err
+	}
+	if archive != nil {
+		return s.getArchivedChat(ctx, runId, archive, index)
+	}
+
 	query := `
 		SELECT request_data, response_data
 		FROM chat
@@ -1750,7 +1942,7 @@ func (s *PostgresqlStore) GetChat(
 	`
 
 	var requestData, responseData []byte
-	err := s.db.QueryRowContext(ctx, query, runId, index).Scan(&requestData, &responseData)
+	err = s.db.QueryRowContext(ctx, query, runId, index).Scan(&requestData, &responseData)
 	if err != nil {
 		return nil, nil, fmt.Errorf("error getting message: %w", err)
 	}
@@ -1759,6 +1951,22 @@ func (s *PostgresqlStore) GetChat(
 }
 
 func (s *PostgresqlStore) GetRunChatCount(ctx context.Context, runId uuid.UUID) (int, error) {
+	archive, err := s.getRunArchive(ctx, runId)
+	if err != nil {
+		return 0, err
+	}
+	if archive != nil {
+		if !archive.stale {
+			return archive.chatCount, nil
+		}
+
+		unarchived, err := s.countUnarchivedChats(ctx, runId)
+		if err != nil {
+			return 0, err
+		}
+		return archive.chatCount + unarchived, nil
+	}
+
 	query := `
 		SELECT COUNT(*) 
 		FROM chat 
@@ -1766,7 +1974,7 @@ func (s *PostgresqlStore) GetRunChatCount(ctx context.Context, runId uuid.UUID)
 	`
 
 	var count int
-	err := s.db.QueryRowContext(ctx, query, runId).Scan(&count)
+	err = s.db.QueryRowContext(ctx, query, runId).Scan(&count)
 	if err != nil {
 		return 0, fmt.Errorf("error getting chat count: %w", err)
 	}
@@ -1778,6 +1986,8 @@ func (s *PostgresqlStore) createChatChoices(
 	ctx context.Context,
 	tx *sql.Tx,
 	chatId uuid.UUID,
+	runId uuid.UUID,
+	projectId uuid.UUID,
 	choices []asteroid.AsteroidChoice,
 	requestMessages []asteroid.AsteroidMessage,
 ) error {
@@ -1805,7 +2015,7 @@ func (s *PostgresqlStore) createChatChoices(
 		}
 
 		// Store the request messages which are unique to the request that generated this choice
-		err = s.createChatRequestMessages(ctx, tx, choiceId, requestMessages)
+		err = s.createChatRequestMessages(ctx, tx, choiceId, runId, projectId, requestMessages)
 		if err != nil {
 			return fmt.Errorf("error creating chat request messages: %w", err)
 		}
@@ -1813,8 +2023,8 @@ func (s *PostgresqlStore) createChatChoices(
 		fmt.Printf("Choice message: %+v\n", choice.Message)
 		// Store the message
 		query = `
-			INSERT INTO msg (id, choice_id, msg_data)
-			VALUES ($1, $2, $3)
+			INSERT INTO msg (id, choice_id, run_id, project_id, msg_data)
+			VALUES ($1, $2, $3, $4, $5)
 		`
 		messageData, err := json.Marshal(choice.Message)
 		if err != nil {
@@ -1826,14 +2036,14 @@ func (s *PostgresqlStore) createChatChoices(
 			return fmt.Errorf("message ID is nil")
 		}
 
-		_, err = tx.ExecContext(ctx, query, *msgId, choice.AsteroidId, messageData)
+		_, err = tx.ExecContext(ctx, query, *msgId, choice.AsteroidId, runId, projectId, messageData)
 		if err != nil {
 			return fmt.Errorf("error creating chat message: %w", err)
 		}
 
 		if choice.Message.ToolCalls != nil {
 			// Store the tool calls
-			err = s.createToolCalls(ctx, tx, *msgId, *choice.Message.ToolCalls)
+			err = s.createToolCalls(ctx, tx, *msgId, runId, projectId, *choice.Message.ToolCalls)
 			if err != nil {
 				return fmt.Errorf("error creating tool calls: %w", err)
 			}
@@ -1847,19 +2057,21 @@ func (s *PostgresqlStore) createToolCalls(
 	ctx context.Context,
 	tx *sql.Tx,
 	msgId uuid.UUID,
+	runId uuid.UUID,
+	projectId uuid.UUID,
 	toolCalls []asteroid.AsteroidToolCall,
 ) error {
 	// Store the tool calls in the DB
 	for _, toolCall := range toolCalls {
 		query := `
-			INSERT INTO toolcall (id, call_id, msg_id, tool_call_data, tool_id)
-			VALUES ($1, $2, $3, $4, $5)
+			INSERT INTO toolcall (id, call_id, msg_id, tool_call_data, tool_id, run_id, project_id)
+			VALUES ($1, $2, $3, $4, $5, $6, $7)
 		`
 		toolCallData, err := json.Marshal(toolCall)
 		if err != nil {
 			return fmt.Errorf("error marshalling tool call data: %w", err)
 		}
-		_, err = tx.ExecContext(ctx, query, toolCall.Id, toolCall.CallId, msgId, toolCallData, toolCall.ToolId)
+		_, err = tx.ExecContext(ctx, query, toolCall.Id, toolCall.CallId, msgId, toolCallData, toolCall.ToolId, runId, projectId)
 		if err != nil {
 			return fmt.Errorf("error creating tool call: %w", err)
 		}
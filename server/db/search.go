@@ -0,0 +1,302 @@
+package database
+
+import (
+	"context"
+	"database/sql"
+	"fmt"
+	"strings"
+	"time"
+
+	asteroid "github.com/asteroidai/asteroid/server"
+	"github.com/google/uuid"
+)
+
+// A search query takes the project ID, the search term, the run ID, then the tool
+// name and decision if toolFilters is set, then the time range [from, to), the
+// created_at and ID of the cursor and the limit, numbered in that order.
+type searchQuery struct {
+	query       string
+	toolFilters bool
+	scan        func(rows *sql.Rows) (asteroid.SearchResult, error)
+}
+
+// The searched tables carry the project_id and run_id of their run, see the
+// comment on msg, toolcall and supervisionresult in schema.sql, so the project,
+// run, time and cursor filters all apply to the searched table itself. For a
+// common term Postgres walks its (project_id, created_at DESC, id DESC) index
+// from the cursor and stops once it has found limit matches; for a rare term it
+// intersects the project with the trigram matches in the (project_id, text) GIN
+// index. pg_trgm estimates the selectivity of the ILIKE pattern, which is what
+// picks between the two. The remaining joins only fetch the columns of the
+// returned rows. lib/pq sends each query with its arguments in an unnamed
+// statement, which is planned for those arguments, so the "$n IS NULL OR"
+// filters that are not set fold away.
+var searchQueries = map[asteroid.SearchProjectParamsType]searchQuery{
+	asteroid.SearchProjectParamsTypeToolCall: {
+		query: `
+			SELECT tc.id, tc.run_id, r.task_id, tc.created_at, tc.tool_call_data->>'arguments', tl.id, tl.name
+			FROM toolcall tc
+			JOIN tool tl ON tl.id = tc.tool_id
+			JOIN run r ON r.id = tc.run_id
+			WHERE tc.project_id = $1
+			AND tc.tool_call_data->>'arguments' ILIKE $2
+			AND ($3::uuid IS NULL OR tc.run_id = $3)
+			AND ($4::text IS NULL OR tl.name = $4)
+			AND ($5::text IS NULL OR EXISTS (
+				SELECT 1
+				FROM chainexecution ce
+				JOIN supervisionrequest sr ON sr.chainexecution_id = ce.id
+				JOIN supervisionresult res ON res.supervisionrequest_id = sr.id
+				WHERE ce.toolcall_id = tc.id AND res.decision = $5
+			))
+			AND ($6::timestamptz IS NULL OR tc.created_at >= $6)
+			AND ($7::timestamptz IS NULL OR tc.created_at < $7)
+			AND ($8::timestamptz IS NULL OR (tc.created_at, tc.id) < ($8, $9::uuid))
+			ORDER BY tc.created_at DESC, tc.id DESC
+			LIMIT $10`,
+		toolFilters: true,
+		scan:        scanToolCallSearchResult,
+	},
+	asteroid.SearchProjectParamsTypeMessage: {
+		query: `
+			SELECT m.id, m.run_id, r.task_id, m.created_at, m.msg_data->>'content'
+			FROM msg m
+			JOIN run r ON r.id = m.run_id
+			WHERE m.project_id = $1
+			AND m.msg_data->>'content' ILIKE $2
+			AND ($3::uuid IS NULL OR m.run_id = $3)
+			AND ($4::timestamptz IS NULL OR m.created_at >= $4)
+			AND ($5::timestamptz IS NULL OR m.created_at < $5)
+			AND ($6::timestamptz IS NULL OR (m.created_at, m.id) < ($6, $7::uuid))
+			ORDER BY m.created_at DESC, m.id DESC
+			LIMIT $8`,
+		scan: scanMessageSearchResult,
+	},
+	asteroid.SearchProjectParamsTypeSupervision: {
+		query: `
+			SELECT res.id, res.run_id, r.task_id, res.created_at, res.reasoning, tl.id, tl.name, tc.id, res.decision
+			FROM supervisionresult res
+			JOIN supervisionrequest sr ON sr.id = res.supervisionrequest_id
+			JOIN chainexecution ce ON ce.id = sr.chainexecution_id
+			JOIN toolcall tc ON tc.id = ce.toolcall_id
+			JOIN tool tl ON tl.id = tc.tool_id
+			JOIN run r ON r.id = res.run_id
+			WHERE res.project_id = $1
+			AND res.reasoning ILIKE $2
+			AND ($3::uuid IS NULL OR res.run_id = $3)
+			AND ($4::text IS NULL OR tl.name = $4)
+			AND ($5::text IS NULL OR res.decision = $5)
+			AND ($6::timestamptz IS NULL OR res.created_at >= $6)
+			AND ($7::timestamptz IS NULL OR res.created_at < $7)
+			AND ($8::timestamptz IS NULL OR (res.created_at, res.id) < ($8, $9::uuid))
+			ORDER BY res.created_at DESC, res.id DESC
+			LIMIT $10`,
+		toolFilters: true,
+		scan:        scanSupervisionSearchResult,
+	},
+}
+
+// sqliteSearchQueries are the searchQueries of the SQLite store. The search term
+// is an FTS5 phrase matched against the trigram tables of sqlite_schema.sql.
+var sqliteSearchQueries = map[asteroid.SearchProjectParamsType]searchQuery{
+	asteroid.SearchProjectParamsTypeToolCall: {
+		query: `
+			SELECT tc.id, r.id, r.task_id, tc.created_at, toolcall_search.arguments, tl.id, tl.name
+			FROM toolcall_search
+			JOIN toolcall tc ON tc.id = toolcall_search.id
+			JOIN tool tl ON tl.id = tc.tool_id
+			JOIN run r ON r.id = tl.run_id
+			JOIN task t ON t.id = r.task_id
+			WHERE t.project_id = ?1
+			AND toolcall_search MATCH ?2
+			AND (?3 IS NULL OR r.id = ?3)
+			AND (?4 IS NULL OR tl.name = ?4)
+			AND (?5 IS NULL OR EXISTS (
+				SELECT 1
+				FROM chainexecution ce
+				JOIN supervisionrequest sr ON sr.chainexecution_id = ce.id
+				JOIN supervisionresult res ON res.supervisionrequest_id = sr.id
+				WHERE ce.toolcall_id = tc.id AND res.decision = ?5
+			))
+			AND (?6 IS NULL OR tc.created_at >= ?6)
+			AND (?7 IS NULL OR tc.created_at < ?7)
+			AND (?8 IS NULL OR (tc.created_at, tc.id) < (?8, ?9))
+			ORDER BY tc.created_at DESC, tc.id DESC
+			LIMIT ?10`,
+		toolFilters: true,
+		scan:        scanToolCallSearchResult,
+	},
+	asteroid.SearchProjectParamsTypeMessage: {
+		query: `
+			SELECT m.id, r.id, r.task_id, m.created_at, msg_search.content
+			FROM msg_search
+			JOIN msg m ON m.id = msg_search.id
+			JOIN choice c ON c.id = m.choice_id
+			JOIN chat ch ON ch.id = c.chat_id
+			JOIN run r ON r.id = ch.run_id
+			JOIN task t ON t.id = r.task_id
+			WHERE t.project_id = ?1
+			AND msg_search MATCH ?2
+			AND (?3 IS NULL OR r.id = ?3)
+			AND (?4 IS NULL OR m.created_at >= ?4)
+			AND (?5 IS NULL OR m.created_at < ?5)
+			AND (?6 IS NULL OR (m.created_at, m.id) < (?6, ?7))
+			ORDER BY m.created_at DESC, m.id DESC
+			LIMIT ?8`,
+		scan: scanMessageSearchResult,
+	},
+	asteroid.SearchProjectParamsTypeSupervision: {
+		query: `
+			SELECT res.id, r.id, r.task_id, res.created_at, res.reasoning, tl.id, tl.name, tc.id, res.decision
+			FROM supervisionresult_search
+			JOIN supervisionresult res ON res.id = supervisionresult_search.id
+			JOIN supervisionrequest sr ON sr.id = res.supervisionrequest_id
+			JOIN chainexecution ce ON ce.id = sr.chainexecution_id
+			JOIN toolcall tc ON tc.id = ce.toolcall_id
+			JOIN tool tl ON tl.id = tc.tool_id
+			JOIN run r ON r.id = tl.run_id
+			JOIN task t ON t.id = r.task_id
+			WHERE t.project_id = ?1
+			AND supervisionresult_search MATCH ?2
+			AND (?3 IS NULL OR r.id = ?3)
+			AND (?4 IS NULL OR tl.name = ?4)
+			AND (?5 IS NULL OR res.decision = ?5)
+			AND (?6 IS NULL OR res.created_at >= ?6)
+			AND (?7 IS NULL OR res.created_at < ?7)
+			AND (?8 IS NULL OR (res.created_at, res.id) < (?8, ?9))
+			ORDER BY res.created_at DESC, res.id DESC
+			LIMIT ?10`,
+		toolFilters: true,
+		scan:        scanSupervisionSearchResult,
+	},
+}
+
+func scanToolCallSearchResult(rows *sql.Rows) (asteroid.SearchResult, error) {
+	result := asteroid.SearchResult{Type: asteroid.SearchResultTypeToolCall}
+	err := rows.Scan(&result.Id, &result.RunId, &result.TaskId, &result.CreatedAt, &result.Text, &result.ToolId, &result.ToolName)
+	return result, err
+}
+
+func scanMessageSearchResult(rows *sql.Rows) (asteroid.SearchResult, error) {
+	result := asteroid.SearchResult{Type: asteroid.SearchResultTypeMessage}
+	err := rows.Scan(&result.Id, &result.RunId, &result.TaskId, &result.CreatedAt, &result.Text)
+	return result, err
+}
+
+func scanSupervisionSearchResult(rows *sql.Rows) (asteroid.SearchResult, error) {
+	result := asteroid.SearchResult{Type: asteroid.SearchResultTypeSupervision}
+	err := rows.Scan(
+		&result.Id,
+		&result.RunId,
+		&result.TaskId,
+		&result.CreatedAt,
+		&result.Text,
+		&result.ToolId,
+		&result.ToolName,
+		&result.ToolCallId,
+		&result.Decision,
+	)
+	return result, err
+}
+
+// searchArgs returns the arguments of q, see searchQuery
+func searchArgs(
+	q searchQuery,
+	projectId uuid.UUID,
+	term string,
+	params asteroid.SearchProjectParams,
+	from *time.Time,
+	to *time.Time,
+	after *asteroid.SearchCursor,
+	limit int,
+) []interface{} {
+	args := []interface{}{projectId, term, params.RunId}
+	if q.toolFilters {
+		args = append(args, params.Tool, params.Decision)
+	}
+
+	var afterTime *time.Time
+	var afterId *uuid.UUID
+	if after != nil {
+		afterTime = &after.CreatedAt
+		afterId = &after.Id
+	}
+
+	return append(args, from, to, afterTime, afterId, limit)
+}
+
+func searchRows(ctx context.Context, db *sql.DB, q searchQuery, args []interface{}) ([]asteroid.SearchResult, error) {
+	rows, err := db.QueryContext(ctx, q.query, args...)
+	if err != nil {
+		return nil, fmt.Errorf("error querying search results: %w", err)
+	}
+	defer rows.Close()
+
+	var results []asteroid.SearchResult
+	for rows.Next() {
+		result, err := q.scan(rows)
+		if err != nil {
+			return nil, fmt.Errorf("error scanning search result: %w", err)
+		}
+		results = append(results, result)
+	}
+
+	if err := rows.Err(); err != nil {
+		return nil, fmt.Errorf("error iterating search results: %w", err)
+	}
+
+	return results, nil
+}
+
+// likeEscaper escapes the LIKE wildcards of a search term, so it matches literally
+var likeEscaper = strings.NewReplacer(`\`, `\\`, `%`, `\%`, `_`, `\_`)
+
+func (s *PostgresqlStore) SearchProject(
+	ctx context.Context,
+	projectId uuid.UUID,
+	params asteroid.SearchProjectParams,
+	after *asteroid.SearchCursor,
+	limit int,
+) ([]asteroid.SearchResult, error) {
+	q, ok := searchQueries[params.Type]
+	if !ok {
+		return nil, fmt.Errorf("unknown search type %q", params.Type)
+	}
+
+	term := "%" + likeEscaper.Replace(params.Q) + "%"
+	args := searchArgs(q, projectId, term, params, params.From, params.To, after, limit)
+
+	return searchRows(ctx, s.db, q, args)
+}
+
+func (s *SqliteStore) SearchProject(
+	ctx context.Context,
+	projectId uuid.UUID,
+	params asteroid.SearchProjectParams,
+	after *asteroid.SearchCursor,
+	limit int,
+) ([]asteroid.SearchResult, error) {
+	q, ok := sqliteSearchQueries[params.Type]
+	if !ok {
+		return nil, fmt.Errorf("unknown search type %q", params.Type)
+	}
+
+	// Quoted as a single FTS5 phrase, which the trigram tokenizer matches as a
+	// case insensitive substring
+	term := `"` + strings.ReplaceAll(params.Q, `"`, `""`) + `"`
+
+	var from, to *time.Time
+	if params.From != nil {
+		t := sqliteTime(*params.From)
+		from = &t
+	}
+	if params.To != nil {
+		t := sqliteTime(*params.To)
+		to = &t
+	}
+	if after != nil {
+		after = &asteroid.SearchCursor{CreatedAt: sqliteTime(after.CreatedAt), Id: after.Id}
+	}
+
+	return searchRows(ctx, s.db, q, searchArgs(q, projectId, term, params, from, to, after, limit))
+}
@@ -0,0 +1,389 @@
+package database
+
+import (
+	"context"
+	"fmt"
+	"path/filepath"
+	"testing"
+	"time"
+
+	asteroid "github.com/asteroidai/asteroid/server"
+	"github.com/google/uuid"
+)
+
+// searchAll pages through every result of params, limit at a time, the way the
+// search handler does, and returns them in order
+func searchAll(t *testing.T, store asteroid.Store, projectId uuid.UUID, params asteroid.SearchProjectParams, limit int) []asteroid.SearchResult {
+	t.Helper()
+
+	all := make([]asteroid.SearchResult, 0)
+	var after *asteroid.SearchCursor
+	for page := 0; ; page++ {
+		if page > 100 {
+			t.Fatal("search did not terminate")
+		}
+
+		results, err := store.SearchProject(context.Background(), projectId, params, after, limit+1)
+		if err != nil {
+			t.Fatalf("error searching: %v", err)
+		}
+
+		if len(results) <= limit {
+			return append(all, results...)
+		}
+
+		all = append(all, results[:limit]...)
+		last := results[limit-1]
+		after = &asteroid.SearchCursor{CreatedAt: last.CreatedAt, Id: last.Id}
+	}
+}
+
+func resultIds(results []asteroid.SearchResult) map[uuid.UUID]bool {
+	ids := make(map[uuid.UUID]bool)
+	for _, result := range results {
+		ids[result.Id] = true
+	}
+	return ids
+}
+
+// checkOrder checks that results are newest first, by created_at then ID
+func checkOrder(t *testing.T, results []asteroid.SearchResult) {
+	t.Helper()
+
+	for i := 1; i < len(results); i++ {
+		prev, cur := results[i-1], results[i]
+		if cur.CreatedAt.After(prev.CreatedAt) {
+			t.Errorf("result %d is newer than result %d", i, i-1)
+		}
+		if cur.CreatedAt.Equal(prev.CreatedAt) && cur.Id.String() >= prev.Id.String() {
+			t.Errorf("results %d and %d with the same created_at are not ordered by ID", i-1, i)
+		}
+	}
+}
+
+func TestSearchToolCallsPaging(t *testing.T) {
+	forEachStore(t, func(t *testing.T, store asteroid.Store) {
+		f := newFixture(t, store)
+
+		// All tool calls of a chat share their created_at, so pages split ties
+		ids := createToolCalls(t, store, f.runId, f.toolId,
+			`{"cmd": "sudo apt install curl"}`,
+			`{"cmd": "sudo rm -rf /var/cache"}`,
+			`{"cmd": "SUDO reboot"}`,
+			`{"cmd": "ls -la"}`,
+			`{"cmd": "sudo -i"}`,
+			`{"cmd": "echo sudo"}`,
+		)
+		later := createToolCalls(t, store, f.runId, f.toolId, `{"cmd": "sudo whoami"}`)
+
+		want := map[uuid.UUID]bool{ids[0]: true, ids[1]: true, ids[2]: true, ids[4]: true, ids[5]: true, later[0]: true}
+
+		params := asteroid.SearchProjectParams{Q: "sudo", Type: asteroid.SearchProjectParamsTypeToolCall}
+		for _, limit := range []int{1, 2, 4, 10} {
+			results := searchAll(t, store, f.projectId, params, limit)
+
+			if len(results) != len(want) {
+				t.Errorf("limit %d: expected %d results, got %d", limit, len(want), len(results))
+			}
+			got := resultIds(results)
+			for id := range want {
+				if !got[id] {
+					t.Errorf("limit %d: missing tool call %s", limit, id)
+				}
+			}
+			checkOrder(t, results)
+
+			if len(results) > 0 && results[0].Id != later[0] {
+				t.Errorf("limit %d: expected the newest tool call first", limit)
+			}
+		}
+
+		results := searchAll(t, store, f.projectId, params, 10)
+		for _, result := range results {
+			if result.Type != asteroid.SearchResultTypeToolCall || result.RunId != f.runId || result.TaskId != f.taskId {
+				t.Errorf("unexpected result %+v", result)
+			}
+			if result.ToolId == nil || *result.ToolId != f.toolId || result.ToolName == nil || *result.ToolName != "bash" {
+				t.Errorf("expected the bash tool, got %+v", result)
+			}
+			if result.Id == ids[2] && result.Text != `{"cmd": "SUDO reboot"}` {
+				t.Errorf("expected the tool call arguments as text, got %q", result.Text)
+			}
+		}
+	})
+}
+
+func TestSearchFilters(t *testing.T) {
+	forEachStore(t, func(t *testing.T, store asteroid.Store) {
+		f := newFixture(t, store)
+
+		emailToolId := createTool(t, store, f.runId, "send_email")
+		emailChainId := createChain(t, store, emailToolId, f.supervisorId)
+
+		email := createToolCalls(t, store, f.runId, emailToolId, `{"to": "alice@example.com"}`)[0]
+		bash := createToolCalls(t, store, f.runId, f.toolId, `{"cmd": "mail alice@example.com"}`)[0]
+
+		rejected := createToolCalls(t, store, f.runId, f.toolId, `{"cmd": "sudo rm -rf /"}`)[0]
+		approved := createToolCalls(t, store, f.runId, f.toolId, `{"cmd": "sudo ls"}`)[0]
+		now := time.Now()
+		supervise(t, store, f.chainId, f.supervisorId, rejected, asteroid.Reject, "needs privilege escalation", now)
+		supervise(t, store, f.chainId, f.supervisorId, approved, asteroid.Approve, "harmless privilege use", now)
+		supervise(t, store, emailChainId, f.supervisorId, email, asteroid.Reject, "privilege to email externally", now)
+
+		otherRunId := createRun(t, store, f.taskId, now)
+		otherToolId := createTool(t, store, otherRunId, "bash")
+		other := createToolCalls(t, store, otherRunId, otherToolId, `{"cmd": "sudo ls"}`)[0]
+
+		tool := "send_email"
+		reject := asteroid.Reject
+		future := time.Now().Add(time.Hour)
+
+		tests := []struct {
+			name   string
+			params asteroid.SearchProjectParams
+			want   []uuid.UUID
+		}{
+			{
+				name:   "tool",
+				params: asteroid.SearchProjectParams{Q: "alice@example.com", Type: asteroid.SearchProjectParamsTypeToolCall, Tool: &tool},
+				want:   []uuid.UUID{email},
+			},
+			{
+				name:   "no tool",
+				params: asteroid.SearchProjectParams{Q: "alice@example.com", Type: asteroid.SearchProjectParamsTypeToolCall},
+				want:   []uuid.UUID{email, bash},
+			},
+			{
+				name:   "decision",
+				params: asteroid.SearchProjectParams{Q: "sudo", Type: asteroid.SearchProjectParamsTypeToolCall, Decision: &reject},
+				want:   []uuid.UUID{rejected},
+			},
+			{
+				name:   "run",
+				params: asteroid.SearchProjectParams{Q: "sudo ls", Type: asteroid.SearchProjectParamsTypeToolCall, RunId: &otherRunId},
+				want:   []uuid.UUID{other},
+			},
+			{
+				name:   "from",
+				params: asteroid.SearchProjectParams{Q: "sudo", Type: asteroid.SearchProjectParamsTypeToolCall, From: &future},
+				want:   []uuid.UUID{},
+			},
+			{
+				name:   "to",
+				params: asteroid.SearchProjectParams{Q: "sudo ls", Type: asteroid.SearchProjectParamsTypeToolCall, To: &future},
+				want:   []uuid.UUID{approved, other},
+			},
+		}
+
+		for _, tt := range tests {
+			t.Run(tt.name, func(t *testing.T) {
+				got := resultIds(searchAll(t, store, f.projectId, tt.params, 10))
+				if len(got) != len(tt.want) {
+					t.Errorf("expected %d results, got %d", len(tt.want), len(got))
+				}
+				for _, id := range tt.want {
+					if !got[id] {
+						t.Errorf("missing tool call %s", id)
+					}
+				}
+			})
+		}
+
+		// Supervisions are found by their reasoning and filtered on decision and tool
+		supervisions := searchAll(t, store, f.projectId, asteroid.SearchProjectParams{
+			Q:        "privilege",
+			Type:     asteroid.SearchProjectParamsTypeSupervision,
+			Decision: &reject,
+		}, 10)
+		if len(supervisions) != 2 {
+			t.Fatalf("expected 2 rejections, got %d", len(supervisions))
+		}
+		for _, result := range supervisions {
+			if result.Decision == nil || *result.Decision != asteroid.Reject {
+				t.Errorf("expected a rejection, got %+v", result)
+			}
+		}
+
+		supervisions = searchAll(t, store, f.projectId, asteroid.SearchProjectParams{
+			Q:        "privilege",
+			Type:     asteroid.SearchProjectParamsTypeSupervision,
+			Decision: &reject,
+			Tool:     &tool,
+		}, 10)
+		if len(supervisions) != 1 || supervisions[0].ToolCallId == nil || *supervisions[0].ToolCallId != email {
+			t.Errorf("expected the rejection of the email, got %+v", supervisions)
+		}
+	})
+}
+
+func TestSearchSupervisionsPaging(t *testing.T) {
+	forEachStore(t, func(t *testing.T, store asteroid.Store) {
+		f := newFixture(t, store)
+
+		// Results recorded with the same created_at
+		createdAt := time.Now().Truncate(time.Microsecond)
+		toolCallIds := createToolCalls(t, store, f.runId, f.toolId, `{"cmd": "a"}`, `{"cmd": "b"}`, `{"cmd": "c"}`)
+		for _, toolCallId := range toolCallIds {
+			supervise(t, store, f.chainId, f.supervisorId, toolCallId, asteroid.Escalate, "Needs a human to look", createdAt)
+		}
+
+		params := asteroid.SearchProjectParams{Q: "needs a human", Type: asteroid.SearchProjectParamsTypeSupervision}
+		for _, limit := range []int{1, 2} {
+			results := searchAll(t, store, f.projectId, params, limit)
+			if len(results) != 3 {
+				t.Fatalf("limit %d: expected 3 results, got %d", limit, len(results))
+			}
+			if len(resultIds(results)) != 3 {
+				t.Errorf("limit %d: expected distinct results, got %+v", limit, results)
+			}
+			checkOrder(t, results)
+
+			for _, result := range results {
+				if !result.CreatedAt.Equal(createdAt) {
+					t.Errorf("expected created_at %v, got %v", createdAt, result.CreatedAt)
+				}
+			}
+		}
+	})
+}
+
+func TestSearchMessages(t *testing.T) {
+	forEachStore(t, func(t *testing.T, store asteroid.Store) {
+		f := newFixture(t, store)
+
+		createChat(t, store, f.runId, `{"messages": []}`, "The password is Hunter2, keep it safe", nil)
+		createChat(t, store, f.runId, `{"messages": []}`, "Nothing to see here", nil)
+
+		results := searchAll(t, store, f.projectId, asteroid.SearchProjectParams{
+			Q:    "hunter2",
+			Type: asteroid.SearchProjectParamsTypeMessage,
+		}, 10)
+		if len(results) != 1 {
+			t.Fatalf("expected 1 message, got %d", len(results))
+		}
+		if results[0].Text != "The password is Hunter2, keep it safe" || results[0].RunId != f.runId {
+			t.Errorf("unexpected result %+v", results[0])
+		}
+
+		// Searches are scoped to the project
+		other := newFixture(t, store)
+		results = searchAll(t, store, other.projectId, asteroid.SearchProjectParams{
+			Q:    "hunter2",
+			Type: asteroid.SearchProjectParamsTypeMessage,
+		}, 10)
+		if len(results) != 0 {
+			t.Errorf("expected no results in another project, got %d", len(results))
+		}
+	})
+}
+
+func TestSqliteSearchMigration(t *testing.T) {
+	ctx := context.Background()
+	path := filepath.Join(t.TempDir(), "test.db")
+
+	store, err := NewSqliteStore(path)
+	if err != nil {
+		t.Fatalf("error opening sqlite store: %v", err)
+	}
+
+	f := newFixture(t, store)
+	ids := createToolCalls(t, store, f.runId, f.toolId, `{"cmd": "sudo ls"}`)
+
+	var version int
+	if err := store.db.QueryRowContext(ctx, "PRAGMA user_version").Scan(&version); err != nil {
+		t.Fatalf("error getting schema version: %v", err)
+	}
+	if version != len(sqliteMigrations) {
+		t.Errorf("expected schema version %d, got %d", len(sqliteMigrations), version)
+	}
+
+	// Drop the tool call from the index, as if it was written before search existed
+	_, err = store.db.ExecContext(ctx, "DELETE FROM toolcall_search; PRAGMA user_version = 0")
+	if err != nil {
+		t.Fatalf("error resetting search index: %v", err)
+	}
+	store.Close()
+
+	params := asteroid.SearchProjectParams{Q: "sudo", Type: asteroid.SearchProjectParamsTypeToolCall}
+	for i := 0; i < 2; i++ {
+		store, err = NewSqliteStore(path)
+		if err != nil {
+			t.Fatalf("error reopening sqlite store: %v", err)
+		}
+
+		// The migration indexes the tool call once, and is not applied again
+		results := searchAll(t, store, f.projectId, params, 10)
+		if len(results) != 1 || results[0].Id != ids[0] {
+			t.Errorf("open %d: expected the tool call to be found once, got %+v", i, results)
+		}
+		store.Close()
+	}
+}
+
+// BenchmarkSearchProject measures a search page in one project among several
+// of the same size, for a term in every tool call and a term in one in a
+// thousand, from the first page and from a cursor deep in the results, with a
+// sub-benchmark per store as in BenchmarkSuperviseToolCall. On Postgres, run
+// EXPLAIN ANALYZE on the searchQueries against the same data to see which index
+// a term uses.
+func BenchmarkSearchProject(b *testing.B) {
+	const (
+		projects         = 4
+		chatsPerProject  = 50
+		toolCallsPerChat = 100
+		limit            = 50
+	)
+
+	for _, s := range testStores(b) {
+		b.Run("store="+s.name, func(b *testing.B) {
+			fixtures := make([]fixture, projects)
+			for p := range fixtures {
+				fixtures[p] = newFixture(b, s.store)
+
+				for c := 0; c < chatsPerProject; c++ {
+					arguments := make([]string, toolCallsPerChat)
+					for i := range arguments {
+						n := c*toolCallsPerChat + i
+						if n%1000 == 0 {
+							arguments[i] = fmt.Sprintf(`{"cmd": "sudo ls /tmp/%d"}`, n)
+						} else {
+							arguments[i] = fmt.Sprintf(`{"cmd": "ls /tmp/%d"}`, n)
+						}
+					}
+					createToolCalls(b, s.store, fixtures[p].runId, fixtures[p].toolId, arguments...)
+				}
+			}
+			f := fixtures[0]
+
+			// The cursor half way through the project's tool calls
+			half, err := s.store.SearchProject(
+				context.Background(),
+				f.projectId,
+				asteroid.SearchProjectParams{Q: "/tmp/", Type: asteroid.SearchProjectParamsTypeToolCall},
+				nil,
+				chatsPerProject*toolCallsPerChat/2,
+			)
+			if err != nil || len(half) == 0 {
+				b.Fatalf("error searching: %v", err)
+			}
+			deep := &asteroid.SearchCursor{CreatedAt: half[len(half)-1].CreatedAt, Id: half[len(half)-1].Id}
+
+			for _, term := range []struct{ name, q string }{{"common", "/tmp/"}, {"rare", "sudo"}} {
+				params := asteroid.SearchProjectParams{Q: term.q, Type: asteroid.SearchProjectParamsTypeToolCall}
+
+				for _, page := range []struct {
+					name  string
+					after *asteroid.SearchCursor
+				}{{"first", nil}, {"deep", deep}} {
+					b.Run(term.name+"/"+page.name, func(b *testing.B) {
+						for i := 0; i < b.N; i++ {
+							if _, err := s.store.SearchProject(context.Background(), f.projectId, params, page.after, limit); err != nil {
+								b.Fatalf("error searching: %v", err)
+							}
+						}
+					})
+				}
+			}
+		})
+	}
+}
@@ -0,0 +1,1632 @@
+package database
+
+import (
+	"context"
+	"database/sql"
+	_ "embed"
+	"encoding/json"
+	"errors"
+	"fmt"
+	"time"
+
+	asteroid "github.com/asteroidai/asteroid/server"
+	"github.com/google/uuid"
+	_ "modernc.org/sqlite"
+)
+
+//go:embed sqlite_schema.sql
+var sqliteSchema string
+
+// sqlitePragmas are applied to every connection. WAL lets readers run alongside
+// the single writer, and synchronous=NORMAL only syncs the WAL at checkpoints,
+// so a commit is an append to the WAL instead of an fsync per transaction.
+// Write transactions take the write lock up front (_txlock=immediate) so that
+// concurrent writers queue on busy_timeout instead of failing on lock upgrade.
+const sqlitePragmas = "_pragma=journal_mode(WAL)" +
+	"&_pragma=synchronous(NORMAL)" +
+	"&_pragma=foreign_keys(ON)" +
+	"&_pragma=busy_timeout(5000)" +
+	"&_txlock=immediate"
+
+type SqliteStore struct {
+	db *sql.DB
+}
+
+// Check if SqliteStore implements asteroid.Store
+var _ asteroid.Store = &SqliteStore{}
+
+// sqliteQuerier is satisfied by both *sql.DB and *sql.Tx, so that helpers used
+// inside a write transaction read through the connection holding the write lock
+type sqliteQuerier interface {
+	QueryContext(ctx context.Context, query string, args ...interface{}) (*sql.Rows, error)
+}
+
+// NewSqliteStore opens, and creates if needed, the embedded SQLite store at path
+func NewSqliteStore(path string) (*SqliteStore, error) {
+	db, err := sql.Open("sqlite", fmt.Sprintf("file:%s?%s", path, sqlitePragmas))
+	if err != nil {
+		return nil, fmt.Errorf("error opening database: %w", err)
+	}
+
+	if err := db.Ping(); err != nil {
+		return nil, fmt.Errorf("error connecting to the database: %w", err)
+	}
+
+	if _, err := db.Exec(sqliteSchema); err != nil {
+		db.Close()
+		return nil, fmt.Errorf("error creating schema: %w", err)
+	}
+
+	if err := migrateSqlite(db); err != nil {
+		db.Close()
+		return nil, fmt.Errorf("error migrating database: %w", err)
+	}
+
+	return &SqliteStore{db: db}, nil
+}
+
+// sqliteMigrations are statements that have to run once on an existing database,
+// in order, after the schema has been applied. Unlike the schema they may scan
+// whole tables, so the number applied is kept in PRAGMA user_version and they
+// are skipped on later starts.
+var sqliteMigrations = []string{
+	// Index the rows written before project search was added
+	`
+	INSERT INTO toolcall_search (id, arguments)
+	SELECT id, json_extract(tool_call_data, '$.arguments')
+	FROM toolcall
+	WHERE id NOT IN (SELECT id FROM toolcall_search);
+
+	INSERT INTO msg_search (id, content)
+	SELECT id, json_extract(msg_data, '$.content')
+	FROM msg
+	WHERE id NOT IN (SELECT id FROM msg_search);
+
+	INSERT INTO supervisionresult_search (id, reasoning)
+	SELECT id, reasoning
+	FROM supervisionresult
+	WHERE id NOT IN (SELECT id FROM supervisionresult_search);`,
+}
+
+// migrateSqlite applies the migrations the database has not had yet. The write
+// transaction is taken up front, so concurrent starts apply them only once.
+func migrateSqlite(db *sql.DB) error {
+	tx, err := db.Begin()
+	if err != nil {
+		return fmt.Errorf("error starting transaction: %w", err)
+	}
+	defer func() { _ = tx.Rollback() }()
+
+	var version int
+	if err := tx.QueryRow("PRAGMA user_version").Scan(&version); err != nil {
+		return fmt.Errorf("error getting schema version: %w", err)
+	}
+	if version >= len(sqliteMigrations) {
+		return nil
+	}
+
+	for i := version; i < len(sqliteMigrations); i++ {
+		if _, err := tx.Exec(sqliteMigrations[i]); err != nil {
+			return fmt.Errorf("error applying migration %d: %w", i+1, err)
+		}
+	}
+
+	// PRAGMA does not take parameters, the version is formatted in
+	if _, err := tx.Exec(fmt.Sprintf("PRAGMA user_version = %d", len(sqliteMigrations))); err != nil {
+		return fmt.Errorf("error setting schema version: %w", err)
+	}
+
+	if err := tx.Commit(); err != nil {
+		return fmt.Errorf("error committing transaction: %w", err)
+	}
+
+	return nil
+}
+
+// Close closes the database connection
+func (s *SqliteStore) Close() error {
+	return s.db.Close()
+}
+
+// sqliteTime normalises timestamps to UTC. Timestamps are stored as text, so
+// they only sort chronologically when they share an offset.
+func sqliteTime(t time.Time) time.Time {
+	return t.UTC()
+}
+
+func marshalStrings(values []string) ([]byte, error) {
+	if values == nil {
+		values = []string{}
+	}
+	return json.Marshal(values)
+}
+
+func unmarshalStrings(data []byte) ([]string, error) {
+	values := make([]string, 0)
+	if len(data) == 0 {
+		return values, nil
+	}
+	if err := json.Unmarshal(data, &values); err != nil {
+		return nil, err
+	}
+	return values, nil
+}
+
+// ProjectStore implementation
+func (s *SqliteStore) CreateProject(ctx context.Context, project asteroid.Project) error {
+	query := `
+		INSERT INTO project (id, name, created_at, run_result_tags)
+		VALUES (?, ?, ?, ?)`
+
+	tags, err := marshalStrings(project.RunResultTags)
+	if err != nil {
+		return fmt.Errorf("error marshalling run result tags: %w", err)
+	}
+
+	_, err = s.db.ExecContext(ctx, query, project.Id, project.Name, sqliteTime(project.CreatedAt), string(tags))
+	if err != nil {
+		return fmt.Errorf("error creating project: %w", err)
+	}
+
+	return nil
+}
+
+func (s *SqliteStore) scanProject(row interface{ Scan(...interface{}) error }) (*asteroid.Project, error) {
+	var project asteroid.Project
+	var tags []byte
+	if err := row.Scan(&project.Id, &project.Name, &project.CreatedAt, &tags); err != nil {
+		return nil, err
+	}
+
+	runResultTags, err := unmarshalStrings(tags)
+	if err != nil {
+		return nil, fmt.Errorf("error parsing run result tags: %w", err)
+	}
+	project.RunResultTags = runResultTags
+
+	return &project, nil
+}
+
+func (s *SqliteStore) GetProject(ctx context.Context, id uuid.UUID) (*asteroid.Project, error) {
+	query := `
+		SELECT id, name, created_at, run_result_tags
+		FROM project
+		WHERE id = ?`
+
+	project, err := s.scanProject(s.db.QueryRowContext(ctx, query, id))
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("error getting project: %w", err)
+	}
+
+	return project, nil
+}
+
+func (s *SqliteStore) GetProjectFromName(ctx context.Context, name string) (*asteroid.Project, error) {
+	query := `
+		SELECT id, name, created_at, run_result_tags
+		FROM project
+		WHERE name = ?`
+
+	project, err := s.scanProject(s.db.QueryRowContext(ctx, query, name))
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("error getting project: %w", err)
+	}
+
+	return project, nil
+}
+
+func (s *SqliteStore) GetProjects(ctx context.Context) ([]asteroid.Project, error) {
+	query := `
+		SELECT id, name, created_at, run_result_tags
+		FROM project
+		ORDER BY created_at DESC`
+
+	rows, err := s.db.QueryContext(ctx, query)
+	if err != nil {
+		return nil, fmt.Errorf("error listing projects: %w", err)
+	}
+	defer rows.Close()
+
+	projects := make([]asteroid.Project, 0)
+	for rows.Next() {
+		project, err := s.scanProject(rows)
+		if err != nil {
+			return nil, fmt.Errorf("error scanning project: %w", err)
+		}
+		projects = append(projects, *project)
+	}
+
+	return projects, nil
+}
+
+// TaskStore implementation
+func (s *SqliteStore) CreateTask(ctx context.Context, task asteroid.Task) (*uuid.UUID, error) {
+	// First check if a task with the same values already exists
+	query := `
+		SELECT id
+		FROM task
+		WHERE project_id = ?
+		AND name = ?
+		AND description = ?`
+
+	var existingId uuid.UUID
+	err := s.db.QueryRowContext(ctx, query, task.ProjectId, task.Name, task.Description).Scan(&existingId)
+	if err != nil && !errors.Is(err, sql.ErrNoRows) {
+		return nil, fmt.Errorf("error checking for existing task: %w", err)
+	}
+	if err == nil {
+		// Task already exists, return its ID
+		return &existingId, nil
+	}
+
+	id := uuid.New()
+	query = `
+		INSERT INTO task (id, project_id, name, description, created_at)
+		VALUES (?, ?, ?, ?, ?)`
+
+	_, err = s.db.ExecContext(ctx, query, id, task.ProjectId, task.Name, task.Description, sqliteTime(task.CreatedAt))
+	if err != nil {
+		return nil, fmt.Errorf("error creating task: %w", err)
+	}
+
+	return &id, nil
+}
+
+func (s *SqliteStore) GetTask(ctx context.Context, id uuid.UUID) (*asteroid.Task, error) {
+	query := `
+		SELECT id, project_id, name, description, created_at
+		FROM task
+		WHERE id = ?`
+
+	var task asteroid.Task
+	err := s.db.QueryRowContext(ctx, query, id).Scan(&task.Id, &task.ProjectId, &task.Name, &task.Description, &task.CreatedAt)
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("error getting task: %w", err)
+	}
+
+	return &task, nil
+}
+
+func (s *SqliteStore) GetProjectTasks(ctx context.Context, projectId uuid.UUID) ([]asteroid.Task, error) {
+	query := `
+		SELECT id, project_id, name, description, created_at
+		FROM task
+		WHERE project_id = ?`
+
+	rows, err := s.db.QueryContext(ctx, query, projectId)
+	if err != nil {
+		return nil, fmt.Errorf("error getting project tasks: %w", err)
+	}
+	defer rows.Close()
+
+	tasks := make([]asteroid.Task, 0)
+	for rows.Next() {
+		var task asteroid.Task
+		if err := rows.Scan(&task.Id, &task.ProjectId, &task.Name, &task.Description, &task.CreatedAt); err != nil {
+			return nil, fmt.Errorf("error scanning task: %w", err)
+		}
+		tasks = append(tasks, task)
+	}
+
+	return tasks, nil
+}
+
+// RunStore implementation
+func (s *SqliteStore) CreateRun(ctx context.Context, run asteroid.Run) (uuid.UUID, error) {
+	// First check if the task exists
+	t, err := s.GetTask(ctx, run.TaskId)
+	if err != nil {
+		return uuid.UUID{}, fmt.Errorf("error getting task: %w", err)
+	}
+	if t == nil {
+		return uuid.UUID{}, fmt.Errorf("task not found: %s", run.TaskId)
+	}
+
+	id := uuid.New()
+	query := `
+		INSERT INTO run (id, task_id, created_at, status)
+		VALUES (?, ?, ?, ?)`
+
+	_, err = s.db.ExecContext(ctx, query, id, run.TaskId, sqliteTime(run.CreatedAt), asteroid.Pending)
+	if err != nil {
+		return uuid.UUID{}, fmt.Errorf("error creating run: %w", err)
+	}
+
+	return id, nil
+}
+
+// CreateRuns creates the runs, tools and chains in one transaction. SQLite runs
+// in process, so the rows are inserted one by one through prepared statements.
+func (s *SqliteStore) CreateRuns(
+	ctx context.Context,
+	taskId uuid.UUID,
+	count int,
+	tools []asteroid.Tool,
+	chains [][]asteroid.ChainRequest,
+) ([]uuid.UUID, [][]uuid.UUID, error) {
+	if len(chains) != len(tools) {
+		return nil, nil, fmt.Errorf("expected chains for %d tools, got %d", len(tools), len(chains))
+	}
+
+	task, err := s.GetTask(ctx, taskId)
+	if err != nil {
+		return nil, nil, fmt.Errorf("error getting task: %w", err)
+	}
+	if task == nil {
+		return nil, nil, fmt.Errorf("task not found: %s", taskId)
+	}
+
+	type toolValues struct {
+		attributes        string
+		ignoredAttributes string
+	}
+	values := make([]toolValues, len(tools))
+	for i, tool := range tools {
+		attributesJSON, err := json.Marshal(tool.Attributes)
+		if err != nil {
+			return nil, nil, fmt.Errorf("error marshaling tool attributes: %w", err)
+		}
+		var ignoredAttributes []string
+		if tool.IgnoredAttributes != nil {
+			ignoredAttributes = *tool.IgnoredAttributes
+		}
+		ignoredJSON, err := marshalStrings(ignoredAttributes)
+		if err != nil {
+			return nil, nil, fmt.Errorf("error marshaling tool ignored attributes: %w", err)
+		}
+		values[i] = toolValues{attributes: string(attributesJSON), ignoredAttributes: string(ignoredJSON)}
+
+		for _, chain := range chains[i] {
+			if chain.SupervisorIds == nil {
+				return nil, nil, fmt.Errorf("supervisor IDs are required to make a chain of supervisors")
+			}
+		}
+	}
+
+	tx, err := s.db.BeginTx(ctx, nil)
+	if err != nil {
+		return nil, nil, fmt.Errorf("error starting transaction: %w", err)
+	}
+	defer func() { _ = tx.Rollback() }()
+
+	statements := map[string]string{
+		"run":              `INSERT INTO run (id, task_id, created_at, status) VALUES (?, ?, ?, ?)`,
+		"tool":             `INSERT INTO tool (id, run_id, name, description, attributes, ignored_attributes, code) VALUES (?, ?, ?, ?, ?, ?, ?)`,
+		"chain":            `INSERT INTO chain (id, created_at) VALUES (?, ?)`,
+		"chain_tool":       `INSERT INTO chain_tool (tool_id, chain_id) VALUES (?, ?)`,
+		"chain_supervisor": `INSERT INTO chain_supervisor (chain_id, supervisor_id, position_in_chain) VALUES (?, ?, ?)`,
+	}
+	stmts := make(map[string]*sql.Stmt, len(statements))
+	for name, query := range statements {
+		stmt, err := tx.PrepareContext(ctx, query)
+		if err != nil {
+			return nil, nil, fmt.Errorf("error preparing %s insert: %w", name, err)
+		}
+		defer stmt.Close()
+		stmts[name] = stmt
+	}
+
+	now := sqliteTime(time.Now())
+	runIds := make([]uuid.UUID, count)
+	toolIds := make([][]uuid.UUID, count)
+	for r := range runIds {
+		runIds[r] = uuid.New()
+		if _, err := stmts["run"].ExecContext(ctx, runIds[r], taskId, now, asteroid.Pending); err != nil {
+			return nil, nil, fmt.Errorf("error creating run: %w", err)
+		}
+
+		toolIds[r] = make([]uuid.UUID, len(tools))
+		for i, tool := range tools {
+			toolId := uuid.New()
+			toolIds[r][i] = toolId
+			_, err := stmts["tool"].ExecContext(ctx, toolId, runIds[r], tool.Name, tool.Description, values[i].attributes, values[i].ignoredAttributes, tool.Code)
+			if err != nil {
+				return nil, nil, fmt.Errorf("error creating tool: %w", err)
+			}
+
+			for _, chain := range chains[i] {
+				chainId := uuid.New()
+				if _, err := stmts["chain"].ExecContext(ctx, chainId, now); err != nil {
+					return nil, nil, fmt.Errorf("error creating chain: %w", err)
+				}
+				if _, err := stmts["chain_tool"].ExecContext(ctx, toolId, chainId); err != nil {
+					return nil, nil, fmt.Errorf("error linking tool to chain: %w", err)
+				}
+				for position, supervisorId := range *chain.SupervisorIds {
+					if _, err := stmts["chain_supervisor"].ExecContext(ctx, chainId, supervisorId, position); err != nil {
+						return nil, nil, fmt.Errorf("error adding supervisor to chain: %w", err)
+					}
+				}
+			}
+		}
+	}
+
+	if err := tx.Commit(); err != nil {
+		return nil, nil, fmt.Errorf("error committing transaction: %w", err)
+	}
+
+	return runIds, toolIds, nil
+}
+
+func (s *SqliteStore) GetRun(ctx context.Context, id uuid.UUID) (*asteroid.Run, error) {
+	query := `
+		SELECT id, task_id, created_at, status, result
+		FROM run
+		WHERE id = ?`
+
+	var run asteroid.Run
+	err := s.db.QueryRowContext(ctx, query, id).Scan(&run.Id, &run.TaskId, &run.CreatedAt, &run.Status, &run.Result)
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("error getting run: %w", err)
+	}
+
+	return &run, nil
+}
+
+func (s *SqliteStore) GetRuns(ctx context.Context, taskId uuid.UUID) ([]asteroid.Run, error) {
+	return s.GetTaskRuns(ctx, taskId)
+}
+
+func (s *SqliteStore) GetTaskRuns(ctx context.Context, taskId uuid.UUID) ([]asteroid.Run, error) {
+	query := `
+		SELECT id, task_id, created_at, status, result
+		FROM run
+		WHERE task_id = ?`
+
+	rows, err := s.db.QueryContext(ctx, query, taskId)
+	if err != nil {
+		return nil, fmt.Errorf("error getting task runs: %w", err)
+	}
+	defer rows.Close()
+
+	runs := make([]asteroid.Run, 0)
+	for rows.Next() {
+		var run asteroid.Run
+		if err := rows.Scan(&run.Id, &run.TaskId, &run.CreatedAt, &run.Status, &run.Result); err != nil {
+			return nil, fmt.Errorf("error scanning run: %w", err)
+		}
+		runs = append(runs, run)
+	}
+
+	return runs, nil
+}
+
+func (s *SqliteStore) UpdateRunStatus(ctx context.Context, runId uuid.UUID, status asteroid.Status) error {
+	query := `UPDATE run SET status = ? WHERE id = ?`
+	_, err := s.db.ExecContext(ctx, query, status, runId)
+	if err != nil {
+		return fmt.Errorf("error updating run status: %w", err)
+	}
+
+	return nil
+}
+
+func (s *SqliteStore) UpdateRunResult(ctx context.Context, runId uuid.UUID, result string) error {
+	query := `UPDATE run SET result = ? WHERE id = ?`
+	_, err := s.db.ExecContext(ctx, query, result, runId)
+	if err != nil {
+		return fmt.Errorf("error creating run result: %w", err)
+	}
+
+	return nil
+}
+
+// ToolStore implementation
+func (s *SqliteStore) CreateTool(
+	ctx context.Context,
+	runId uuid.UUID,
+	attributes map[string]interface{},
+	name string,
+	description string,
+	ignoredAttributes []string,
+	code string,
+) (*asteroid.Tool, error) {
+	attributesJSON, err := json.Marshal(attributes)
+	if err != nil {
+		return nil, fmt.Errorf("error marshaling tool attributes: %w", err)
+	}
+
+	if ignoredAttributes == nil {
+		ignoredAttributes = []string{}
+	}
+	ignoredJSON, err := marshalStrings(ignoredAttributes)
+	if err != nil {
+		return nil, fmt.Errorf("error marshaling tool ignored attributes: %w", err)
+	}
+
+	id := uuid.New()
+	query := `
+		INSERT INTO tool (id, run_id, name, description, attributes, ignored_attributes, code)
+		VALUES (?, ?, ?, ?, ?, ?, ?)`
+
+	_, err = s.db.ExecContext(ctx, query, id, runId, name, description, string(attributesJSON), string(ignoredJSON), code)
+	if err != nil {
+		return nil, fmt.Errorf("error creating tool: %w", err)
+	}
+
+	return &asteroid.Tool{
+		Id:                &id,
+		RunId:             runId,
+		Name:              name,
+		Description:       description,
+		Attributes:        attributes,
+		IgnoredAttributes: &ignoredAttributes,
+		Code:              code,
+	}, nil
+}
+
+func (s *SqliteStore) scanTool(row interface{ Scan(...interface{}) error }) (*asteroid.Tool, error) {
+	var tool asteroid.Tool
+	var attributesJSON, ignoredJSON []byte
+	if err := row.Scan(
+		&tool.Id,
+		&tool.RunId,
+		&tool.Name,
+		&tool.Description,
+		&attributesJSON,
+		&ignoredJSON,
+		&tool.Code,
+	); err != nil {
+		return nil, err
+	}
+
+	attributes := make(map[string]interface{})
+	if len(attributesJSON) > 0 {
+		if err := json.Unmarshal(attributesJSON, &attributes); err != nil {
+			return nil, fmt.Errorf("error parsing tool attributes: %w", err)
+		}
+	}
+	tool.Attributes = attributes
+
+	ignoredAttributes, err := unmarshalStrings(ignoredJSON)
+	if err != nil {
+		return nil, fmt.Errorf("error parsing tool ignored attributes: %w", err)
+	}
+	tool.IgnoredAttributes = &ignoredAttributes
+
+	return &tool, nil
+}
+
+func (s *SqliteStore) GetTool(ctx context.Context, id uuid.UUID) (*asteroid.Tool, error) {
+	query := `
+		SELECT id, run_id, name, description, attributes, ignored_attributes, code
+		FROM tool
+		WHERE id = ?`
+
+	tool, err := s.scanTool(s.db.QueryRowContext(ctx, query, id))
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("error getting tool: %w", err)
+	}
+
+	return tool, nil
+}
+
+func (s *SqliteStore) GetToolFromNameAndRunId(ctx context.Context, name string, runId uuid.UUID) (*asteroid.Tool, error) {
+	query := `
+		SELECT id, run_id, name, description, attributes, ignored_attributes, code
+		FROM tool
+		WHERE name = ?
+		AND run_id = ?`
+
+	tool, err := s.scanTool(s.db.QueryRowContext(ctx, query, name, runId))
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("error getting tool from name: %w", err)
+	}
+
+	return tool, nil
+}
+
+func (s *SqliteStore) GetRunTools(ctx context.Context, runId uuid.UUID) ([]asteroid.Tool, error) {
+	query := `
+		SELECT id, run_id, name, description, attributes, ignored_attributes, code
+		FROM tool
+		WHERE run_id = ?`
+
+	rows, err := s.db.QueryContext(ctx, query, runId)
+	if err != nil {
+		return nil, fmt.Errorf("error getting run tools: %w", err)
+	}
+	defer rows.Close()
+
+	tools := make([]asteroid.Tool, 0)
+	for rows.Next() {
+		tool, err := s.scanTool(rows)
+		if err != nil {
+			return nil, fmt.Errorf("error scanning tool: %w", err)
+		}
+		tools = append(tools, *tool)
+	}
+
+	return tools, nil
+}
+
+func (s *SqliteStore) GetProjectTools(ctx context.Context, projectId uuid.UUID) ([]asteroid.Tool, error) {
+	query := `
+		SELECT tl.id, tl.run_id, tl.name, tl.description, tl.attributes, tl.ignored_attributes, tl.code
+		FROM tool tl
+		INNER JOIN run r ON r.id = tl.run_id
+		INNER JOIN task t ON t.id = r.task_id
+		WHERE t.project_id = ?`
+
+	rows, err := s.db.QueryContext(ctx, query, projectId)
+	if err != nil {
+		return nil, fmt.Errorf("error getting project tools: %w", err)
+	}
+	defer rows.Close()
+
+	tools := make([]asteroid.Tool, 0)
+	for rows.Next() {
+		tool, err := s.scanTool(rows)
+		if err != nil {
+			return nil, fmt.Errorf("error scanning tool: %w", err)
+		}
+		tools = append(tools, *tool)
+	}
+
+	return tools, nil
+}
+
+// ToolRequestStore implementation
+func (s *SqliteStore) GetToolCall(ctx context.Context, id uuid.UUID) (*asteroid.AsteroidToolCall, error) {
+	query := `
+		SELECT id, call_id, created_at, tool_id, tool_call_data
+		FROM toolcall
+		WHERE id = ?`
+
+	return s.getToolCall(ctx, query, id)
+}
+
+func (s *SqliteStore) GetToolCallFromCallId(ctx context.Context, id string) (*asteroid.AsteroidToolCall, error) {
+	query := `
+		SELECT id, call_id, created_at, tool_id, tool_call_data
+		FROM toolcall
+		WHERE call_id = ?`
+
+	return s.getToolCall(ctx, query, id)
+}
+
+func (s *SqliteStore) getToolCall(ctx context.Context, query string, arg interface{}) (*asteroid.AsteroidToolCall, error) {
+	var toolCall asteroid.AsteroidToolCall
+	var toolCallDataJSON []byte
+	err := s.db.QueryRowContext(ctx, query, arg).Scan(
+		&toolCall.Id,
+		&toolCall.CallId,
+		&toolCall.CreatedAt,
+		&toolCall.ToolId,
+		&toolCallDataJSON,
+	)
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("error getting tool request: %w", err)
+	}
+
+	args := string(toolCallDataJSON)
+	toolCall.Arguments = &args
+
+	return &toolCall, nil
+}
+
+// SupervisorStore implementation
+func (s *SqliteStore) CreateSupervisor(ctx context.Context, supervisor asteroid.Supervisor) (uuid.UUID, error) {
+	// Try to find an existing supervisor with the same values
+	if existingSupervisor, err := s.GetSupervisorFromValues(
+		ctx, supervisor.Code, supervisor.Name, supervisor.Description, supervisor.Type, supervisor.Attributes,
+	); err != nil {
+		return uuid.UUID{}, fmt.Errorf("error getting existing supervisor during create supervisor: %w", err)
+	} else if existingSupervisor != nil {
+		return *existingSupervisor.Id, nil
+	}
+
+	attributes, err := json.Marshal(supervisor.Attributes)
+	if err != nil {
+		return uuid.UUID{}, fmt.Errorf("error marshalling supervisor attributes: %w", err)
+	}
+
+	id := uuid.New()
+	query := `
+		INSERT INTO supervisor (id, description, name, created_at, type, code, attributes)
+		VALUES (?, ?, ?, ?, ?, ?, ?)`
+
+	_, err = s.db.ExecContext(ctx, query, id, supervisor.Description, supervisor.Name, sqliteTime(supervisor.CreatedAt), supervisor.Type, supervisor.Code, string(attributes))
+	if err != nil {
+		return uuid.UUID{}, fmt.Errorf("error creating supervisor: %w", err)
+	}
+
+	return id, nil
+}
+
+func (s *SqliteStore) GetSupervisor(ctx context.Context, id uuid.UUID) (*asteroid.Supervisor, error) {
+	query := `
+		SELECT id, description, name, created_at, type, attributes
+		FROM supervisor
+		WHERE id = ?`
+
+	var supervisor asteroid.Supervisor
+	var attributesJSON []byte
+	err := s.db.QueryRowContext(ctx, query, id).Scan(&supervisor.Id, &supervisor.Description, &supervisor.Name, &supervisor.CreatedAt, &supervisor.Type, &attributesJSON)
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("error getting supervisor: %w", err)
+	}
+
+	if len(attributesJSON) > 0 {
+		if err := json.Unmarshal(attributesJSON, &supervisor.Attributes); err != nil {
+			return nil, fmt.Errorf("error parsing supervisor attributes: %w", err)
+		}
+	}
+
+	return &supervisor, nil
+}
+
+// GetSupervisorFromValues compares attributes by their JSON encoding, which is
+// stable as encoding/json sorts map keys.
+func (s *SqliteStore) GetSupervisorFromValues(
+	ctx context.Context,
+	code string,
+	name string,
+	desc string,
+	t asteroid.SupervisorType,
+	attributes map[string]interface{},
+) (*asteroid.Supervisor, error) {
+	query := `
+		SELECT id, code, name, description, type, created_at
+		FROM supervisor
+		WHERE code = ?
+		AND name = ?
+		AND description = ?
+		AND type = ?
+		AND attributes = ?`
+
+	attrJSON, err := json.Marshal(attributes)
+	if err != nil {
+		return nil, fmt.Errorf("error marshalling attributes: %w", err)
+	}
+
+	var supervisor asteroid.Supervisor
+	err = s.db.QueryRowContext(ctx, query, code, name, desc, t, string(attrJSON)).Scan(
+		&supervisor.Id, &supervisor.Code, &supervisor.Name, &supervisor.Description, &supervisor.Type, &supervisor.CreatedAt,
+	)
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("error getting supervisor by values: %w", err)
+	}
+
+	supervisor.Attributes = attributes
+
+	return &supervisor, nil
+}
+
+func (s *SqliteStore) GetSupervisors(ctx context.Context, projectId uuid.UUID) ([]asteroid.Supervisor, error) {
+	query := `
+		SELECT s.id, s.description, s.name, s.code, s.created_at, s.type, s.attributes
+		FROM supervisor s
+		INNER JOIN chain_supervisor cs ON s.id = cs.supervisor_id
+		INNER JOIN chain_tool ct ON cs.chain_id = ct.chain_id
+		INNER JOIN tool t ON ct.tool_id = t.id
+		INNER JOIN run r ON t.run_id = r.id
+		WHERE r.task_id IN (
+			SELECT id
+			FROM task
+			WHERE project_id = ?
+		)`
+
+	rows, err := s.db.QueryContext(ctx, query, projectId)
+	if err != nil {
+		return nil, fmt.Errorf("error getting supervisors: %w", err)
+	}
+	defer rows.Close()
+
+	supervisors := make([]asteroid.Supervisor, 0)
+	for rows.Next() {
+		var supervisor asteroid.Supervisor
+		var attributesJSON []byte
+		if err := rows.Scan(
+			&supervisor.Id,
+			&supervisor.Description,
+			&supervisor.Name,
+			&supervisor.Code,
+			&supervisor.CreatedAt,
+			&supervisor.Type,
+			&attributesJSON,
+		); err != nil {
+			return nil, fmt.Errorf("error scanning supervisor: %w", err)
+		}
+
+		if len(attributesJSON) > 0 {
+			if err := json.Unmarshal(attributesJSON, &supervisor.Attributes); err != nil {
+				return nil, fmt.Errorf("error parsing supervisor attributes: %w", err)
+			}
+		}
+
+		supervisors = append(supervisors, supervisor)
+	}
+
+	return supervisors, nil
+}
+
+func (s *SqliteStore) CreateSupervisorChain(ctx context.Context, toolId uuid.UUID, chain asteroid.ChainRequest) (*uuid.UUID, error) {
+	if chain.SupervisorIds == nil {
+		return nil, fmt.Errorf("supervisor IDs are required to make a chain of supervisors")
+	}
+	ids := *chain.SupervisorIds
+
+	tx, err := s.db.BeginTx(ctx, nil)
+	if err != nil {
+		return nil, fmt.Errorf("error starting transaction: %w", err)
+	}
+	defer func() { _ = tx.Rollback() }()
+
+	chainId := uuid.New()
+	_, err = tx.ExecContext(ctx, `INSERT INTO chain (id, created_at) VALUES (?, ?)`, chainId, sqliteTime(time.Now()))
+	if err != nil {
+		return nil, fmt.Errorf("error creating chain: %w", err)
+	}
+
+	_, err = tx.ExecContext(ctx, `INSERT INTO chain_tool (tool_id, chain_id) VALUES (?, ?)`, toolId, chainId)
+	if err != nil {
+		return nil, fmt.Errorf("error linking tool to chain: %w", err)
+	}
+
+	query := `
+		INSERT INTO chain_supervisor (chain_id, supervisor_id, position_in_chain)
+		VALUES (?, ?, ?)`
+
+	for i, supervisorId := range ids {
+		_, err = tx.ExecContext(ctx, query, chainId, supervisorId, i)
+		if err != nil {
+			return nil, fmt.Errorf("error adding supervisor to chain: %w", err)
+		}
+	}
+
+	if err := tx.Commit(); err != nil {
+		return nil, fmt.Errorf("error committing transaction: %w", err)
+	}
+
+	return &chainId, nil
+}
+
+func (s *SqliteStore) GetSupervisorChain(ctx context.Context, chainId uuid.UUID) (*asteroid.SupervisorChain, error) {
+	query := `
+		SELECT s.id, s.name, s.description, s.type, s.attributes, s.created_at, s.code
+		FROM chain_supervisor cs
+		INNER JOIN supervisor s ON cs.supervisor_id = s.id
+		WHERE cs.chain_id = ?
+		ORDER BY cs.position_in_chain ASC`
+
+	rows, err := s.db.QueryContext(ctx, query, chainId)
+	if err != nil {
+		return nil, fmt.Errorf("error getting tool supervisor chain: %w", err)
+	}
+	defer rows.Close()
+
+	supervisors := make([]asteroid.Supervisor, 0)
+	for rows.Next() {
+		var attributesJSON []byte
+		var supervisor asteroid.Supervisor
+		if err := rows.Scan(
+			&supervisor.Id,
+			&supervisor.Name,
+			&supervisor.Description,
+			&supervisor.Type,
+			&attributesJSON,
+			&supervisor.CreatedAt,
+			&supervisor.Code,
+		); err != nil {
+			return nil, fmt.Errorf("error scanning supervisor: %w", err)
+		}
+
+		if len(attributesJSON) > 0 {
+			if err := json.Unmarshal(attributesJSON, &supervisor.Attributes); err != nil {
+				return nil, fmt.Errorf("error parsing supervisor attributes: %w", err)
+			}
+		}
+
+		supervisors = append(supervisors, supervisor)
+	}
+
+	return &asteroid.SupervisorChain{
+		ChainId:     chainId,
+		Supervisors: supervisors,
+	}, nil
+}
+
+func (s *SqliteStore) GetSupervisorChains(ctx context.Context, toolId uuid.UUID) ([]asteroid.SupervisorChain, error) {
+	chainIds, err := s.getChainsForTool(ctx, s.db, toolId)
+	if err != nil {
+		return nil, fmt.Errorf("error getting chains for tool: %w", err)
+	}
+
+	chains := make([]asteroid.SupervisorChain, 0)
+	for _, chainId := range chainIds {
+		chain, err := s.GetSupervisorChain(ctx, chainId)
+		if err != nil {
+			return nil, fmt.Errorf("error getting tool supervisor chain: %w", err)
+		}
+		chains = append(chains, *chain)
+	}
+
+	return chains, nil
+}
+
+func (s *SqliteStore) getChainsForTool(ctx context.Context, q sqliteQuerier, toolId uuid.UUID) ([]uuid.UUID, error) {
+	rows, err := q.QueryContext(ctx, `SELECT chain_id FROM chain_tool WHERE tool_id = ?`, toolId)
+	if err != nil {
+		return nil, fmt.Errorf("error getting chains: %w", err)
+	}
+	defer rows.Close()
+
+	chainIds := make([]uuid.UUID, 0)
+	for rows.Next() {
+		var chainId uuid.UUID
+		if err := rows.Scan(&chainId); err != nil {
+			return nil, fmt.Errorf("error scanning chain ID: %w", err)
+		}
+		chainIds = append(chainIds, chainId)
+	}
+
+	return chainIds, nil
+}
+
+// SupervisionStore implementation
+func (s *SqliteStore) CreateSupervisionRequest(
+	ctx context.Context,
+	request asteroid.SupervisionRequest,
+	chainId uuid.UUID,
+	toolCallId uuid.UUID,
+) (*uuid.UUID, error) {
+	tx, err := s.db.BeginTx(ctx, nil)
+	if err != nil {
+		return nil, fmt.Errorf("error starting transaction: %w", err)
+	}
+	defer func() { _ = tx.Rollback() }()
+
+	// Sanity check that we're recording this against a valid chain execution group that already exists
+	if request.ChainexecutionId == nil && request.PositionInChain == 0 {
+		var ceId uuid.UUID
+		err := tx.QueryRowContext(ctx, `
+			SELECT id
+			FROM chainexecution
+			WHERE chain_id = ? AND toolcall_id = ?`, chainId, toolCallId).Scan(&ceId)
+		if errors.Is(err, sql.ErrNoRows) {
+			return nil, fmt.Errorf("chain execution not found for tool call %s and chain %s", toolCallId, chainId)
+		}
+		if err != nil {
+			return nil, fmt.Errorf("error getting chain execution for tool call: %w", err)
+		}
+
+		request.ChainexecutionId = &ceId
+	} else if request.ChainexecutionId == nil && request.PositionInChain > 0 {
+		return nil, fmt.Errorf("chain execution ID is required when creating a supervision request for a non-zero position in the chain")
+	}
+
+	query := `
+		INSERT INTO supervisionrequest (id, supervisor_id, position_in_chain, chainexecution_id)
+		VALUES (?, ?, ?, ?)`
+
+	requestID := uuid.New()
+	_, err = tx.ExecContext(ctx, query, requestID, request.SupervisorId, request.PositionInChain, request.ChainexecutionId)
+	if err != nil {
+		return nil, fmt.Errorf("error creating supervision request: %w", err)
+	}
+
+	err = s.createSupervisionStatus(ctx, tx, requestID, asteroid.SupervisionStatus{
+		Status:    asteroid.Pending,
+		CreatedAt: time.Now(),
+	})
+	if err != nil {
+		return nil, fmt.Errorf("error creating supervisor status: %w", err)
+	}
+
+	if err := tx.Commit(); err != nil {
+		return nil, fmt.Errorf("error committing transaction: %w", err)
+	}
+
+	return &requestID, nil
+}
+
+func (s *SqliteStore) GetSupervisionRequest(ctx context.Context, id uuid.UUID) (*asteroid.SupervisionRequest, error) {
+	query := `
+		SELECT id, supervisor_id, position_in_chain, chainexecution_id
+		FROM supervisionrequest
+		WHERE id = ?`
+
+	var request asteroid.SupervisionRequest
+	err := s.db.QueryRowContext(ctx, query, id).Scan(
+		&request.Id,
+		&request.SupervisorId,
+		&request.PositionInChain,
+		&request.ChainexecutionId,
+	)
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("error getting supervision request: %w", err)
+	}
+
+	status, err := s.GetSupervisionRequestStatus(ctx, id)
+	if err != nil {
+		return nil, fmt.Errorf("error getting supervision request status: %w", err)
+	}
+	request.Status = status
+
+	return &request, nil
+}
+
+func (s *SqliteStore) GetSupervisionRequestsForStatus(ctx context.Context, status asteroid.Status) ([]asteroid.SupervisionRequest, error) {
+	// Get IDs of supervision requests with the given status (excluding client supervisors)
+	query := `
+		SELECT sr.id
+		FROM supervisionrequest sr
+		JOIN supervisor s ON s.id = sr.supervisor_id
+		JOIN (
+			SELECT supervisionrequest_id, MAX(id) as latest_status_id
+			FROM supervisionrequest_status
+			GROUP BY supervisionrequest_id
+		) latest ON sr.id = latest.supervisionrequest_id
+		JOIN supervisionrequest_status srs ON srs.id = latest.latest_status_id
+		WHERE s.type != ? AND srs.status = ?`
+
+	rows, err := s.db.QueryContext(ctx, query, asteroid.ClientSupervisor, status)
+	if err != nil {
+		return nil, fmt.Errorf("error getting supervision request IDs: %w", err)
+	}
+
+	var requestIds []uuid.UUID
+	for rows.Next() {
+		var id uuid.UUID
+		if err := rows.Scan(&id); err != nil {
+			rows.Close()
+			return nil, fmt.Errorf("error scanning supervision request ID: %w", err)
+		}
+		requestIds = append(requestIds, id)
+	}
+	rows.Close()
+
+	if len(requestIds) == 0 {
+		return nil, nil
+	}
+
+	requests := make([]asteroid.SupervisionRequest, 0, len(requestIds))
+	for _, id := range requestIds {
+		request, err := s.GetSupervisionRequest(ctx, id)
+		if err != nil {
+			return nil, fmt.Errorf("error getting supervision request %s: %w", id, err)
+		}
+		if request != nil {
+			requests = append(requests, *request)
+		}
+	}
+
+	return requests, nil
+}
+
+func (s *SqliteStore) GetSupervisionResultFromRequestID(ctx context.Context, requestId uuid.UUID) (*asteroid.SupervisionResult, error) {
+	query := `
+		SELECT id, supervisionrequest_id, created_at, decision, reasoning, toolcall_id
+		FROM supervisionresult
+		WHERE supervisionrequest_id = ?`
+
+	var result asteroid.SupervisionResult
+	err := s.db.QueryRowContext(ctx, query, requestId).Scan(
+		&result.Id,
+		&result.SupervisionRequestId,
+		&result.CreatedAt,
+		&result.Decision,
+		&result.Reasoning,
+		&result.ToolcallId,
+	)
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("error getting supervision result: %w", err)
+	}
+
+	return &result, nil
+}
+
+func (s *SqliteStore) CreateSupervisionResult(ctx context.Context, result asteroid.SupervisionResult, requestId uuid.UUID) (*uuid.UUID, error) {
+	tx, err := s.db.BeginTx(ctx, nil)
+	if err != nil {
+		return nil, fmt.Errorf("error starting transaction: %w", err)
+	}
+	defer func() { _ = tx.Rollback() }()
+
+	query := `
+		INSERT INTO supervisionresult (id, supervisionrequest_id, created_at, decision, reasoning, toolcall_id)
+		VALUES (?, ?, ?, ?, ?, ?)`
+
+	id := uuid.New()
+	_, err = tx.ExecContext(ctx, query, id, requestId, sqliteTime(result.CreatedAt), result.Decision, result.Reasoning, result.ToolcallId)
+	if err != nil {
+		return nil, fmt.Errorf("error creating supervision result: %w", err)
+	}
+
+	err = s.createSupervisionStatus(ctx, tx, requestId, asteroid.SupervisionStatus{
+		Status:    asteroid.Completed,
+		CreatedAt: result.CreatedAt,
+	})
+	if err != nil {
+		return nil, fmt.Errorf("error creating supervision status for result: %w", err)
+	}
+
+	if err := tx.Commit(); err != nil {
+		return nil, fmt.Errorf("error committing transaction: %w", err)
+	}
+
+	return &id, nil
+}
+
+func (s *SqliteStore) CreateSupervisionStatus(ctx context.Context, requestID uuid.UUID, status asteroid.SupervisionStatus) error {
+	tx, err := s.db.BeginTx(ctx, nil)
+	if err != nil {
+		return fmt.Errorf("error starting transaction: %w", err)
+	}
+	defer func() { _ = tx.Rollback() }()
+
+	if err := s.createSupervisionStatus(ctx, tx, requestID, status); err != nil {
+		return fmt.Errorf("error creating supervisor status: %w", err)
+	}
+
+	if err := tx.Commit(); err != nil {
+		return fmt.Errorf("error committing transaction: %w", err)
+	}
+
+	return nil
+}
+
+func (s *SqliteStore) createSupervisionStatus(ctx context.Context, tx *sql.Tx, requestID uuid.UUID, status asteroid.SupervisionStatus) error {
+	query := `
+		INSERT INTO supervisionrequest_status (supervisionrequest_id, status, created_at)
+		VALUES (?, ?, ?)`
+
+	_, err := tx.ExecContext(ctx, query, requestID, status.Status, sqliteTime(status.CreatedAt))
+	if err != nil {
+		return fmt.Errorf("error creating supervisor status: %w", err)
+	}
+
+	return nil
+}
+
+func (s *SqliteStore) CountSupervisionRequests(ctx context.Context, status asteroid.Status) (int, error) {
+	query := `
+		SELECT COUNT(DISTINCT sr.id)
+		FROM supervisionrequest sr
+		JOIN supervisionrequest_status ss ON sr.id = ss.supervisionrequest_id
+		WHERE NOT EXISTS (
+			SELECT 1
+			FROM supervisionrequest_status newer
+			WHERE newer.supervisionrequest_id = sr.id
+			AND newer.created_at > ss.created_at
+		)
+		AND ss.status = ?`
+
+	var count int
+	if err := s.db.QueryRowContext(ctx, query, status).Scan(&count); err != nil {
+		return 0, fmt.Errorf("error counting supervision requests: %w", err)
+	}
+
+	return count, nil
+}
+
+// GetChainExecutionSupervisionRequests gets all supervision requests for a specific chain execution
+func (s *SqliteStore) GetChainExecutionSupervisionRequests(ctx context.Context, chainExecutionId uuid.UUID) ([]asteroid.SupervisionRequest, error) {
+	query := `
+		SELECT id, supervisor_id, chainexecution_id, position_in_chain
+		FROM supervisionrequest
+		WHERE chainexecution_id = ?
+		ORDER BY id ASC`
+
+	rows, err := s.db.QueryContext(ctx, query, chainExecutionId)
+	if err != nil {
+		return nil, fmt.Errorf("error getting chain execution supervision requests: %w", err)
+	}
+
+	requests := make([]asteroid.SupervisionRequest, 0)
+	for rows.Next() {
+		var request asteroid.SupervisionRequest
+		if err := rows.Scan(
+			&request.Id,
+			&request.SupervisorId,
+			&request.ChainexecutionId,
+			&request.PositionInChain,
+		); err != nil {
+			rows.Close()
+			return nil, fmt.Errorf("error scanning supervision request: %w", err)
+		}
+		requests = append(requests, request)
+	}
+	rows.Close()
+
+	for i := range requests {
+		status, err := s.GetSupervisionRequestStatus(ctx, *requests[i].Id)
+		if err != nil {
+			return nil, fmt.Errorf("error trying to get request status during chain execution query: %w", err)
+		}
+		if status != nil {
+			requests[i].Status = status
+		}
+	}
+
+	return requests, nil
+}
+
+// GetSupervisionRequestStatus gets the latest status for a supervision request
+func (s *SqliteStore) GetSupervisionRequestStatus(ctx context.Context, requestId uuid.UUID) (*asteroid.SupervisionStatus, error) {
+	query := `
+		SELECT id, supervisionrequest_id, status, created_at
+		FROM supervisionrequest_status
+		WHERE supervisionrequest_id = ?
+		ORDER BY created_at DESC
+		LIMIT 1`
+
+	var status asteroid.SupervisionStatus
+	err := s.db.QueryRowContext(ctx, query, requestId).Scan(
+		&status.Id,
+		&status.SupervisionRequestId,
+		&status.Status,
+		&status.CreatedAt,
+	)
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("error getting supervision request status: %w", err)
+	}
+
+	return &status, nil
+}
+
+func (s *SqliteStore) GetExecutionFromChainId(ctx context.Context, chainId uuid.UUID) (*uuid.UUID, error) {
+	var id uuid.UUID
+	err := s.db.QueryRowContext(ctx, `SELECT id FROM chainexecution WHERE chain_id = ?`, chainId).Scan(&id)
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("error getting execution from chain ID: %w", err)
+	}
+
+	return &id, nil
+}
+
+func (s *SqliteStore) GetChainExecution(ctx context.Context, executionId uuid.UUID) (*uuid.UUID, *uuid.UUID, error) {
+	var chainId, toolCallId uuid.UUID
+	err := s.db.QueryRowContext(ctx, `SELECT chain_id, toolcall_id FROM chainexecution WHERE id = ?`, executionId).Scan(&chainId, &toolCallId)
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil, nil
+	}
+	if err != nil {
+		return nil, nil, fmt.Errorf("error getting chain ID from execution ID: %w", err)
+	}
+
+	return &chainId, &toolCallId, nil
+}
+
+// GetChainExecutionFromChainAndToolCall gets the chain execution ID for a given chain ID and tool call ID
+func (s *SqliteStore) GetChainExecutionFromChainAndToolCall(ctx context.Context, chainId uuid.UUID, toolCallId uuid.UUID) (*uuid.UUID, error) {
+	query := `
+		SELECT id
+		FROM chainexecution
+		WHERE chain_id = ?
+		AND toolcall_id = ?`
+
+	var executionId uuid.UUID
+	err := s.db.QueryRowContext(ctx, query, chainId, toolCallId).Scan(&executionId)
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("failed to get chain execution from chain and tool call: %w", err)
+	}
+
+	return &executionId, nil
+}
+
+func (s *SqliteStore) GetChainExecutionsFromToolCall(ctx context.Context, id uuid.UUID) ([]uuid.UUID, error) {
+	rows, err := s.db.QueryContext(ctx, `SELECT id FROM chainexecution WHERE toolcall_id = ?`, id)
+	if err != nil {
+		return nil, fmt.Errorf("error getting chain executions from tool call ID: %w", err)
+	}
+	defer rows.Close()
+
+	ids := make([]uuid.UUID, 0)
+	for rows.Next() {
+		var id uuid.UUID
+		if err := rows.Scan(&id); err != nil {
+			return nil, fmt.Errorf("error scanning chain execution ID: %w", err)
+		}
+		ids = append(ids, id)
+	}
+
+	return ids, nil
+}
+
+// GetChainExecutionState returns the chain state for a given chain execution ID
+func (s *SqliteStore) GetChainExecutionState(ctx context.Context, executionId uuid.UUID) (*asteroid.ChainExecutionState, error) {
+	var chainExecution asteroid.ChainExecution
+	err := s.db.QueryRowContext(ctx, `
+		SELECT id, toolcall_id, chain_id, created_at
+		FROM chainexecution
+		WHERE id = ?`, executionId).Scan(
+		&chainExecution.Id,
+		&chainExecution.ToolcallId,
+		&chainExecution.ChainId,
+		&chainExecution.CreatedAt,
+	)
+	if errors.Is(err, sql.ErrNoRows) {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, fmt.Errorf("failed to get chain execution: %w", err)
+	}
+
+	supervisorChain, err := s.GetSupervisorChain(ctx, chainExecution.ChainId)
+	if err != nil {
+		return nil, fmt.Errorf("failed to get supervisor chain: %w", err)
+	}
+
+	supervisionRequests, err := s.GetChainExecutionSupervisionRequests(ctx, chainExecution.Id)
+	if err != nil {
+		return nil, fmt.Errorf("failed to get supervision requests: %w", err)
+	}
+
+	var supervisionRequestStates []asteroid.SupervisionRequestState
+	for _, request := range supervisionRequests {
+		if request.Status == nil {
+			return nil, fmt.Errorf("failed to get supervision request status: %w", sql.ErrNoRows)
+		}
+
+		result, err := s.GetSupervisionResultFromRequestID(ctx, *request.Id)
+		if err != nil {
+			return nil, fmt.Errorf("failed to get supervision result: %w", err)
+		}
+
+		supervisionRequestStates = append(supervisionRequestStates, asteroid.SupervisionRequestState{
+			SupervisionRequest: request,
+			Status:             *request.Status,
+			Result:             result,
+		})
+	}
+
+	return &asteroid.ChainExecutionState{
+		Chain:               *supervisorChain,
+		ChainExecution:      chainExecution,
+		SupervisionRequests: supervisionRequestStates,
+	}, nil
+}
+
+// ChatStore implementation
+
+// CreateChatRequest writes the chat with its choices, messages, tool calls and
+// chain executions in a single transaction, so one tool call costs one commit.
+func (s *SqliteStore) CreateChatRequest(
+	ctx context.Context,
+	runId uuid.UUID,
+	request []byte,
+	response []byte,
+	choices []asteroid.AsteroidChoice,
+	format string,
+	requestMessages []asteroid.AsteroidMessage,
+) (*uuid.UUID, error) {
+	if len(request) == 0 {
+		return nil, fmt.Errorf("request is empty")
+	}
+
+	tx, err := s.db.BeginTx(ctx, nil)
+	if err != nil {
+		return nil, fmt.Errorf("error starting transaction: %w", err)
+	}
+	defer func() { _ = tx.Rollback() }()
+
+	now := sqliteTime(time.Now())
+
+	query := `
+		INSERT INTO chat (id, created_at, request_data, response_data, run_id, format)
+		VALUES (?, ?, ?, ?, ?, ?)`
+
+	id := uuid.New()
+	_, err = tx.ExecContext(ctx, query, id, now, string(request), string(response), runId, format)
+	if err != nil {
+		return nil, fmt.Errorf("error creating chat entry: %w", err)
+	}
+
+	for _, choice := range choices {
+		if err := s.createChatChoice(ctx, tx, id, now, choice, requestMessages); err != nil {
+			return nil, fmt.Errorf("error creating chat choices: %w", err)
+		}
+	}
+
+	if err := tx.Commit(); err != nil {
+		return nil, fmt.Errorf("error committing transaction: %w", err)
+	}
+
+	return &id, nil
+}
+
+func (s *SqliteStore) createChatChoice(
+	ctx context.Context,
+	tx *sql.Tx,
+	chatId uuid.UUID,
+	now time.Time,
+	choice asteroid.AsteroidChoice,
+	requestMessages []asteroid.AsteroidMessage,
+) error {
+	choiceId, err := uuid.Parse(choice.AsteroidId)
+	if err != nil {
+		return fmt.Errorf("error parsing AsteroidId: %w", err)
+	}
+
+	choiceData, err := json.Marshal(choice)
+	if err != nil {
+		return fmt.Errorf("error marshalling choice data: %w", err)
+	}
+
+	query := `
+		INSERT INTO choice (id, chat_id, created_at, choice_data)
+		VALUES (?, ?, ?, ?)`
+
+	if _, err := tx.ExecContext(ctx, query, choiceId, chatId, now, string(choiceData)); err != nil {
+		return fmt.Errorf("error creating chat choice: %w", err)
+	}
+
+	// Store the request messages which are unique to the request that generated this choice
+	msgQuery := `
+		INSERT INTO msg (id, choice_id, created_at, msg_data)
+		VALUES (?, ?, ?, ?)`
+
+	for _, message := range requestMessages {
+		msgData, err := json.Marshal(message)
+		if err != nil {
+			return fmt.Errorf("error marshalling message data: %w", err)
+		}
+		if _, err := tx.ExecContext(ctx, msgQuery, message.Id, choiceId, now, string(msgData)); err != nil {
+			return fmt.Errorf("error creating chat message: %w", err)
+		}
+	}
+
+	msgId := choice.Message.Id
+	if msgId == nil {
+		return fmt.Errorf("message ID is nil")
+	}
+
+	messageData, err := json.Marshal(choice.Message)
+	if err != nil {
+		return fmt.Errorf("error marshalling message data: %w", err)
+	}
+	if _, err := tx.ExecContext(ctx, msgQuery, *msgId, choiceId, now, string(messageData)); err != nil {
+		return fmt.Errorf("error creating chat message: %w", err)
+	}
+
+	if choice.Message.ToolCalls == nil {
+		return nil
+	}
+
+	for _, toolCall := range *choice.Message.ToolCalls {
+		if err := s.createToolCall(ctx, tx, *msgId, now, toolCall); err != nil {
+			return err
+		}
+	}
+
+	return nil
+}
+
+func (s *SqliteStore) createToolCall(
+	ctx context.Context,
+	tx *sql.Tx,
+	msgId uuid.UUID,
+	now time.Time,
+	toolCall asteroid.AsteroidToolCall,
+) error {
+	toolCallData, err := json.Marshal(toolCall)
+	if err != nil {
+		return fmt.Errorf("error marshalling tool call data: %w", err)
+	}
+
+	query := `
+		INSERT INTO toolcall (id, call_id, msg_id, created_at, tool_call_data, tool_id)
+		VALUES (?, ?, ?, ?, ?, ?)`
+
+	_, err = tx.ExecContext(ctx, query, toolCall.Id, toolCall.CallId, msgId, now, string(toolCallData), toolCall.ToolId)
+	if err != nil {
+		return fmt.Errorf("error creating tool call: %w", err)
+	}
+
+	// Init the chain executions for the chains configured for this tool
+	chains, err := s.getChainsForTool(ctx, tx, toolCall.ToolId)
+	if err != nil {
+		return fmt.Errorf("error getting chains configured for tool call: %w", err)
+	}
+
+	for _, chainId := range chains {
+		_, err := tx.ExecContext(ctx, `
+			INSERT INTO chainexecution (id, chain_id, toolcall_id, created_at)
+			VALUES (?, ?, ?, ?)`, uuid.New(), chainId, toolCall.Id, now)
+		if err != nil {
+			return fmt.Errorf("error creating chain execution: %w", err)
+		}
+	}
+
+	return nil
+}
+
+func (s *SqliteStore) GetChat(ctx context.Context, runId uuid.UUID, index int) ([]byte, []byte, error) {
+	query := `
+		SELECT request_data, response_data
+		FROM chat
+		WHERE run_id = ?
+		ORDER BY created_at DESC
+		LIMIT 1 OFFSET ?`
+
+	var requestData, responseData []byte
+	err := s.db.QueryRowContext(ctx, query, runId, index).Scan(&requestData, &responseData)
+	if err != nil {
+		return nil, nil, fmt.Errorf("error getting message: %w", err)
+	}
+
+	return requestData, responseData, nil
+}
+
+func (s *SqliteStore) GetRunChatCount(ctx context.Context, runId uuid.UUID) (int, error) {
+	var count int
+	err := s.db.QueryRowContext(ctx, `SELECT COUNT(*) FROM chat WHERE run_id = ?`, runId).Scan(&count)
+	if err != nil {
+		return 0, fmt.Errorf("error getting chat count: %w", err)
+	}
+
+	return count, nil
+}
+
+func (s *SqliteStore) GetMessage(ctx context.Context, id uuid.UUID) (*asteroid.AsteroidMessage, error) {
+	var msgData []byte
+	err := s.db.QueryRowContext(ctx, `SELECT msg_data FROM msg WHERE id = ?`, id).Scan(&msgData)
+	if err != nil {
+		return nil, fmt.Errorf("error getting message: %w", err)
+	}
+
+	var message asteroid.AsteroidMessage
+	if err := json.Unmarshal(msgData, &message); err != nil {
+		return nil, fmt.Errorf("error unmarshalling message: %w", err)
+	}
+
+	return &message, nil
+}
+
+func (s *SqliteStore) UpdateMessage(ctx context.Context, id uuid.UUID, message asteroid.AsteroidMessage) error {
+	msgData, err := json.Marshal(message)
+	if err != nil {
+		return fmt.Errorf("error marshalling message data: %w", err)
+	}
+
+	_, err = s.db.ExecContext(ctx, `UPDATE msg SET msg_data = ? WHERE id = ?`, string(msgData), id)
+	if err != nil {
+		return fmt.Errorf("error updating message: %w", err)
+	}
+
+	return nil
+}
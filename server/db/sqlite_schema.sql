@@ -0,0 +1,204 @@
+-- Schema for the embedded SQLite store. It mirrors init/schema.sql, with UUIDs
+-- stored as TEXT, JSONB and TEXT[] columns stored as JSON TEXT, and without the
+-- Postgres partitioning. Every statement is idempotent as it runs on startup.
+
+CREATE TABLE IF NOT EXISTS project (
+    id TEXT PRIMARY KEY,
+    name TEXT DEFAULT '' UNIQUE,
+    created_at TIMESTAMP,
+    run_result_tags TEXT DEFAULT '["success","failure"]' NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS supervisor (
+    id TEXT PRIMARY KEY,
+    name TEXT DEFAULT '',
+    description TEXT DEFAULT '',
+    created_at TIMESTAMP,
+    type TEXT DEFAULT 'no_supervisor' CHECK (type in ('human_supervisor', 'client_supervisor', 'no_supervisor')),
+    code TEXT DEFAULT '',
+    attributes TEXT DEFAULT '{}' NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS supervisor_name_type_idx ON supervisor (name, type);
+
+CREATE TABLE IF NOT EXISTS chain (
+    id TEXT PRIMARY KEY,
+    created_at TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS task (
+    id TEXT PRIMARY KEY,
+    project_id TEXT REFERENCES project(id),
+    name TEXT DEFAULT '',
+    description TEXT DEFAULT '',
+    created_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS task_project_id_name_idx ON task (project_id, name);
+
+CREATE TABLE IF NOT EXISTS run (
+    id TEXT PRIMARY KEY,
+    task_id TEXT REFERENCES task(id),
+    created_at TIMESTAMP,
+    status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'completed', 'failed')) NOT NULL,
+    result TEXT DEFAULT ''
+);
+
+CREATE INDEX IF NOT EXISTS run_task_id_idx ON run (task_id);
+
+CREATE TABLE IF NOT EXISTS tool (
+    id TEXT PRIMARY KEY,
+    run_id TEXT REFERENCES run(id),
+    name TEXT DEFAULT '',
+    description TEXT DEFAULT '',
+    attributes TEXT DEFAULT '{}' NOT NULL,
+    ignored_attributes TEXT DEFAULT '[]' NOT NULL,
+    code TEXT DEFAULT ''
+);
+
+CREATE INDEX IF NOT EXISTS tool_run_id_name_idx ON tool (run_id, name);
+
+CREATE TABLE IF NOT EXISTS chain_supervisor (
+    supervisor_id TEXT REFERENCES supervisor(id),
+    chain_id TEXT REFERENCES chain(id),
+    position_in_chain INTEGER,
+    PRIMARY KEY (supervisor_id, chain_id)
+);
+
+CREATE INDEX IF NOT EXISTS chain_supervisor_chain_id_idx ON chain_supervisor (chain_id, position_in_chain);
+
+CREATE TABLE IF NOT EXISTS chain_tool (
+    tool_id TEXT REFERENCES tool(id),
+    chain_id TEXT REFERENCES chain(id),
+    PRIMARY KEY (tool_id, chain_id)
+);
+
+CREATE TABLE IF NOT EXISTS chat (
+    id TEXT PRIMARY KEY,
+    created_at TIMESTAMP NOT NULL,
+    request_data TEXT DEFAULT '{}' NOT NULL,
+    response_data TEXT DEFAULT '{}' NOT NULL,
+    run_id TEXT REFERENCES run(id) NOT NULL,
+    format TEXT DEFAULT 'openai' CHECK (format IN ('openai', 'anthropic')) NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS chat_run_id_created_at_idx ON chat (run_id, created_at DESC);
+
+CREATE TABLE IF NOT EXISTS choice (
+    id TEXT PRIMARY KEY,
+    chat_id TEXT REFERENCES chat(id),
+    created_at TIMESTAMP NOT NULL,
+    choice_data TEXT DEFAULT '{}' NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS choice_chat_id_idx ON choice (chat_id);
+
+CREATE TABLE IF NOT EXISTS msg (
+    id TEXT PRIMARY KEY,
+    choice_id TEXT REFERENCES choice(id),
+    created_at TIMESTAMP NOT NULL,
+    msg_data TEXT DEFAULT '{}' NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS msg_choice_id_idx ON msg (choice_id);
+
+CREATE TABLE IF NOT EXISTS toolcall (
+    id TEXT PRIMARY KEY,
+    call_id TEXT DEFAULT '' NOT NULL,
+    tool_id TEXT REFERENCES tool(id),
+    msg_id TEXT REFERENCES msg(id),
+    created_at TIMESTAMP NOT NULL,
+    tool_call_data TEXT DEFAULT '{}' NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS toolcall_call_id_idx ON toolcall (call_id);
+CREATE INDEX IF NOT EXISTS toolcall_msg_id_idx ON toolcall (msg_id);
+CREATE INDEX IF NOT EXISTS toolcall_tool_id_created_at_idx ON toolcall (tool_id, created_at DESC);
+
+CREATE TABLE IF NOT EXISTS chainexecution (
+    id TEXT PRIMARY KEY,
+    toolcall_id TEXT REFERENCES toolcall(id),
+    chain_id TEXT REFERENCES chain(id),
+    created_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS chainexecution_toolcall_id_idx ON chainexecution (toolcall_id, chain_id);
+
+CREATE TABLE IF NOT EXISTS supervisionrequest (
+    id TEXT PRIMARY KEY,
+    chainexecution_id TEXT REFERENCES chainexecution(id),
+    supervisor_id TEXT REFERENCES supervisor(id),
+    position_in_chain INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS supervisionrequest_chainexecution_id_idx ON supervisionrequest (chainexecution_id);
+
+CREATE TABLE IF NOT EXISTS supervisionrequest_status (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    supervisionrequest_id TEXT REFERENCES supervisionrequest(id),
+    created_at TIMESTAMP NOT NULL,
+    status TEXT DEFAULT 'pending' CHECK (status IN ('timeout', 'pending', 'completed', 'failed', 'assigned'))
+);
+
+CREATE INDEX IF NOT EXISTS supervisionrequest_status_request_id_idx ON supervisionrequest_status (supervisionrequest_id, created_at DESC);
+
+CREATE TABLE IF NOT EXISTS supervisionresult (
+    id TEXT PRIMARY KEY,
+    supervisionrequest_id TEXT REFERENCES supervisionrequest(id),
+    created_at TIMESTAMP,
+    decision TEXT DEFAULT 'reject' CHECK (decision IN ('approve', 'reject', 'terminate', 'modify', 'escalate')),
+    reasoning TEXT DEFAULT '',
+    toolcall_id TEXT REFERENCES toolcall(id) NULL
+);
+
+CREATE INDEX IF NOT EXISTS supervisionresult_request_id_idx ON supervisionresult (supervisionrequest_id);
+CREATE INDEX IF NOT EXISTS supervisionresult_decision_created_at_idx ON supervisionresult (decision, created_at DESC);
+
+-- Project search. Each searched column is copied into an FTS5 table with the
+-- trigram tokenizer, next to the ID of its row, and kept in sync by triggers.
+-- Rows written before the tables existed are indexed by a migration in sqlite.go.
+-- The ID column is not indexed, so updates and deletes scan the search table;
+-- both are rare next to inserts. The Postgres store uses pg_trgm indexes on the
+-- same expressions.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS toolcall_search USING fts5(id UNINDEXED, arguments, tokenize = 'trigram');
+
+CREATE TRIGGER IF NOT EXISTS toolcall_search_insert AFTER INSERT ON toolcall BEGIN
+    INSERT INTO toolcall_search (id, arguments) VALUES (new.id, json_extract(new.tool_call_data, '$.arguments'));
+END;
+
+CREATE TRIGGER IF NOT EXISTS toolcall_search_update AFTER UPDATE OF tool_call_data ON toolcall BEGIN
+    UPDATE toolcall_search SET arguments = json_extract(new.tool_call_data, '$.arguments') WHERE id = new.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS toolcall_search_delete AFTER DELETE ON toolcall BEGIN
+    DELETE FROM toolcall_search WHERE id = old.id;
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS msg_search USING fts5(id UNINDEXED, content, tokenize = 'trigram');
+
+CREATE TRIGGER IF NOT EXISTS msg_search_insert AFTER INSERT ON msg BEGIN
+    INSERT INTO msg_search (id, content) VALUES (new.id, json_extract(new.msg_data, '$.content'));
+END;
+
+CREATE TRIGGER IF NOT EXISTS msg_search_update AFTER UPDATE OF msg_data ON msg BEGIN
+    UPDATE msg_search SET content = json_extract(new.msg_data, '$.content') WHERE id = new.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS msg_search_delete AFTER DELETE ON msg BEGIN
+    DELETE FROM msg_search WHERE id = old.id;
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS supervisionresult_search USING fts5(id UNINDEXED, reasoning, tokenize = 'trigram');
+
+CREATE TRIGGER IF NOT EXISTS supervisionresult_search_insert AFTER INSERT ON supervisionresult BEGIN
+    INSERT INTO supervisionresult_search (id, reasoning) VALUES (new.id, new.reasoning);
+END;
+
+CREATE TRIGGER IF NOT EXISTS supervisionresult_search_update AFTER UPDATE OF reasoning ON supervisionresult BEGIN
+    UPDATE supervisionresult_search SET reasoning = new.reasoning WHERE id = new.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS supervisionresult_search_delete AFTER DELETE ON supervisionresult BEGIN
+    DELETE FROM supervisionresult_search WHERE id = old.id;
+END;
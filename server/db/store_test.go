@@ -0,0 +1,661 @@
+package database
+
+import (
+	"context"
+	"encoding/json"
+	"fmt"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	asteroid "github.com/asteroidai/asteroid/server"
+	"github.com/google/uuid"
+)
+
+// The tests in this package run against every Store implementation: the SQLite
+// store in a temporary directory and, when DATABASE_URL is set, the Postgres
+// store. The Postgres database must have db/init/schema.sql applied; each test
+// works in its own project so the tests can share it.
+
+type namedStore struct {
+	name  string
+	store asteroid.Store
+}
+
+func testStores(tb testing.TB) []namedStore {
+	tb.Helper()
+
+	sqlite, err := NewSqliteStore(filepath.Join(tb.TempDir(), "test.db"))
+	if err != nil {
+		tb.Fatalf("error opening sqlite store: %v", err)
+	}
+	tb.Cleanup(func() { sqlite.Close() })
+
+	stores := []namedStore{{name: "sqlite", store: sqlite}}
+
+	if os.Getenv("DATABASE_URL") != "" {
+		postgres, err := NewPostgresqlStore()
+		if err != nil {
+			tb.Fatalf("error opening postgres store: %v", err)
+		}
+		tb.Cleanup(func() { postgres.Close() })
+
+		if err := postgres.EnsurePartitions(context.Background(), time.Now(), 0); err != nil {
+			tb.Fatalf("error creating partitions: %v", err)
+		}
+
+		stores = append(stores, namedStore{name: "postgres", store: postgres})
+	}
+
+	return stores
+}
+
+// forEachStore runs test as a subtest against every store
+func forEachStore(t *testing.T, test func(t *testing.T, store asteroid.Store)) {
+	for _, s := range testStores(t) {
+		t.Run(s.name, func(t *testing.T) {
+			test(t, s.store)
+		})
+	}
+}
+
+// fixture is a project with one task, run and tool, reviewed by a chain of one
+// client supervisor
+type fixture struct {
+	projectId    uuid.UUID
+	taskId       uuid.UUID
+	runId        uuid.UUID
+	toolId       uuid.UUID
+	supervisorId uuid.UUID
+	chainId      uuid.UUID
+}
+
+func newFixture(tb testing.TB, store asteroid.Store) fixture {
+	tb.Helper()
+	ctx := context.Background()
+	now := time.Now()
+
+	f := fixture{projectId: uuid.New()}
+	err := store.CreateProject(ctx, asteroid.Project{
+		Id:            f.projectId,
+		Name:          "test-" + f.projectId.String(),
+		CreatedAt:     now,
+		RunResultTags: []string{"success", "failure"},
+	})
+	if err != nil {
+		tb.Fatalf("error creating project: %v", err)
+	}
+
+	f.taskId = createTask(tb, store, f.projectId, "task")
+	f.runId = createRun(tb, store, f.taskId, now)
+	f.toolId = createTool(tb, store, f.runId, "bash")
+
+	f.supervisorId, err = store.CreateSupervisor(ctx, asteroid.Supervisor{
+		Name:       "supervisor-" + f.projectId.String(),
+		Type:       asteroid.ClientSupervisor,
+		CreatedAt:  now,
+		Attributes: map[string]interface{}{},
+	})
+	if err != nil {
+		tb.Fatalf("error creating supervisor: %v", err)
+	}
+
+	f.chainId = createChain(tb, store, f.toolId, f.supervisorId)
+
+	return f
+}
+
+func createTask(tb testing.TB, store asteroid.Store, projectId uuid.UUID, name string) uuid.UUID {
+	tb.Helper()
+
+	description := "test task"
+	id, err := store.CreateTask(context.Background(), asteroid.Task{
+		ProjectId:   projectId,
+		Name:        name,
+		Description: &description,
+		CreatedAt:   time.Now(),
+	})
+	if err != nil {
+		tb.Fatalf("error creating task: %v", err)
+	}
+
+	return *id
+}
+
+func createRun(tb testing.TB, store asteroid.Store, taskId uuid.UUID, createdAt time.Time) uuid.UUID {
+	tb.Helper()
+
+	id, err := store.CreateRun(context.Background(), asteroid.Run{TaskId: taskId, CreatedAt: createdAt})
+	if err != nil {
+		tb.Fatalf("error creating run: %v", err)
+	}
+
+	return id
+}
+
+func createTool(tb testing.TB, store asteroid.Store, runId uuid.UUID, name string) uuid.UUID {
+	tb.Helper()
+
+	tool, err := store.CreateTool(context.Background(), runId, map[string]interface{}{"cmd": "string"}, name, "Run a command", nil, "")
+	if err != nil {
+		tb.Fatalf("error creating tool: %v", err)
+	}
+
+	return *tool.Id
+}
+
+func createChain(tb testing.TB, store asteroid.Store, toolId uuid.UUID, supervisorId uuid.UUID) uuid.UUID {
+	tb.Helper()
+
+	supervisorIds := []uuid.UUID{supervisorId}
+	id, err := store.CreateSupervisorChain(context.Background(), toolId, asteroid.ChainRequest{SupervisorIds: &supervisorIds})
+	if err != nil {
+		tb.Fatalf("error creating supervisor chain: %v", err)
+	}
+
+	return *id
+}
+
+// createToolCalls records a chat whose single choice calls toolId once per
+// arguments, and returns the tool call IDs. The tool calls are written in one
+// transaction, so they share their created_at.
+func createToolCalls(tb testing.TB, store asteroid.Store, runId uuid.UUID, toolId uuid.UUID, arguments ...string) []uuid.UUID {
+	tb.Helper()
+
+	ids := make([]uuid.UUID, len(arguments))
+	toolCalls := make([]asteroid.AsteroidToolCall, len(arguments))
+	for i := range arguments {
+		ids[i] = uuid.New()
+		callId := fmt.Sprintf("call_%s", ids[i])
+		toolCalls[i] = asteroid.AsteroidToolCall{
+			Id:        ids[i],
+			CallId:    &callId,
+			ToolId:    toolId,
+			Arguments: &arguments[i],
+		}
+	}
+
+	createChat(tb, store, runId, `{"messages": []}`, "Calling tools", toolCalls)
+
+	return ids
+}
+
+// createChat records a chat with request as its request data and a single
+// choice with content and toolCalls
+func createChat(tb testing.TB, store asteroid.Store, runId uuid.UUID, request string, content string, toolCalls []asteroid.AsteroidToolCall) {
+	tb.Helper()
+
+	msgId := uuid.New()
+	message := asteroid.AsteroidMessage{
+		Id:      &msgId,
+		Role:    asteroid.AsteroidMessageRoleAssistant,
+		Content: content,
+	}
+	if len(toolCalls) > 0 {
+		message.ToolCalls = &toolCalls
+	}
+
+	choices := []asteroid.AsteroidChoice{{
+		AsteroidId:   uuid.New().String(),
+		FinishReason: asteroid.ToolCalls,
+		Message:      message,
+	}}
+
+	_, err := store.CreateChatRequest(context.Background(), runId, []byte(request), []byte(`{"choices": []}`), choices, "openai", nil)
+	if err != nil {
+		tb.Fatalf("error creating chat: %v", err)
+	}
+}
+
+// supervise records a review of toolCallId by the fixture's supervisor and
+// returns the supervision request ID
+func supervise(
+	tb testing.TB,
+	store asteroid.Store,
+	chainId uuid.UUID,
+	supervisorId uuid.UUID,
+	toolCallId uuid.UUID,
+	decision asteroid.Decision,
+	reasoning string,
+	createdAt time.Time,
+) uuid.UUID {
+	tb.Helper()
+	ctx := context.Background()
+
+	executionId, err := store.GetChainExecutionFromChainAndToolCall(ctx, chainId, toolCallId)
+	if err != nil {
+		tb.Fatalf("error getting chain execution: %v", err)
+	}
+	if executionId == nil {
+		tb.Fatalf("no chain execution for tool call %s", toolCallId)
+	}
+
+	requestId, err := store.CreateSupervisionRequest(ctx, asteroid.SupervisionRequest{
+		ChainexecutionId: executionId,
+		SupervisorId:     supervisorId,
+	}, chainId, toolCallId)
+	if err != nil {
+		tb.Fatalf("error creating supervision request: %v", err)
+	}
+
+	_, err = store.CreateSupervisionResult(ctx, asteroid.SupervisionResult{
+		CreatedAt:            createdAt,
+		Decision:             decision,
+		Reasoning:            reasoning,
+		SupervisionRequestId: *requestId,
+		ToolcallId:           &toolCallId,
+	}, *requestId)
+	if err != nil {
+		tb.Fatalf("error creating supervision result: %v", err)
+	}
+
+	return *requestId
+}
+
+func TestSupervisionFlow(t *testing.T) {
+	forEachStore(t, func(t *testing.T, store asteroid.Store) {
+		ctx := context.Background()
+		f := newFixture(t, store)
+
+		toolCallId := createToolCalls(t, store, f.runId, f.toolId, `{"cmd": "ls"}`)[0]
+
+		executionId, err := store.GetChainExecutionFromChainAndToolCall(ctx, f.chainId, toolCallId)
+		if err != nil {
+			t.Fatalf("error getting chain execution: %v", err)
+		}
+		if executionId == nil {
+			t.Fatal("expected a chain execution to be created with the tool call")
+		}
+
+		requestId, err := store.CreateSupervisionRequest(ctx, asteroid.SupervisionRequest{
+			ChainexecutionId: executionId,
+			SupervisorId:     f.supervisorId,
+		}, f.chainId, toolCallId)
+		if err != nil {
+			t.Fatalf("error creating supervision request: %v", err)
+		}
+
+		status, err := store.GetSupervisionRequestStatus(ctx, *requestId)
+		if err != nil {
+			t.Fatalf("error getting status: %v", err)
+		}
+		if status == nil || status.Status != asteroid.Pending {
+			t.Fatalf("expected a pending status, got %+v", status)
+		}
+
+		_, err = store.CreateSupervisionResult(ctx, asteroid.SupervisionResult{
+			CreatedAt:            time.Now(),
+			Decision:             asteroid.Approve,
+			Reasoning:            "looks fine",
+			SupervisionRequestId: *requestId,
+			ToolcallId:           &toolCallId,
+		}, *requestId)
+		if err != nil {
+			t.Fatalf("error creating supervision result: %v", err)
+		}
+
+		status, err = store.GetSupervisionRequestStatus(ctx, *requestId)
+		if err != nil {
+			t.Fatalf("error getting status: %v", err)
+		}
+		if status == nil || status.Status != asteroid.Completed {
+			t.Fatalf("expected a completed status, got %+v", status)
+		}
+
+		state, err := store.GetChainExecutionState(ctx, *executionId)
+		if err != nil {
+			t.Fatalf("error getting chain execution state: %v", err)
+		}
+		if state == nil {
+			t.Fatal("expected a chain execution state")
+		}
+		if state.ChainExecution.ToolcallId != toolCallId || state.Chain.ChainId != f.chainId {
+			t.Errorf("state is for the wrong execution: %+v", state.ChainExecution)
+		}
+		if len(state.SupervisionRequests) != 1 {
+			t.Fatalf("expected 1 supervision request, got %d", len(state.SupervisionRequests))
+		}
+
+		request := state.SupervisionRequests[0]
+		if request.Status.Status != asteroid.Completed {
+			t.Errorf("expected the request to be completed, got %s", request.Status.Status)
+		}
+		if request.Result == nil || request.Result.Decision != asteroid.Approve || request.Result.Reasoning != "looks fine" {
+			t.Errorf("unexpected result %+v", request.Result)
+		}
+	})
+}
+
+func TestGetChat(t *testing.T) {
+	forEachStore(t, func(t *testing.T, store asteroid.Store) {
+		ctx := context.Background()
+		f := newFixture(t, store)
+
+		for i := 0; i < 3; i++ {
+			createChat(t, store, f.runId, fmt.Sprintf(`{"step": %d}`, i), "", nil)
+		}
+
+		count, err := store.GetRunChatCount(ctx, f.runId)
+		if err != nil {
+			t.Fatalf("error getting chat count: %v", err)
+		}
+		if count != 3 {
+			t.Fatalf("expected 3 chats, got %d", count)
+		}
+
+		// Index 0 is the newest chat
+		for index, step := range []int{2, 1, 0} {
+			request, _, err := store.GetChat(ctx, f.runId, index)
+			if err != nil {
+				t.Fatalf("error getting chat %d: %v", index, err)
+			}
+
+			var data struct {
+				Step int `json:"step"`
+			}
+			if err := json.Unmarshal(request, &data); err != nil {
+				t.Fatalf("error decoding chat %d: %v", index, err)
+			}
+			if data.Step != step {
+				t.Errorf("expected chat %d to be step %d, got %d", index, step, data.Step)
+			}
+		}
+	})
+}
+
+func TestCountSupervisionRequests(t *testing.T) {
+	forEachStore(t, func(t *testing.T, store asteroid.Store) {
+		ctx := context.Background()
+		f := newFixture(t, store)
+
+		count := func(status asteroid.Status) int {
+			t.Helper()
+			n, err := store.CountSupervisionRequests(ctx, status)
+			if err != nil {
+				t.Fatalf("error counting %s supervision requests: %v", status, err)
+			}
+			return n
+		}
+
+		pending := count(asteroid.Pending)
+		completed := count(asteroid.Completed)
+
+		toolCallIds := createToolCalls(t, store, f.runId, f.toolId, `{"cmd": "ls"}`, `{"cmd": "pwd"}`)
+		for _, toolCallId := range toolCallIds {
+			executionId, err := store.GetChainExecutionFromChainAndToolCall(ctx, f.chainId, toolCallId)
+			if err != nil {
+				t.Fatalf("error getting chain execution: %v", err)
+			}
+
+			_, err = store.CreateSupervisionRequest(ctx, asteroid.SupervisionRequest{
+				ChainexecutionId: executionId,
+				SupervisorId:     f.supervisorId,
+			}, f.chainId, toolCallId)
+			if err != nil {
+				t.Fatalf("error creating supervision request: %v", err)
+			}
+		}
+
+		if got := count(asteroid.Pending); got != pending+2 {
+			t.Errorf("expected %d pending requests, got %d", pending+2, got)
+		}
+
+		// A request is counted by its latest status only
+		toolCallId := createToolCalls(t, store, f.runId, f.toolId, `{"cmd": "whoami"}`)[0]
+		supervise(t, store, f.chainId, f.supervisorId, toolCallId, asteroid.Approve, "", time.Now())
+
+		if got := count(asteroid.Pending); got != pending+2 {
+			t.Errorf("expected %d pending requests, got %d", pending+2, got)
+		}
+		if got := count(asteroid.Completed); got != completed+1 {
+			t.Errorf("expected %d completed requests, got %d", completed+1, got)
+		}
+	})
+}
+
+func TestGetSupervisorFromValues(t *testing.T) {
+	forEachStore(t, func(t *testing.T, store asteroid.Store) {
+		ctx := context.Background()
+
+		name := "supervisor-" + uuid.New().String()
+		supervisor := asteroid.Supervisor{
+			Name:        name,
+			Description: "reviews commands",
+			Type:        asteroid.ClientSupervisor,
+			Code:        "def review(): pass",
+			CreatedAt:   time.Now(),
+			Attributes:  map[string]interface{}{"model": "gpt-4o", "temperature": 0.0},
+		}
+
+		id, err := store.CreateSupervisor(ctx, supervisor)
+		if err != nil {
+			t.Fatalf("error creating supervisor: %v", err)
+		}
+
+		// Creating the same supervisor again returns the existing one
+		again, err := store.CreateSupervisor(ctx, supervisor)
+		if err != nil {
+			t.Fatalf("error creating supervisor: %v", err)
+		}
+		if again != id {
+			t.Errorf("expected the existing supervisor %s, got %s", id, again)
+		}
+
+		found, err := store.GetSupervisorFromValues(ctx, supervisor.Code, name, supervisor.Description, supervisor.Type, supervisor.Attributes)
+		if err != nil {
+			t.Fatalf("error getting supervisor from values: %v", err)
+		}
+		if found == nil || *found.Id != id {
+			t.Fatalf("expected supervisor %s, got %+v", id, found)
+		}
+
+		// Any differing value is a different supervisor
+		other := supervisor
+		other.Attributes = map[string]interface{}{"model": "gpt-4o-mini", "temperature": 0.0}
+		otherId, err := store.CreateSupervisor(ctx, other)
+		if err != nil {
+			t.Fatalf("error creating supervisor: %v", err)
+		}
+		if otherId == id {
+			t.Error("expected supervisors with different attributes to be distinct")
+		}
+
+		missing, err := store.GetSupervisorFromValues(ctx, supervisor.Code, name, "another description", supervisor.Type, supervisor.Attributes)
+		if err != nil {
+			t.Fatalf("error getting supervisor from values: %v", err)
+		}
+		if missing != nil {
+			t.Errorf("expected no supervisor, got %+v", missing)
+		}
+	})
+}
+
+func TestCreateRuns(t *testing.T) {
+	forEachStore(t, func(t *testing.T, store asteroid.Store) {
+		ctx := context.Background()
+		f := newFixture(t, store)
+
+		second, err := store.CreateSupervisor(ctx, asteroid.Supervisor{
+			Name:       "second-" + f.projectId.String(),
+			Type:       asteroid.ClientSupervisor,
+			CreatedAt:  time.Now(),
+			Attributes: map[string]interface{}{},
+		})
+		if err != nil {
+			t.Fatalf("error creating supervisor: %v", err)
+		}
+
+		ignored := []string{"timeout"}
+		tools := []asteroid.Tool{
+			{Name: "bash", Description: "Run a command", Attributes: map[string]interface{}{"cmd": "string"}, IgnoredAttributes: &ignored},
+			{Name: "python", Description: "Run a script", Attributes: map[string]interface{}{"code": "string"}},
+		}
+		chain := []uuid.UUID{second, f.supervisorId}
+		chains := [][]asteroid.ChainRequest{{{SupervisorIds: &chain}}, {}}
+
+		const count = 3
+		runIds, toolIds, err := store.CreateRuns(ctx, f.taskId, count, tools, chains)
+		if err != nil {
+			t.Fatalf("error creating runs: %v", err)
+		}
+		if len(runIds) != count || len(toolIds) != count {
+			t.Fatalf("expected %d runs, got %d runs and %d tool lists", count, len(runIds), len(toolIds))
+		}
+
+		seen := make(map[uuid.UUID]bool)
+		for run, runId := range runIds {
+			if len(toolIds[run]) != len(tools) {
+				t.Fatalf("run %d: expected %d tool IDs, got %d", run, len(tools), len(toolIds[run]))
+			}
+
+			for i, tool := range tools {
+				id := toolIds[run][i]
+				if seen[id] {
+					t.Errorf("run %d: tool %s is shared with another run", run, tool.Name)
+				}
+				seen[id] = true
+
+				found, err := store.GetToolFromNameAndRunId(ctx, tool.Name, runId)
+				if err != nil {
+					t.Fatalf("run %d: error getting tool %s: %v", run, tool.Name, err)
+				}
+				if found == nil || found.Id == nil || *found.Id != id || found.Description != tool.Description {
+					t.Fatalf("run %d: expected tool %s with ID %s, got %+v", run, tool.Name, id, found)
+				}
+
+				supervisorChains, err := store.GetSupervisorChains(ctx, id)
+				if err != nil {
+					t.Fatalf("run %d: error getting chains of %s: %v", run, tool.Name, err)
+				}
+				if len(supervisorChains) != len(chains[i]) {
+					t.Fatalf("run %d: expected %d chains for %s, got %d", run, len(chains[i]), tool.Name, len(supervisorChains))
+				}
+				if len(chains[i]) == 0 {
+					continue
+				}
+
+				// Every run's chain reviews with the same supervisors, in chain order
+				supervisors := supervisorChains[0].Supervisors
+				if len(supervisors) != len(chain) {
+					t.Fatalf("run %d: expected %d supervisors, got %d", run, len(chain), len(supervisors))
+				}
+				for position, supervisorId := range chain {
+					if supervisors[position].Id == nil || *supervisors[position].Id != supervisorId {
+						t.Errorf("run %d: expected supervisor %s at position %d, got %+v", run, supervisorId, position, supervisors[position])
+					}
+				}
+			}
+		}
+
+		if _, _, err := store.CreateRuns(ctx, f.taskId, 1, tools, chains[:1]); err == nil {
+			t.Error("expected an error for chains that do not match the tools")
+		}
+	})
+}
+
+func TestExportProject(t *testing.T) {
+	forEachStore(t, func(t *testing.T, store asteroid.Store) {
+		ctx := context.Background()
+		f := newFixture(t, store)
+
+		// The fixture run is created now, a second task has a run created an hour ago
+		otherTaskId := createTask(t, store, f.projectId, "other task")
+		otherRunId := createRun(t, store, otherTaskId, time.Now().Add(-time.Hour))
+		otherToolId := createTool(t, store, otherRunId, "bash")
+		createToolCalls(t, store, otherRunId, otherToolId, `{"cmd": "ls"}`)
+
+		toolCallId := createToolCalls(t, store, f.runId, f.toolId, `{"cmd": "rm -rf /tmp/x"}`)[0]
+		supervise(t, store, f.chainId, f.supervisorId, toolCallId, asteroid.Reject, "deletes files", time.Now())
+
+		export := func(params asteroid.ExportProjectParams) []asteroid.ExportRecord {
+			t.Helper()
+			records := make([]asteroid.ExportRecord, 0)
+			err := store.ExportProject(ctx, f.projectId, params, func(record asteroid.ExportRecord) error {
+				records = append(records, record)
+				return nil
+			})
+			if err != nil {
+				t.Fatalf("error exporting project: %v", err)
+			}
+			return records
+		}
+
+		runs := func(records []asteroid.ExportRecord) map[uuid.UUID]bool {
+			ids := make(map[uuid.UUID]bool)
+			for _, record := range records {
+				ids[record.RunId] = true
+			}
+			return ids
+		}
+
+		all := export(asteroid.ExportProjectParams{})
+		if got := runs(all); len(got) != 2 || !got[f.runId] || !got[otherRunId] {
+			t.Errorf("expected records of both runs, got %v", got)
+		}
+
+		byTask := export(asteroid.ExportProjectParams{TaskId: &f.taskId})
+		if got := runs(byTask); len(got) != 1 || !got[f.runId] {
+			t.Errorf("expected records of the task's run only, got %v", got)
+		}
+
+		counts := make(map[asteroid.ExportRecordType]int)
+		for _, record := range byTask {
+			counts[record.Type]++
+
+			if record.Type == asteroid.ExportRecordTypeToolCall {
+				if record.Arguments == nil || *record.Arguments != `{"cmd": "rm -rf /tmp/x"}` {
+					t.Errorf("expected the tool call arguments, got %v", record.Arguments)
+				}
+			}
+			if record.Type == asteroid.ExportRecordTypeSupervision {
+				if record.Decision == nil || *record.Decision != asteroid.Reject {
+					t.Errorf("expected a rejection, got %v", record.Decision)
+				}
+			}
+		}
+		for _, recordType := range []asteroid.ExportRecordType{
+			asteroid.ExportRecordTypeRun,
+			asteroid.ExportRecordTypeChat,
+			asteroid.ExportRecordTypeToolCall,
+			asteroid.ExportRecordTypeSupervision,
+		} {
+			if counts[recordType] != 1 {
+				t.Errorf("expected 1 %s record, got %d", recordType, counts[recordType])
+			}
+		}
+
+		from := time.Now().Add(-30 * time.Minute)
+		recent := export(asteroid.ExportProjectParams{From: &from})
+		if got := runs(recent); len(got) != 1 || !got[f.runId] {
+			t.Errorf("expected records of the recent run only, got %v", got)
+		}
+
+		old := export(asteroid.ExportProjectParams{To: &from})
+		if got := runs(old); len(got) != 1 || !got[otherRunId] {
+			t.Errorf("expected records of the old run only, got %v", got)
+		}
+	})
+}
+
+// BenchmarkSuperviseToolCall measures the store operations the API makes for
+// one tool call reviewed by a single client supervisor. It runs a sub-benchmark
+// per store, named store=<name>, so that benchstat can put the stores side by
+// side, see the README.
+func BenchmarkSuperviseToolCall(b *testing.B) {
+	for _, s := range testStores(b) {
+		b.Run("store="+s.name, func(b *testing.B) {
+			f := newFixture(b, s.store)
+
+			b.ResetTimer()
+			for i := 0; i < b.N; i++ {
+				toolCallId := createToolCalls(b, s.store, f.runId, f.toolId, fmt.Sprintf(`{"cmd": "ls /tmp/%d"}`, i))[0]
+				requestId := supervise(b, s.store, f.chainId, f.supervisorId, toolCallId, asteroid.Approve, "benchmark", time.Now())
+
+				if _, err := s.store.GetSupervisionRequestStatus(context.Background(), requestId); err != nil {
+					b.Fatalf("error getting status: %v", err)
+				}
+			}
+		})
+	}
+}
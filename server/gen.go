@@ -50,6 +50,14 @@ const (
 	Terminate Decision = "terminate"
 )
 
+// Defines values for ExportRecordType.
+const (
+	ExportRecordTypeChat        ExportRecordType = "chat"
+	ExportRecordTypeRun         ExportRecordType = "run"
+	ExportRecordTypeSupervision ExportRecordType = "supervision"
+	ExportRecordTypeToolCall    ExportRecordType = "tool_call"
+)
+
 // Defines values for MessageRole.
 const (
 	MessageRoleAssistant MessageRole = "assistant"
@@ -65,6 +73,13 @@ const (
 	Text     MessageType = "text"
 )
 
+// Defines values for SearchResultType.
+const (
+	SearchResultTypeMessage     SearchResultType = "message"
+	SearchResultTypeSupervision SearchResultType = "supervision"
+	SearchResultTypeToolCall    SearchResultType = "tool_call"
+)
+
 // Defines values for Status.
 const (
 	Assigned  Status = "assigned"
@@ -81,6 +96,13 @@ const (
 	NoSupervisor     SupervisorType = "no_supervisor"
 )
 
+// Defines values for SearchProjectParamsType.
+const (
+	SearchProjectParamsTypeMessage     SearchProjectParamsType = "message"
+	SearchProjectParamsTypeSupervision SearchProjectParamsType = "supervision"
+	SearchProjectParamsTypeToolCall    SearchProjectParamsType = "tool_call"
+)
+
 // AsteroidChat The raw b64 encoded JSON of the request and response data sent/received from the LLM.
 type AsteroidChat struct {
 	RequestData  string `json:"request_data"`
@@ -168,6 +190,39 @@ type ErrorResponse struct {
 	Error   string  `json:"error"`
 }
 
+// ExportRecord A single line of a project export. Which of the optional fields are set depends on the record type.
+type ExportRecord struct {
+	// Arguments Tool call arguments in JSON format
+	Arguments       *string            `json:"arguments,omitempty"`
+	CallId          *string            `json:"call_id,omitempty"`
+	CreatedAt       time.Time          `json:"created_at"`
+	Decision        *Decision          `json:"decision,omitempty"`
+	Id              openapi_types.UUID `json:"id"`
+	PositionInChain *int               `json:"position_in_chain,omitempty"`
+	Reasoning       *string            `json:"reasoning,omitempty"`
+
+	// RequestData The JSON request sent to the LLM
+	RequestData *string `json:"request_data,omitempty"`
+
+	// ResponseData The JSON response received from the LLM
+	ResponseData   *string             `json:"response_data,omitempty"`
+	Result         *string             `json:"result,omitempty"`
+	RunId          openapi_types.UUID  `json:"run_id"`
+	Status         *Status             `json:"status,omitempty"`
+	SupervisorId   *openapi_types.UUID `json:"supervisor_id,omitempty"`
+	SupervisorName *string             `json:"supervisor_name,omitempty"`
+
+	// SupervisorType The type of supervisor. ClientSupervisor means that the supervision is done client side and the server is merely informed. Other supervisor types are handled serverside, e.g. HumanSupervisor means that a human will review the request via the Asteroid UI.
+	SupervisorType *SupervisorType     `json:"supervisor_type,omitempty"`
+	TaskId         openapi_types.UUID  `json:"task_id"`
+	ToolCallId     *openapi_types.UUID `json:"tool_call_id,omitempty"`
+	ToolName       *string             `json:"tool_name,omitempty"`
+	Type           ExportRecordType    `json:"type"`
+}
+
+// ExportRecordType defines model for ExportRecord.Type.
+type ExportRecordType string
+
 // HubStats defines model for HubStats.
 type HubStats struct {
 	AssignedReviews       map[string]int `json:"assigned_reviews"`
@@ -194,6 +249,38 @@ type Project struct {
 	RunResultTags []string           `json:"run_result_tags"`
 }
 
+// RegisterRunsRequest The runs to register, e.g. one per sample and epoch of an eval
+type RegisterRunsRequest struct {
+	ProjectName     string             `json:"project_name"`
+	RunCount        int                `json:"run_count"`
+	RunResultTags   []string           `json:"run_result_tags"`
+	TaskDescription *string            `json:"task_description,omitempty"`
+	TaskName        string             `json:"task_name"`
+	Tools           []RegisterRunsTool `json:"tools"`
+}
+
+// RegisterRunsResponse defines model for RegisterRunsResponse.
+type RegisterRunsResponse struct {
+	ProjectId openapi_types.UUID   `json:"project_id"`
+	RunIds    []openapi_types.UUID `json:"run_ids"`
+	TaskId    openapi_types.UUID   `json:"task_id"`
+
+	// ToolIds The tool IDs of each run, in the order of run_ids and of the tools in the request
+	ToolIds [][]openapi_types.UUID `json:"tool_ids"`
+}
+
+// RegisterRunsTool defines model for RegisterRunsTool.
+type RegisterRunsTool struct {
+	Attributes map[string]interface{} `json:"attributes"`
+
+	// Chains The supervisor chains of the tool, each a list of supervisors in chain order
+	Chains            *[][]Supervisor `json:"chains,omitempty"`
+	Code              string          `json:"code"`
+	Description       string          `json:"description"`
+	IgnoredAttributes *[]string       `json:"ignored_attributes,omitempty"`
+	Name              string          `json:"name"`
+}
+
 // ReviewPayload Contains all the information needed for a human reviewer to make a supervision decision
 type ReviewPayload struct {
 	ChainState ChainExecutionState `json:"chain_state"`
@@ -226,6 +313,32 @@ type RunExecution struct {
 // RunState defines model for RunState.
 type RunState = []RunExecution
 
+// SearchResult A record matching a search. Which of the optional fields are set depends on the record type.
+type SearchResult struct {
+	CreatedAt time.Time          `json:"created_at"`
+	Decision  *Decision          `json:"decision,omitempty"`
+	Id        openapi_types.UUID `json:"id"`
+	RunId     openapi_types.UUID `json:"run_id"`
+	TaskId    openapi_types.UUID `json:"task_id"`
+
+	// Text The searched text, i.e. the tool call arguments, the message or the supervision reasoning
+	Text       string              `json:"text"`
+	ToolCallId *openapi_types.UUID `json:"tool_call_id,omitempty"`
+	ToolId     *openapi_types.UUID `json:"tool_id,omitempty"`
+	ToolName   *string             `json:"tool_name,omitempty"`
+	Type       SearchResultType    `json:"type"`
+}
+
+// SearchResultType defines model for SearchResult.Type.
+type SearchResultType string
+
+// SearchResults defines model for SearchResults.
+type SearchResults struct {
+	// NextCursor Cursor of the next page, not set on the last page
+	NextCursor *string        `json:"next_cursor,omitempty"`
+	Results    []SearchResult `json:"results"`
+}
+
 // Status defines model for Status.
 type Status string
 
@@ -317,6 +430,51 @@ type CreateProjectJSONBody struct {
 	RunResultTags []string `json:"run_result_tags"`
 }
 
+// ExportProjectParams defines parameters for ExportProject.
+type ExportProjectParams struct {
+	// TaskId Only export runs of this task
+	TaskId *openapi_types.UUID `form:"task_id,omitempty" json:"task_id,omitempty"`
+
+	// From Only export runs created at or after this time
+	From *time.Time `form:"from,omitempty" json:"from,omitempty"`
+
+	// To Only export runs created before this time
+	To *time.Time `form:"to,omitempty" json:"to,omitempty"`
+}
+
+// SearchProjectParams defines parameters for SearchProject.
+type SearchProjectParams struct {
+	// Q Text to search for, at least 3 characters
+	Q string `form:"q" json:"q"`
+
+	// Type Type of the records to search
+	Type SearchProjectParamsType `form:"type" json:"type"`
+
+	// RunId Only search records of this run
+	RunId *openapi_types.UUID `form:"run_id,omitempty" json:"run_id,omitempty"`
+
+	// Tool Only search tool calls of, or supervisions of tool calls of, the tool with this name
+	Tool *string `form:"tool,omitempty" json:"tool,omitempty"`
+
+	// Decision Only search supervisions with this decision, or tool calls with a supervision with this decision
+	Decision *Decision `form:"decision,omitempty" json:"decision,omitempty"`
+
+	// From Only search records created at or after this time
+	From *time.Time `form:"from,omitempty" json:"from,omitempty"`
+
+	// To Only search records created before this time
+	To *time.Time `form:"to,omitempty" json:"to,omitempty"`
+
+	// Cursor The next_cursor of the previous page
+	Cursor *string `form:"cursor,omitempty" json:"cursor,omitempty"`
+
+	// Limit Maximum number of results, 50 by default
+	Limit *int `form:"limit,omitempty" json:"limit,omitempty"`
+}
+
+// SearchProjectParamsType defines parameters for SearchProject.
+type SearchProjectParamsType string
+
 // CreateTaskJSONBody defines parameters for CreateTask.
 type CreateTaskJSONBody struct {
 	Description *string `json:"description,omitempty"`
@@ -349,6 +507,9 @@ type CreateSupervisorJSONRequestBody = Supervisor
 // CreateTaskJSONRequestBody defines body for CreateTask for application/json ContentType.
 type CreateTaskJSONRequestBody CreateTaskJSONBody
 
+// RegisterRunsJSONRequestBody defines body for RegisterRuns for application/json ContentType.
+type RegisterRunsJSONRequestBody = RegisterRunsRequest
+
 // UpdateRunResultJSONRequestBody defines body for UpdateRunResult for application/json ContentType.
 type UpdateRunResultJSONRequestBody UpdateRunResultJSONBody
 
@@ -384,6 +545,12 @@ type ServerInterface interface {
 	// Get a project
 	// (GET /project/{projectId})
 	GetProject(w http.ResponseWriter, r *http.Request, projectId openapi_types.UUID)
+	// Stream the runs, chats, tool calls and supervisions of a project as NDJSON
+	// (GET /project/{projectId}/export)
+	ExportProject(w http.ResponseWriter, r *http.Request, projectId openapi_types.UUID, params ExportProjectParams)
+	// Search the tool calls, messages or supervision results of a project
+	// (GET /project/{projectId}/search)
+	SearchProject(w http.ResponseWriter, r *http.Request, projectId openapi_types.UUID, params SearchProjectParams)
 	// Get all supervisors
 	// (GET /project/{projectId}/supervisor)
 	GetSupervisors(w http.ResponseWriter, r *http.Request, projectId openapi_types.UUID)
@@ -399,6 +566,9 @@ type ServerInterface interface {
 	// Get all tools for a project
 	// (GET /project/{projectId}/tools)
 	GetProjectTools(w http.ResponseWriter, r *http.Request, projectId openapi_types.UUID)
+	// Register the runs of a task, with their tools and supervisor chains, in one request
+	// (POST /register_runs)
+	RegisterRuns(w http.ResponseWriter, r *http.Request)
 	// Get a run
 	// (GET /run/{runId})
 	GetRun(w http.ResponseWriter, r *http.Request, runId openapi_types.UUID)
@@ -555,6 +725,172 @@ func (siw *ServerInterfaceWrapper) GetProject(w http.ResponseWriter, r *http.Req
 	handler.ServeHTTP(w, r)
 }
 
+// ExportProject operation middleware
+func (siw *ServerInterfaceWrapper) ExportProject(w http.ResponseWriter, r *http.Request) {
+
+	var err error
+
+	// ------------- Path parameter "projectId" -------------
+	var projectId openapi_types.UUID
+
+	err = runtime.BindStyledParameterWithOptions("simple", "projectId", r.PathValue("projectId"), &projectId, runtime.BindStyledParameterOptions{ParamLocation: runtime.ParamLocationPath, Explode: false, Required: true})
+	if err != nil {
+		siw.ErrorHandlerFunc(w, r, &InvalidParamFormatError{ParamName: "projectId", Err: err})
+		return
+	}
+
+	// Parameter object where we will unmarshal all parameters from the context
+	var params ExportProjectParams
+
+	// ------------- Optional query parameter "task_id" -------------
+
+	err = runtime.BindQueryParameter("form", true, false, "task_id", r.URL.Query(), &params.TaskId)
+	if err != nil {
+		siw.ErrorHandlerFunc(w, r, &InvalidParamFormatError{ParamName: "task_id", Err: err})
+		return
+	}
+
+	// ------------- Optional query parameter "from" -------------
+
+	err = runtime.BindQueryParameter("form", true, false, "from", r.URL.Query(), &params.From)
+	if err != nil {
+		siw.ErrorHandlerFunc(w, r, &InvalidParamFormatError{ParamName: "from", Err: err})
+		return
+	}
+
+	// ------------- Optional query parameter "to" -------------
+
+	err = runtime.BindQueryParameter("form", true, false, "to", r.URL.Query(), &params.To)
+	if err != nil {
+		siw.ErrorHandlerFunc(w, r, &InvalidParamFormatError{ParamName: "to", Err: err})
+		return
+	}
+
+	handler := http.Handler(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		siw.Handler.ExportProject(w, r, projectId, params)
+	}))
+
+	for _, middleware := range siw.HandlerMiddlewares {
+		handler = middleware(handler)
+	}
+
+	handler.ServeHTTP(w, r)
+}
+
+// SearchProject operation middleware
+func (siw *ServerInterfaceWrapper) SearchProject(w http.ResponseWriter, r *http.Request) {
+
+	var err error
+
+	// ------------- Path parameter "projectId" -------------
+	var projectId openapi_types.UUID
+
+	err = runtime.BindStyledParameterWithOptions("simple", "projectId", r.PathValue("projectId"), &projectId, runtime.BindStyledParameterOptions{ParamLocation: runtime.ParamLocationPath, Explode: false, Required: true})
+	if err != nil {
+		siw.ErrorHandlerFunc(w, r, &InvalidParamFormatError{ParamName: "projectId", Err: err})
+		return
+	}
+
+	// Parameter object where we will unmarshal all parameters from the context
+	var params SearchProjectParams
+
+	// ------------- Required query parameter "q" -------------
+
+	if paramValue := r.URL.Query().Get("q"); paramValue != "" {
+
+	} else {
+		siw.ErrorHandlerFunc(w, r, &RequiredParamError{ParamName: "q"})
+		return
+	}
+
+	err = runtime.BindQueryParameter("form", true, true, "q", r.URL.Query(), &params.Q)
+	if err != nil {
+		siw.ErrorHandlerFunc(w, r, &InvalidParamFormatError{ParamName: "q", Err: err})
+		return
+	}
+
+	// ------------- Required query parameter "type" -------------
+
+	if paramValue := r.URL.Query().Get("type"); paramValue != "" {
+
+	} else {
+		siw.ErrorHandlerFunc(w, r, &RequiredParamError{ParamName: "type"})
+		return
+	}
+
+	err = runtime.BindQueryParameter("form", true, true, "type", r.URL.Query(), &params.Type)
+	if err != nil {
+		siw.ErrorHandlerFunc(w, r, &InvalidParamFormatError{ParamName: "type", Err: err})
+		return
+	}
+
+	// ------------- Optional query parameter "run_id" -------------
+
+	err = runtime.BindQueryParameter("form", true, false, "run_id", r.URL.Query(), &params.RunId)
+	if err != nil {
+		siw.ErrorHandlerFunc(w, r, &InvalidParamFormatError{ParamName: "run_id", Err: err})
+		return
+	}
+
+	// ------------- Optional query parameter "tool" -------------
+
+	err = runtime.BindQueryParameter("form", true, false, "tool", r.URL.Query(), &params.Tool)
+	if err != nil {
+		siw.ErrorHandlerFunc(w, r, &InvalidParamFormatError{ParamName: "tool", Err: err})
+		return
+	}
+
+	// ------------- Optional query parameter "decision" -------------
+
+	err = runtime.BindQueryParameter("form", true, false, "decision", r.URL.Query(), &params.Decision)
+	if err != nil {
+		siw.ErrorHandlerFunc(w, r, &InvalidParamFormatError{ParamName: "decision", Err: err})
+		return
+	}
+
+	// ------------- Optional query parameter "from" -------------
+
+	err = runtime.BindQueryParameter("form", true, false, "from", r.URL.Query(), &params.From)
+	if err != nil {
+		siw.ErrorHandlerFunc(w, r, &InvalidParamFormatError{ParamName: "from", Err: err})
+		return
+	}
+
+	// ------------- Optional query parameter "to" -------------
+
+	err = runtime.BindQueryParameter("form", true, false, "to", r.URL.Query(), &params.To)
+	if err != nil {
+		siw.ErrorHandlerFunc(w, r, &InvalidParamFormatError{ParamName: "to", Err: err})
+		return
+	}
+
+	// ------------- Optional query parameter "cursor" -------------
+
+	err = runtime.BindQueryParameter("form", true, false, "cursor", r.URL.Query(), &params.Cursor)
+	if err != nil {
+		siw.ErrorHandlerFunc(w, r, &InvalidParamFormatError{ParamName: "cursor", Err: err})
+		return
+	}
+
+	// ------------- Optional query parameter "limit" -------------
+
+	err = runtime.BindQueryParameter("form", true, false, "limit", r.URL.Query(), &params.Limit)
+	if err != nil {
+		siw.ErrorHandlerFunc(w, r, &InvalidParamFormatError{ParamName: "limit", Err: err})
+		return
+	}
+
+	handler := http.Handler(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		siw.Handler.SearchProject(w, r, projectId, params)
+	}))
+
+	for _, middleware := range siw.HandlerMiddlewares {
+		handler = middleware(handler)
+	}
+
+	handler.ServeHTTP(w, r)
+}
+
 // GetSupervisors operation middleware
 func (siw *ServerInterfaceWrapper) GetSupervisors(w http.ResponseWriter, r *http.Request) {
 
@@ -680,6 +1016,20 @@ func (siw *ServerInterfaceWrapper) GetProjectTools(w http.ResponseWriter, r *htt
 	handler.ServeHTTP(w, r)
 }
 
+// RegisterRuns operation middleware
+func (siw *ServerInterfaceWrapper) RegisterRuns(w http.ResponseWriter, r *http.Request) {
+
+	handler := http.Handler(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		siw.Handler.RegisterRuns(w, r)
+	}))
+
+	for _, middleware := range siw.HandlerMiddlewares {
+		handler = middleware(handler)
+	}
+
+	handler.ServeHTTP(w, r)
+}
+
 // GetRun operation middleware
 func (siw *ServerInterfaceWrapper) GetRun(w http.ResponseWriter, r *http.Request) {
 
@@ -1459,11 +1809,14 @@ func HandlerWithOptions(si ServerInterface, options StdHTTPServerOptions) http.H
 	m.HandleFunc("GET "+options.BaseURL+"/project", wrapper.GetProjects)
 	m.HandleFunc("POST "+options.BaseURL+"/project", wrapper.CreateProject)
 	m.HandleFunc("GET "+options.BaseURL+"/project/{projectId}", wrapper.GetProject)
+	m.HandleFunc("GET "+options.BaseURL+"/project/{projectId}/export", wrapper.ExportProject)
+	m.HandleFunc("GET "+options.BaseURL+"/project/{projectId}/search", wrapper.SearchProject)
 	m.HandleFunc("GET "+options.BaseURL+"/project/{projectId}/supervisor", wrapper.GetSupervisors)
 	m.HandleFunc("POST "+options.BaseURL+"/project/{projectId}/supervisor", wrapper.CreateSupervisor)
 	m.HandleFunc("GET "+options.BaseURL+"/project/{projectId}/tasks", wrapper.GetProjectTasks)
 	m.HandleFunc("POST "+options.BaseURL+"/project/{projectId}/tasks", wrapper.CreateTask)
 	m.HandleFunc("GET "+options.BaseURL+"/project/{projectId}/tools", wrapper.GetProjectTools)
+	m.HandleFunc("POST "+options.BaseURL+"/register_runs", wrapper.RegisterRuns)
 	m.HandleFunc("GET "+options.BaseURL+"/run/{runId}", wrapper.GetRun)
 	m.HandleFunc("PUT "+options.BaseURL+"/run/{runId}/result", wrapper.UpdateRunResult)
 	m.HandleFunc("GET "+options.BaseURL+"/run/{runId}/status", wrapper.GetRunStatus)
@@ -1497,60 +1850,83 @@ func HandlerWithOptions(si ServerInterface, options StdHTTPServerOptions) http.H
 // Base64 encoded, gzipped, json marshaled Swagger object
 var swaggerSpec = []string{
 
-	"H4sIAAAAAAAC/+RcW2/cNvb/KgT//0fVk3SDPvitdYqtF00a2Om+FMGAHh2P2WhIhaTsGAN/9wVvEiVR",
-	"EjWekb3Yl8S2eDnnd+6HlPZ4w3clZ8CUxOd7LDd3sCPmx5+lAsFpfnFHlP49B7kRtFSUM3yOP98BEuQB",
-	"3fz0DgHb8Bxy9K/rPz4ifouUfgbfKpAKEZYjAbLkTALKiSJIAlMrARug95CjW8F3ZsLvv384wxkuBS9B",
-	"KAqGBrfKWk/Uv99ysdPU4Bsi4ad3OMPqsQR8jqUSlG3xU4b9ZulzzKRvFRWQ4/O/2nt21/tSz+Y3f8NG",
-	"6R0boDjdgN6yzQRxz9c017/2KL6ljMq7tQAiNbR7DKzaaUqk4iXOcAFsq+5whm8rttHwrzekKDQfnBfm",
-	"Z4kzvOFMAVPrW1ooEDhjVVF8ieBDWQ7fAzooU7AFoR/tQEqyNRz8v4BbfI7/b9Wox8rpxsrz+8EN7wIY",
-	"8uv3axbv8juG6IeGoDakjtkonBsBREG+tlpbSz8nCn5QdAcxpfG6Mk/HHUvIEi4RZYgqibigW8pIgfTe",
-	"mt9ppbWaUQ+sKgNdX7d5AS0FeZQK9BaV1CLHREoqFWEqUBanJ+apRRXH1CLQpfM9pgp2MlUPPnNeXGiN",
-	"fKrXJUKQx+b38XWclD/roT1j1BzXyj2qLDUZfQMU22rnPVxbxD/7R1p4RrZOCBGINDpDNnyI0iUKnZEd",
-	"RPc0IktapAOqHeJmu8GBwsRAvrgjlP36HTaVBa5nkPr5OpGjE4KluQrkdCAufoWs4atF9TRC14ooGIBp",
-	"yh6uqxLEPZVcmDUNYoYMCPEfW6EjracMS7emjh4uwKUb+nUz+crOtez17L2Dp+V2YPM+U4Oouk37cMoa",
-	"qTXNo9YtyKP21s1AdPleIsWRlSYyNEj0QE2ArdGY1rMu3zHK1aUlqqcDKtlSTErhmUsSls1C9M4J4lFe",
-	"y+tt4kLwS0aYcTOjHsoFyKHHdcyZxaD382ksevJaxHS3jjH9HjZGY8N4S8pS8HswWaEZl2EFYkeZtoYM",
-	"73hObx9xhkFuSKH/Fou0vwrBxZXLKvuI5qAItVG4NxX01MiTDtd2WIyp36obbboylqRKumWQrwXcU3iw",
-	"f8tzqi2JFJ9aY/uZY2+j7nLrDa9a+Vow+aaSj+tNQX2E7o/QWlCASltuwxmDjR48uuatABgfUQLLKdum",
-	"7GmHrHOqJXJT++iDAeyqcY+lDH+roArElelqQbT+0OKwA3NfQjjOxTD4QwANCj+mkC73u0pObGMWFSaQ",
-	"wSIKvhtqqpxy7dx3tvww/68rUUTX+iS4oa3v6V4gwxOVDpiyKtRakW3bRU6HpFCDzBatHCaz6U53i5iQ",
-	"rowYP5HHgpO8H2UvOFMmipKiMHURZZZlyhliALpsuuUCEXRX7QhDVitA6DC8I18BERRkCCj3jjeL5pjS",
-	"Z1bpCVCdrbgQIOOlnn+qSwHTwqhYmBPMKon7lZAGmubxnS/f122TSu9NpQMJUamhC4vIISWKJFnz87ow",
-	"hZ5f/nV0LkZR1pJisFkNUCClqC5WbFHbtLYRNTjNQzWdPNtRGlgivz6jLnGzJwuRq2qyUJuTTUYNqavc",
-	"s6E4lo4F+uM4q4kZwKauzJL4b4EZYfy6ZtxHHRcUw8CpzZfQwvzgY6OWKN0Br+IhLWKacVHW5VNqSZE4",
-	"rOSS2mXZuq5a+3lLouAbbhodaBVv842iPT1GcEwBhkrZHriN3Sd7UDPhOJg804knOeIRM+mzdRSXmwcl",
-	"1RhLdek1x00TyZn+Jeqp+wCsl2goDezbycOChKdhY0Isjd85ViQ82LbHlPfwcOc2n4x2TbMsUtMqW8e0",
-	"iq5m6obncLwThDCp25+g2ZvQSG+wiPbSXQ0QUtrRRNcJNsBkIXzjyF/4+PCMnnDjzuf3JblIa0Va2wt3",
-	"GufLF5T9hF1PavcVz9CFKa2b2WgHhEmk7ogyqX1Y41CJcs4A2XIcSZqDOSk140Dcg9BDdiCgeHTlFORn",
-	"6A91ByJsZmo6JCIC0B1heQG5m60XzBCcbc/Qb7rmilPlC7IHWhS+4AjPbu8pMb/7LAz9eXmGszrTscSv",
-	"G3Jwhs2C7T8xHv4eS3Y+E/n1WBHmtFZY2u7A4W4tWCCLFOUxfdS57/F825EQoltmuk1tMlKbExMtj0PQ",
-	"ravHqJcLyHTYDCHtO8s9wMOO8dRxXJ/Ubn/PHMTf8r53+bc2Xs7QW98RqI3v50+XpmhQhV6p8+d7Ow2f",
-	"4/u3Z2/O3miCeAmMlBSf43+cvTl7q7WPqDvDzMo9O3skO6NcWzBWphk2fZvLHJ/jf4L6owRmd/D3IMz8",
-	"H9+86ZPuxiLrng3bstrtiHi0axl2OoN0XbuVWoB6ly96zqpsWnBDZLkunRygK7geQMqyoBszefW3u1/h",
-	"9k4NM74l2I8xXXvCv1OptOBKT18fBFIUzeOGfb/JF1t7Rdi+MG7Cj8v8PZVfeP44i+e2Wi/Xe5zuNLYn",
-	"KlHB0zPlO+VDegJ08KJbXrFcc/bjm7fL7OiigN7z3Uwux5S3fdoU2f8XkvuA39FWq3CIIAYPXmWjGhsY",
-	"7WrvfrjMnxIM+Ln2m2S2g5hbrN8th7WXNeO1hvX9wyjU2ocLsgMFOk/+a4914m38ug9957iWAO6aUzZD",
-	"Ub8MSHUlWxXXkICvgyx7CSc9WgsM+umwFoi7atniwwsk2G1RmYzHhusw7T40PKSCnOKsT+w6g6rmlXvP",
-	"VkEUVaIha1NEfpUJnvSzGbeEpZlqbYaNWQ5epastCkudO57sO17D6yuycEPPsVK/qVJwIDWMZXeH5XIn",
-	"dg8arMYxDBunsqB2ZD5okJwXSQZpxi1ikJwXswzSUDZgDvrZsDnonRZPQkTFVntRsYmU8qpip0wn9fIR",
-	"UM2fF/ZtVxWbSCHt1QUvNk1jmtQMykeV2Ko5SFtk+wyXVUQ//ixzouCq8udZx/Khg9cDng73iH1h211e",
-	"YZJjYbUKZy7R6h89wm316+pFc7o0YtDX/hToZGbtj6/iVibrw61XZeDmmMCQpv35i5r7lL0FEjxBPRII",
-	"b8q03sVNy8FYGXrzuHqnwN1Vb+W69iPK/d+fIbSBmJEdHEfxRhJlB+/R/PzJjltOc46ScvKbciZy/I7s",
-	"tJpGEnnOi8M7sgfvmFI6WMoGbSH0CmuaP6027mXaJBOxB1ons5GP8GDe7T2Nb269PrywIvl3byKS/QgP",
-	"SAsBudt5lLPXkVe9ohSjpeJdsPzlAPPiNmEIvlOpKNtORsVa/5sXKUaCoxbhhXuf4Fl60r3XFFGJancD",
-	"Qsc9wyswJSjYEOevgXfw0XSZZ2x46rOysmdbfg94f6l6tTcvZE9V0h/8Hewl0pPJ2/Nx9a3vib/G9Lx+",
-	"meDFdSGLLuxfyx9et2c4Rqmkf31sSHnqV8xO6N/rPSLC+a26QZbIpd35JbsnBR0qlbVi3NW0BacA5nfr",
-	"KiM3KFd72bvg226rTJ3ANZd4T1lG9y9C9wGqS9fgJpxrbVgraT8YQpFEFogcq5hXipOMLIbwEud0bcmc",
-	"7riuI5RXcmoXSH8i056lL0OKMNu+zLuQZfPSW5KdhS/KnbIZ3dooFqLsbU5Hfp3LRA1s4eh53adhMpqK",
-	"PjvzpP8ybmCmzk23ROOvr5y4Q9p/USXVtVvh+ibqpCNvDX+9kuSiESAXE6dSnTsZJ5YRF+P3JEaFMHw5",
-	"YQ7mGpEjYP1AtlsQP1R0FFw76j3fyKQbqm48+vNywM8EA2I3UxWRX1d7/e+E1Otz+lN1yswdjPiRd1TG",
-	"8TPuFLlabp8v0RZ2ujadwu+qYsuUn+4IN7U5LjRd8d64fuSCUwfw9IrvGHhP9sbx0kmfLpkT+qmiYmP4",
-	"GT3ivFjt9b9TNuj7/y/QrV48qTIN6/E7Ae4rcAec1liwj+ACQtGtOm98jYmx86rZ0jdK689wpbqI4KtS",
-	"OqxQMe+iqTcBzosMUWaXCz5Md2iIPoYcJ+6nDQnrsOI2/RMF4fcrekI6bsF78EfCeupi8Rn3i64FX6tT",
-	"XE3GbpXWLy5Z07MvOE16zgv3UY5Tec/Ilx0GTuHclyWXd6d65wSfivzXWAPHajhKN0ork+M42L6oV0Z/",
-	"VnvzX9vzdgqZ1cD3BxbjIt6rdoSfYOXjFS0zOn6+U3Hylp9voL62np+t8/8XT10/Tp24xhoi7W4XFzol",
-	"IC4p4GzAC/WbnwPOof6e1lQ0uHafbDrlDdvgWztjTtnSPHwvDuw9reW88xxvPN3lCxF/qduPQewdi3v9",
-	"bt1LhT9Npf32gdlq3lvVlSjwOV6Rkq7u3+KnL0//CQAA//+5tfBfGF8AAA==",
+	"H4sIAAAAAAACA+Ud23LbNvZXMNp9VCWnTfchb6mT2XonSTO2u/vQyWhgEZLYSqRCkHY8nvz7nnNwIUiC",
+	"JCiLsna2D6kl4nJw7jdCT5NlutuniUhyOXnzNJHLjdhx+vOtzEWWxtHlhuf4ORJymcX7PE6TyZvJ7Uaw",
+	"jD+wu3+8ZiJZppGI2L9ufvvE0hXL8Zn4WgiZM55E8LeELaRgEc85k7DXPBNLEd/DnFWW7mjChw8fZ5Pp",
+	"ZJ+le5HlsSAY9CoLnIifV2m2Q2gmd1yKf7yG8fnjXsBnmWdxsp58n07MZuFzaNLXIs5ENHnzR3XP+npf",
+	"7Oz07k+xzHHHElFpvBS4ZfUQXD9fxBF+bEC8ipNYbhaZ4BJR+zQRSbFDSGSe7gGCrUjW+Qb+WBXJEtG/",
+	"WPLtFs+Rplv6W8KHZZrkgNnFKt7CdpNpUmy3Xzz4iZNIfHPgiGHaGibAo52Qkq/pBH/PxAoe/m1essdc",
+	"88bcnPejHl5HoHtes1+5eP28XRj9WAJURak+rBedS1g4F9FCca2lPpBP/JDHO+FjGsMrw3hcH4kpwCWL",
+	"ExbD/9IsXscJ3zLcG8/bz7SKM+zAoiDUNXk73YoKgzwConCLQiLJAfMyljkHxJTMovmEniqsTnxs4fAS",
+	"bBDDsjKUD25h6iVy5He7Ls8y/lh+7l5HU/kWhzaEEU9smbuTWSwYTQHM1sXOaLgqid+aR0g8oq0mggdF",
+	"iJ02GT6E6QKJnvCd8O5JJAtapIZUNUTP1oMdhvEhGYxAnLz/JpaFQlxDIPH5IvBEIyILT+XQ6UC8mBWm",
+	"5bkqUPdj6CaHsS1o6pOHmwJm3McyzWhNwhiBIVz8d61QoxYsIPWaaD20gQsX9Jty8rWaq47XkPcaPtVp",
+	"WzZvHqoVq3rTJjqlxRSQyCvdABZq63Igu3onWZ4yRU1GMEj2EJOBtdjo57P6uX2Q51cKqAYP5MGSQi6F",
+	"OVwQsZQXgjsHkCc3XG638RPBLOk5jJ7p1VDaQLY9tjZn0AGNng87ogGvAkx9a9+h34klcaxrb/keTn8v",
+	"yCukcTBPZDsw9jl+uUujePUIfwAT8i1+57O077Msza61V9nEaCRyHisr3JgqcKrnSe3UapjvUO+/7dMs",
+	"vxbLNIs84sIkLLcVbBsnAsWGM4AN5zJBE2fsP5t4uTH+T0oT0dGJxTaSjGcCvPucRWIvEvicJjoUwO0Y",
+	"AtP08DtsMxKaIY0Yf0ErHTl80MWWll/CjdU+lTH586AGrWVouuXKUcY5vjPVQ6SmC0sIM/EYRl+o/3TI",
+	"FRRBtS6pwzpvMNeycrH1e+1ZEew+gIebF/1GS41ybB9ZibAdyhmt3pczJsTJLY268nNhVy7/Wgxwaxbh",
+	"fo2e0O45aoCNXgPkK3ucu6qxark9uqymdrQfSQBpcpan7PWffi3ukGTSFz/LeJ3AzEzcx+JBfRdFsVI+",
+	"nytjm9LT2Ki+3GKZFpVQ0pl8V8jHxXIbGwXVHIGk3oo8bDkIYxKAAgZ3rrnKhOgegfoVSBCypxqyiGKk",
+	"2p11Hw9GYN3CNo40nYCmKRxyocSmWeWLyglraG5SaOI/RTvy2xDUSnwfQ+qw9Do45vYZeze2dRbJxTeC",
+	"pojiFEVmpzIj9P9FkW29a31WttjjhL1A8IkCrtT5IufrqvfW7y27HERbVNSDo0PcLXxEuhbrGOP/6yKR",
+	"TpjgyePAALR7mZ4wZWK2noGLIhhgkkmOnETZSrFPlYvDEybu+bbhsmifaNGJGyuRO/4t3iHVX13Af+Ak",
+	"xon+PPVJ6+Fo1bq2cnTfJBzUmVMId8Vd7KO31kvrCuqap3Whc9Fo4OrngDav2mwcmmgj81VFxMCY8AAD",
+	"741hkXnxKQWuwJWCA3cCfFP0hckLzyJgYHiigSYm1h46oc0M1C6gG+c+43AhZK55AAarznH7KEpc1fQI",
+	"cmUFKiarXEAF9X5UOpkAHfs7qJoq7HIIgMBVruQNCIs0QyHci8UwB7AfnWjZIr+A9ok3WDeytVUUheuQ",
+	"Fs3g19kuMFOXKvoAfuqi4f3MH7cp98Sgl2mSE1kw7kO6xIniTXjMEiEwBw9fAI02xQ40tLLjIACg23f8",
+	"L1DhzHFamY3ept6EpTRpuvBsmk196XxCC5+Zp1b4yMUelFe39ZUmlcpoqbnz1Ttbgytw71hqJDH4C1Dn",
+	"ViT6AiAnYzc8SejmY4fXEmoc54NoWqGis5kTf1gqeXmxSE7qTXXEv0OD2nDj4k1yh0ZlgKG+rP+Q1KRX",
+	"kOrMPRgVx+Ixh3/0ySwwLbixaf4wd6moJuXrB78RPFturi2T1LNzOpEGxF5ugLSo6mjGCGm5M8uUDcgO",
+	"DfK6MAzzuwmEWLA1OARcrZmYWS+hlpOcVmvBGX10bVCZvztaZmeULJCb+Cmr9SOlgDTyfXLlioEnHZTA",
+	"vMWyyKRKhdfcB/reSAIOZXs4x5QlaU5CoJl/y6V60q6mB7h2rtz2+cZmce/JreYzNNF5DDfXgfabx1v6",
+	"w6Qz8BQglWnhz0J4bLNfl9tiXCiHHTfTHaj5y9McnuRtcS/UdB/AXnq1FEYbyC0Nf7ALZZjpCDh5phcX",
+	"5Il12MnmsY7ic41pbjorLh4ELE7RntCyb02tOhFPeYwespR651iu8MGy3cW8h/u7evNed9cJ0gcnHdoi",
+	"9sN4uyfKf27r0AEVq5AUQNXAK2eAEFPJDnRj/tLYh2d0GDl5m6MkaHyNLUr23J26z2VqAJ70HjypZptm",
+	"7JKqIeVscDA5ZrA3PG84mBDXR5jIVhUUJuNIZbJpHIwSGQ7ZiUxsH3U+RUQz9hs8z9yEGMKhwoUNTAcP",
+	"Q8/GBXW+/FdMuvihMhmZhxi8Y51xcDuB72NOn00Yxn6/wrjDeDoK+EUJDjyjBatfJan72efs3IK7eSwL",
+	"M64UDkpK+9RaJc/arKP4+PGwhOrB2chAL3KcpOWAuLHupJvY5RmJTrdPqYHwetjXFeY1Qa2XZKmte5U2",
+	"tcu/UXhBQ7wyEZEVvrefryhoyLG6Oal9fa+mwYP7V7OL2QUCBNAnfB/Ddz/BV6+Q+3i+ocPM9bPZI98R",
+	"c60FSRkemBK3V3COyT9F/huMUzuY3hGa/+PFRRN0PZYp9UzHlsVux7NHtRYdpzYIY00smv0xwV2+4Jz5",
+	"vqyatoGlC6uyBS6n2Zzv99t4SZPnf+pufb13qJkxVdymjanL0+SDrkLsDXxNJGAmYl+Cb45vNvmiYi/P",
+	"sS9JTZhxto3olzR6HHTmWmx+snJxf3G4OjHPCvH9mfTt0yENAmr0slVaJBGe7MeLV6fZUVsB3PP1wFN2",
+	"MW+1d9Gz/y88snXGKrcqhgMvIQG/YG/5rsmxjtDOn/QfV9H3AAF+rvwGiW0rzhWuX58O14bWmNrSHNbU",
+	"D52oRh2egTyB8scnIJO4Lup1Y/reTCwFJnVxmg5g1C8tVJ2rxlKHuNUz3uTANjtJfRpu8yo1bWCbaq0M",
+	"jm0eU6zTUl7WJGvhb8dfljN2a/Pfyt+FTdBdztJivaG0OjnN5EirTCOTqmVSgQuLJmyZ4hiePDLwYO9s",
+	"CV6iU1vlUAV4yaQ1pNfsXgJOut6GmlbIcoP/jmlUep8KBoGAZY8ljZwSu6XQim/lIBJNeyHRSoWBs48V",
+	"2FWOZVcCTTnQPtCwJTQQrg5ffABwdwIWFL1w5ekRoPoySOF8+yGJBqoAt13bowE+iQdq1Y7ENt7FePqK",
+	"jOj30s5OMSmhNiVqn7xS+OqKbLUbnUv26R32IJ+rVlPlo1atdi3yIqO4uVRD2kFfx/ciURmBh00qBRWg",
+	"2NJ0RXwFZHGJXRFSJJiivoeYfoo2FUPsVZzJHLSbg0cQBaoXAm+o0kecuaUr26ZgH2oWqVOA6bpFOdBm",
+	"F2fsM5eSOXUZ1QjOyw5xIJh+kqdsrZ13W51pakxVUQnUmLe4DqyrkI4tDlNUUVuBNZ6fkLkyvqS5flXw",
+	"tZMHdnHyQb2A++anAL10q3M5LmktbG26SCXK2mF4XoXOqzo1sirch50iqk3FA6QNiY9uYjQojvSnqyla",
+	"mLoCqI2w9Vh8e0uBr4MDv8Knl2A7oB8EbQW2EgCTfSf4HXhpRLU1qTmpBfJKRr8V+rASSBg3nJ2hb4Hv",
+	"lLZ+6svcujpPC/0eU59pIU112QeQrl4/jxs/qsZi1/tUKnrKfr5gd4/AViuO1TY/DOQxdINgW5d/7mtc",
+	"HugJDfM3qv0AHn/jLeGaMuiGT/TYE0e/V8k938aRAcOxWmfngmmd67a0VNyBzG/8V+cfUcpKDa8tZXDj",
+	"1G1OkfbrrC61Zv7c6pI/+Scr5zAEcXY7KU26s403biHn0IRjKJJD0n8jJ+OcOtmZ5+MqJTYvE7VJG6Ye",
+	"ZEBu7pbGnULSqP43QMbUCc4yeYct8Aid7nhvKl466xlJ+K3KUR2nmNBXXBzwqsJh1YGR1QMiq1QM7cKp",
+	"E381mrcKpHmDq08gadxJBNL/Zli7QBJkLeJALzS1igPudHInxLxSuMBkFrFx6nsLUdFU6iBBJ7KwSwPZ",
+	"IKbgAXz2lDSC+Ia4eBQ5RbkJs6/COSlhoWcmGFeqexvyjCeS0y0+M/b+Hvx9egcEOEFtK+HsCoX6TScd",
+	"g5q0U+PlqBlz/CRKJkUiKhRHiGiKWfFM7FUwptCgeA1fOSkweQWIbGZ33Be8RvIEfO+FjiDz4SC0W4Jr",
+	"J3t9Rv6BAd+maZXzjzw3tXwTZ1oi3Wyh5R6qzWDlpmwTNZKKb94oHQZLz5/gn54S33WRjFnew+X9tDm5",
+	"ZwB79pT0VJKuisoQnUdYPoK+Kyk2LxubT7I9nLLw8Mfve8zcACJ0f/GxPJDW97W+H+5PNImtdjlDFaDQ",
+	"qhjOZDAzg+FOSZ6X3b4dAn1junLHSx3pdmK/lEnbbHxWAk6WmkBTKvcFxb1P3hwKjhDNO8TrE63XftHS",
+	"aCwI3sjP3iHorrN3rrsoO5j7f9+/riJigG99HMbrCDM1eo+m50drfz3vl/GP3yHXz6aeMBjzzwd3yB28",
+	"Y0jgrSBrlQVXKyxiUAtLfVV2kIjUq6lHlpFP4uFSXeg1hm6uXA5+YkYyN2v6G2KomYTptyWxdnEWftUZ",
+	"uRgVFq8jy7ysoRo4EpWIwHfN+6yi5f/y5qMO44gkvNRX+zyLTxqFyCZL2PIonRVWzUDrk1ibezlq+KE8",
+	"CzWotE99llf2bMlvIN7U7eZPdN16XyT90VyKcQr3pPc6Ez/72os7ztE9t3XSF+eFqXdhc+l++7rNCj4y",
+	"lTQ3MLYxj72lcUT9bvfwEAeeMQXkS9X2/aEyMsbGwubU0OizUpWeN1rnT7LxwnU1rdJXvy5fqh4zjG6+",
+	"mN5EkA1dG30DWkqqD9qwyD0LeIqS1OwWJGQ+DJ+iyl2lzHjF7hpRzqTm7VC/x9MexC9tjDBYvug60X15",
+	"C1mQnLk3l42ZjK5s5DNR6u1aDb71ZbwCdmLredOEodeaZs3jDKP+y6iBgTzXnxL1Xycycoa0eXFIqGrX",
+	"F4qbWX2KvDL8fCmZZiUB06ynKlXraBqZRmnW3WXUSYT21p4hOEeMHAHXD3wNXucPRdyJXDXqXbqUQW8M",
+	"6/Hs96sWPeMM8L0pjKXN+RP+20N12+UyVqaMOpj8DSNeGvs7RELoqk77fIpWcIexaR/+bO1/7PBTl3BD",
+	"k+PUw+HPjVMRXBmnGsLDI75j4Ls3Nz45tdOHIXNAPhXLiB34Iz5K0y3wEfzbJ4Mm//8C2eqTO1WUsO7u",
+	"CdCvtxxQrVHIPoIKcEk3r93A00XG2tU/p+7Htj+yFaoinN+M0j0wg9q0jQjQfdP2UunyB20ONdHHoGNP",
+	"d2cbsQ4LbsPvjHUvFG4Q6bgB78E/AdZgF4Wfbr2oU/CWnfxs0tWTbV8JVKKnLpzp1ZyX+pbksbSn56rd",
+	"liqc/t3I06tTusS1X6cy81urjmKlE4ULpaLJcRRsk9Rz4p/5E/2vqnlrgcy85T7Ik53Cn6vWgI+w8vGC",
+	"lgEZP5OpGD3lN1pT6zNzfirO/3+sun7qq7j6EiLVbBd8oIZu/UsTSYsWaiY/W5SD/YGDPmtwo+/QH7PD",
+	"1rn8vEspK5jb++L0TxOeTjsP0cb9WT4X4y/V/ejY3i6718zWvZT5QyjVXZSeCyD6brnDH9R6M5nzfTy/",
+	"fzWB1f4LUNe6s/Z+AAA=",
 }
 
 // GetSwagger returns the content of the embedded swagger specification file
@@ -1,12 +1,17 @@
 package asteroid
 
 import (
+	"bufio"
 	"context"
+	"encoding/base64"
 	"encoding/json"
 	"fmt"
+	"log"
 	"net/http"
 	"slices"
+	"strings"
 	"time"
+	"unicode/utf8"
 
 	"github.com/google/uuid"
 )
@@ -142,6 +147,129 @@ func apiCreateRunHandler(w http.ResponseWriter, r *http.Request, taskId uuid.UUI
 	respondJSON(w, runID, http.StatusCreated)
 }
 
+// maxRegisterRuns bounds the number of runs created by a RegisterRuns request, as
+// they are all written in a single transaction
+const maxRegisterRuns = 10000
+
+func apiRegisterRunsHandler(w http.ResponseWriter, r *http.Request, store Store) {
+	ctx := r.Context()
+
+	var request RegisterRunsRequest
+	if err := json.NewDecoder(r.Body).Decode(&request); err != nil {
+		sendErrorResponse(w, http.StatusBadRequest, "Invalid request body", err.Error())
+		return
+	}
+
+	if request.RunCount < 1 || request.RunCount > maxRegisterRuns {
+		sendErrorResponse(w, http.StatusBadRequest, "Invalid run count", fmt.Sprintf("run_count must be between 1 and %d", maxRegisterRuns))
+		return
+	}
+
+	project, err := store.GetProjectFromName(ctx, request.ProjectName)
+	if err != nil {
+		sendErrorResponse(w, http.StatusInternalServerError, "Error getting project", err.Error())
+		return
+	}
+
+	if project == nil {
+		project = &Project{
+			Id:            uuid.New(),
+			Name:          request.ProjectName,
+			RunResultTags: request.RunResultTags,
+			CreatedAt:     time.Now(),
+		}
+
+		if err := store.CreateProject(ctx, *project); err != nil {
+			sendErrorResponse(w, http.StatusInternalServerError, "Failed to register project", err.Error())
+			return
+		}
+	}
+
+	description := ""
+	if request.TaskDescription != nil {
+		description = *request.TaskDescription
+	}
+
+	// CreateTask returns the existing task if one matches
+	taskId, err := store.CreateTask(ctx, Task{
+		ProjectId:   project.Id,
+		Name:        request.TaskName,
+		Description: &description,
+		CreatedAt:   time.Now(),
+	})
+	if err != nil {
+		sendErrorResponse(w, http.StatusInternalServerError, "Failed to create task", err.Error())
+		return
+	}
+
+	tools, chains, err := resolveRegisterRunsTools(ctx, request.Tools, store)
+	if err != nil {
+		sendErrorResponse(w, http.StatusInternalServerError, "error creating supervisors", err.Error())
+		return
+	}
+
+	runIds, toolIds, err := store.CreateRuns(ctx, *taskId, request.RunCount, tools, chains)
+	if err != nil {
+		sendErrorResponse(w, http.StatusInternalServerError, "Error creating runs", err.Error())
+		return
+	}
+
+	respondJSON(w, RegisterRunsResponse{
+		ProjectId: project.Id,
+		TaskId:    *taskId,
+		RunIds:    runIds,
+		ToolIds:   toolIds,
+	}, http.StatusCreated)
+}
+
+// resolveRegisterRunsTools creates the supervisors of the tool definitions, once per
+// distinct supervisor, and returns the tools with their chains of supervisor IDs
+func resolveRegisterRunsTools(ctx context.Context, definitions []RegisterRunsTool, store SupervisorStore) ([]Tool, [][]ChainRequest, error) {
+	supervisorIds := make(map[string]uuid.UUID)
+
+	tools := make([]Tool, 0, len(definitions))
+	chains := make([][]ChainRequest, 0, len(definitions))
+	for _, definition := range definitions {
+		tools = append(tools, Tool{
+			Name:              definition.Name,
+			Description:       definition.Description,
+			Attributes:        definition.Attributes,
+			IgnoredAttributes: definition.IgnoredAttributes,
+			Code:              definition.Code,
+		})
+
+		toolChains := make([]ChainRequest, 0)
+		if definition.Chains != nil {
+			for _, chain := range *definition.Chains {
+				ids := make([]uuid.UUID, 0, len(chain))
+				for _, supervisor := range chain {
+					// Supervisors are identified by their values, as in CreateSupervisor
+					key, err := json.Marshal([]interface{}{
+						supervisor.Code, supervisor.Name, supervisor.Description, supervisor.Type, supervisor.Attributes,
+					})
+					if err != nil {
+						return nil, nil, fmt.Errorf("error marshalling supervisor: %w", err)
+					}
+
+					id, ok := supervisorIds[string(key)]
+					if !ok {
+						id, err = store.CreateSupervisor(ctx, supervisor)
+						if err != nil {
+							return nil, nil, err
+						}
+						supervisorIds[string(key)] = id
+					}
+					ids = append(ids, id)
+				}
+				toolChains = append(toolChains, ChainRequest{SupervisorIds: &ids})
+			}
+		}
+		chains = append(chains, toolChains)
+	}
+
+	return tools, chains, nil
+}
+
 func apiGetRunHandler(w http.ResponseWriter, r *http.Request, runId uuid.UUID, store Store) {
 	ctx := r.Context()
 
@@ -714,6 +842,168 @@ func apiGetProjectHandler(w http.ResponseWriter, r *http.Request, id uuid.UUID,
 	respondJSON(w, project, http.StatusOK)
 }
 
+// exportFlushInterval is the number of export records written between flushes to the client
+const exportFlushInterval = 1000
+
+// apiExportProjectHandler streams the records of a project as NDJSON
+func apiExportProjectHandler(w http.ResponseWriter, r *http.Request, projectId uuid.UUID, params ExportProjectParams, store Store) {
+	ctx := r.Context()
+
+	project, err := store.GetProject(ctx, projectId)
+	if err != nil {
+		sendErrorResponse(w, http.StatusInternalServerError, "error getting project", err.Error())
+		return
+	}
+
+	if project == nil {
+		sendErrorResponse(w, http.StatusNotFound, "Project not found", "")
+		return
+	}
+
+	w.Header().Set("Content-Type", "application/x-ndjson")
+	w.WriteHeader(http.StatusOK)
+
+	flusher, _ := w.(http.Flusher)
+	buf := bufio.NewWriterSize(w, 64*1024)
+	enc := json.NewEncoder(buf)
+
+	count := 0
+	err = store.ExportProject(ctx, projectId, params, func(record ExportRecord) error {
+		if err := enc.Encode(record); err != nil {
+			return err
+		}
+
+		count++
+		if count%exportFlushInterval == 0 {
+			if err := buf.Flush(); err != nil {
+				return err
+			}
+			if flusher != nil {
+				flusher.Flush()
+			}
+		}
+		return nil
+	})
+	if err != nil {
+		// The status has already been sent, so abort the connection instead of ending
+		// the chunked body cleanly. Clients then see an incomplete response rather
+		// than a silently truncated export.
+		log.Printf("Error exporting project %s after %d records: %v", projectId, count, err)
+		_ = buf.Flush()
+		panic(http.ErrAbortHandler)
+	}
+
+	if err := buf.Flush(); err != nil {
+		log.Printf("Error writing export of project %s: %v", projectId, err)
+	}
+}
+
+const (
+	// minSearchQueryLength is the shortest query the trigram indexes can answer
+	minSearchQueryLength = 3
+
+	defaultSearchLimit = 50
+	maxSearchLimit     = 500
+)
+
+// apiSearchProjectHandler returns a page of the project's records that contain the query
+func apiSearchProjectHandler(w http.ResponseWriter, r *http.Request, projectId uuid.UUID, params SearchProjectParams, store Store) {
+	ctx := r.Context()
+
+	if utf8.RuneCountInString(params.Q) < minSearchQueryLength {
+		sendErrorResponse(w, http.StatusBadRequest, "Invalid query", fmt.Sprintf("q must be at least %d characters", minSearchQueryLength))
+		return
+	}
+
+	switch params.Type {
+	case SearchProjectParamsTypeToolCall, SearchProjectParamsTypeSupervision:
+	case SearchProjectParamsTypeMessage:
+		if params.Tool != nil || params.Decision != nil {
+			sendErrorResponse(w, http.StatusBadRequest, "Invalid filter", "messages can not be filtered by tool or decision")
+			return
+		}
+	default:
+		sendErrorResponse(w, http.StatusBadRequest, "Invalid type", fmt.Sprintf("unknown record type %q", params.Type))
+		return
+	}
+
+	limit := defaultSearchLimit
+	if params.Limit != nil {
+		limit = *params.Limit
+	}
+	if limit < 1 || limit > maxSearchLimit {
+		sendErrorResponse(w, http.StatusBadRequest, "Invalid limit", fmt.Sprintf("limit must be between 1 and %d", maxSearchLimit))
+		return
+	}
+
+	var after *SearchCursor
+	if params.Cursor != nil {
+		cursor, err := decodeSearchCursor(*params.Cursor)
+		if err != nil {
+			sendErrorResponse(w, http.StatusBadRequest, "Invalid cursor", err.Error())
+			return
+		}
+		after = cursor
+	}
+
+	project, err := store.GetProject(ctx, projectId)
+	if err != nil {
+		sendErrorResponse(w, http.StatusInternalServerError, "error getting project", err.Error())
+		return
+	}
+
+	if project == nil {
+		sendErrorResponse(w, http.StatusNotFound, "Project not found", "")
+		return
+	}
+
+	// Fetch one extra result to know whether there is a next page
+	results, err := store.SearchProject(ctx, projectId, params, after, limit+1)
+	if err != nil {
+		sendErrorResponse(w, http.StatusInternalServerError, "error searching project", err.Error())
+		return
+	}
+
+	response := SearchResults{Results: []SearchResult{}}
+	if len(results) > limit {
+		results = results[:limit]
+		last := results[limit-1]
+		cursor := encodeSearchCursor(SearchCursor{CreatedAt: last.CreatedAt, Id: last.Id})
+		response.NextCursor = &cursor
+	}
+	response.Results = append(response.Results, results...)
+
+	respondJSON(w, response, http.StatusOK)
+}
+
+// encodeSearchCursor returns the opaque next_cursor of a search page
+func encodeSearchCursor(cursor SearchCursor) string {
+	value := cursor.CreatedAt.UTC().Format(time.RFC3339Nano) + "_" + cursor.Id.String()
+	return base64.RawURLEncoding.EncodeToString([]byte(value))
+}
+
+func decodeSearchCursor(value string) (*SearchCursor, error) {
+	decoded, err := base64.RawURLEncoding.DecodeString(value)
+	if err != nil {
+		return nil, fmt.Errorf("error decoding cursor: %w", err)
+	}
+
+	createdAt, id, ok := strings.Cut(string(decoded), "_")
+	if !ok {
+		return nil, fmt.Errorf("malformed cursor")
+	}
+
+	cursor := SearchCursor{}
+	if cursor.CreatedAt, err = time.Parse(time.RFC3339Nano, createdAt); err != nil {
+		return nil, fmt.Errorf("error parsing cursor time: %w", err)
+	}
+	if cursor.Id, err = uuid.Parse(id); err != nil {
+		return nil, fmt.Errorf("error parsing cursor id: %w", err)
+	}
+
+	return &cursor, nil
+}
+
 func apiGetSupervisionReviewPayloadHandler(w http.ResponseWriter, r *http.Request, supervisionRequestId uuid.UUID, store Store) {
 	ctx := r.Context()
 
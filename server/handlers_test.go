@@ -0,0 +1,40 @@
+package asteroid
+
+import (
+	"bytes"
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+)
+
+func TestRegisterRunsRunCount(t *testing.T) {
+	for _, runCount := range []int{-1, 0, maxRegisterRuns + 1} {
+		body, err := json.Marshal(RegisterRunsRequest{
+			ProjectName: "project",
+			TaskName:    "task",
+			RunCount:    runCount,
+			Tools:       []RegisterRunsTool{},
+		})
+		if err != nil {
+			t.Fatalf("error marshalling request: %v", err)
+		}
+
+		// The run count is validated before the store is used
+		r := httptest.NewRequest(http.MethodPost, "/api/v1/register_runs", bytes.NewReader(body))
+		w := httptest.NewRecorder()
+		apiRegisterRunsHandler(w, r, nil)
+
+		if w.Code != http.StatusBadRequest {
+			t.Fatalf("run_count %d: expected status %d, got %d: %s", runCount, http.StatusBadRequest, w.Code, w.Body.String())
+		}
+
+		var response ErrorResponse
+		if err := json.NewDecoder(w.Body).Decode(&response); err != nil {
+			t.Fatalf("run_count %d: error decoding response: %v", runCount, err)
+		}
+		if response.Error != "Invalid run count" {
+			t.Errorf("run_count %d: expected error %q, got %q", runCount, "Invalid run count", response.Error)
+		}
+	}
+}
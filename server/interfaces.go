@@ -2,6 +2,7 @@ package asteroid
 
 import (
 	"context"
+	"time"
 
 	"github.com/google/uuid"
 )
@@ -16,6 +17,8 @@ type Store interface {
 	SupervisionStore
 	TaskStore
 	ChatStore
+	ExportStore
+	SearchStore
 }
 
 type SupervisionStore interface {
@@ -90,6 +93,10 @@ type SupervisorStore interface {
 
 type RunStore interface {
 	CreateRun(ctx context.Context, run Run) (uuid.UUID, error)
+	// CreateRuns creates count runs of a task in one transaction, each with a copy of tools
+	// and, for tools[i], the supervisor chains in chains[i]. It returns the run IDs and, for
+	// each run, the IDs of its tools in the order of tools.
+	CreateRuns(ctx context.Context, taskId uuid.UUID, count int, tools []Tool, chains [][]ChainRequest) ([]uuid.UUID, [][]uuid.UUID, error)
 	GetRun(ctx context.Context, id uuid.UUID) (*Run, error)
 	GetRuns(ctx context.Context, taskId uuid.UUID) ([]Run, error)
 	GetTaskRuns(ctx context.Context, taskId uuid.UUID) ([]Run, error)
@@ -113,3 +120,24 @@ type ChatStore interface {
 	UpdateMessage(ctx context.Context, id uuid.UUID, message AsteroidMessage) error
 	GetRunChatCount(ctx context.Context, runId uuid.UUID) (int, error)
 }
+
+type ExportStore interface {
+	// ExportProject calls emit for every record of the project's runs that match params, in
+	// the order runs, chats, tool calls, supervisions. Records are streamed from the store
+	// and never held in memory all at once.
+	ExportProject(ctx context.Context, projectId uuid.UUID, params ExportProjectParams, emit func(ExportRecord) error) error
+}
+
+// SearchCursor is the position of the last result of a search page. Results are
+// ordered newest first, by created_at and then by ID.
+type SearchCursor struct {
+	CreatedAt time.Time
+	Id        uuid.UUID
+}
+
+type SearchStore interface {
+	// SearchProject returns up to limit records of type params.Type in the project whose
+	// searched text contains params.Q, case insensitively, that match the other filters of
+	// params. Results are ordered newest first and start after the cursor when it is set.
+	SearchProject(ctx context.Context, projectId uuid.UUID, params SearchProjectParams, after *SearchCursor, limit int) ([]SearchResult, error)
+}
@@ -0,0 +1,130 @@
+package asteroid
+
+import (
+	"encoding/base64"
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+	"time"
+
+	"github.com/google/uuid"
+)
+
+func TestSearchCursorRoundTrip(t *testing.T) {
+	// Results tied on created_at are told apart by their ID
+	createdAt := time.Date(2024, 11, 5, 13, 4, 5, 123456789, time.FixedZone("CET", 3600))
+	for _, id := range []uuid.UUID{uuid.New(), uuid.New(), uuid.Nil} {
+		encoded := encodeSearchCursor(SearchCursor{CreatedAt: createdAt, Id: id})
+
+		decoded, err := decodeSearchCursor(encoded)
+		if err != nil {
+			t.Fatalf("error decoding cursor %q: %v", encoded, err)
+		}
+		if !decoded.CreatedAt.Equal(createdAt) {
+			t.Errorf("expected created_at %v, got %v", createdAt, decoded.CreatedAt)
+		}
+		if decoded.Id != id {
+			t.Errorf("expected id %s, got %s", id, decoded.Id)
+		}
+	}
+}
+
+func TestDecodeSearchCursorErrors(t *testing.T) {
+	encode := func(value string) string {
+		return base64.RawURLEncoding.EncodeToString([]byte(value))
+	}
+
+	tests := []struct {
+		name   string
+		cursor string
+	}{
+		{"not base64", "not a cursor!"},
+		{"no separator", encode("2024-11-05T12:04:05Z")},
+		{"bad time", encode("yesterday_" + uuid.NewString())},
+		{"bad id", encode("2024-11-05T12:04:05Z_not-a-uuid")},
+		{"empty", ""},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if _, err := decodeSearchCursor(tt.cursor); err == nil {
+				t.Errorf("expected an error decoding %q", tt.cursor)
+			}
+		})
+	}
+}
+
+func TestSearchProjectBadRequests(t *testing.T) {
+	ptr := func(value string) *string { return &value }
+	limit := func(value int) *int { return &value }
+	reject := Reject
+
+	tests := []struct {
+		name   string
+		params SearchProjectParams
+		error  string
+	}{
+		{
+			name:   "short query",
+			params: SearchProjectParams{Q: "ab", Type: SearchProjectParamsTypeToolCall},
+			error:  "Invalid query",
+		},
+		{
+			name:   "unknown type",
+			params: SearchProjectParams{Q: "sudo", Type: "chat"},
+			error:  "Invalid type",
+		},
+		{
+			name:   "message by tool",
+			params: SearchProjectParams{Q: "sudo", Type: SearchProjectParamsTypeMessage, Tool: ptr("bash")},
+			error:  "Invalid filter",
+		},
+		{
+			name:   "message by decision",
+			params: SearchProjectParams{Q: "sudo", Type: SearchProjectParamsTypeMessage, Decision: &reject},
+			error:  "Invalid filter",
+		},
+		{
+			name:   "zero limit",
+			params: SearchProjectParams{Q: "sudo", Type: SearchProjectParamsTypeToolCall, Limit: limit(0)},
+			error:  "Invalid limit",
+		},
+		{
+			name:   "limit too large",
+			params: SearchProjectParams{Q: "sudo", Type: SearchProjectParamsTypeToolCall, Limit: limit(maxSearchLimit + 1)},
+			error:  "Invalid limit",
+		},
+		{
+			name:   "bad cursor",
+			params: SearchProjectParams{Q: "sudo", Type: SearchProjectParamsTypeToolCall, Cursor: ptr("not a cursor!")},
+			error:  "Invalid cursor",
+		},
+		{
+			name:   "bad cursor id",
+			params: SearchProjectParams{Q: "sudo", Type: SearchProjectParamsTypeSupervision, Cursor: ptr(base64.RawURLEncoding.EncodeToString([]byte("2024-11-05T12:04:05Z_1")))},
+			error:  "Invalid cursor",
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			// Parameters are validated before the store is used
+			r := httptest.NewRequest(http.MethodGet, "/api/v1/project/"+uuid.NewString()+"/search", nil)
+			w := httptest.NewRecorder()
+			apiSearchProjectHandler(w, r, uuid.New(), tt.params, nil)
+
+			if w.Code != http.StatusBadRequest {
+				t.Fatalf("expected status %d, got %d: %s", http.StatusBadRequest, w.Code, w.Body.String())
+			}
+
+			var response ErrorResponse
+			if err := json.NewDecoder(w.Body).Decode(&response); err != nil {
+				t.Fatalf("error decoding response: %v", err)
+			}
+			if response.Error != tt.error {
+				t.Errorf("expected error %q, got %q", tt.error, response.Error)
+			}
+		})
+	}
+}